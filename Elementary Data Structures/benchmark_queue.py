@@ -0,0 +1,64 @@
+"""
+Benchmarks the ring buffer Queue against the list Queue.
+
+Each queue is filled with a backlog of n items and then drained, and the time
+per item is reported. The list Queue dequeues with list.pop(0), so its time per
+item grows with the backlog while the ring buffer's stays flat. The last column
+moves the same items through the ring buffer with enqueue_many and
+dequeue_many, in batches of 1000.
+
+Usage: python benchmark_queue.py [largest backlog]
+"""
+
+import sys
+import time
+import queue_list
+import queue_ring_buffer
+
+def benchmark(queue, num_items):
+    """
+    Enqueues num_items items and then dequeues all of them.
+    @param queue: The empty queue to benchmark.
+    @param num_items: The size of the backlog.
+    @return: The time per item in microseconds.
+    """
+    start = time.perf_counter()
+    for item in range(num_items):
+        queue.enqueue(item)
+    while not queue.is_empty():
+        queue.dequeue()
+    elapsed = time.perf_counter() - start
+    return elapsed / num_items * 1000000
+
+def benchmark_batches(queue, num_items, batch_size=1000):
+    """
+    Enqueues num_items items and then dequeues all of them, in batches.
+    @param queue: The empty queue to benchmark.
+    @param num_items: The size of the backlog.
+    @param batch_size: The number of items moved by each batch operation.
+    @return: The time per item in microseconds.
+    """
+    start = time.perf_counter()
+    for first in range(0, num_items, batch_size):
+        queue.enqueue_many(range(first, min(first + batch_size, num_items)))
+    while not queue.is_empty():
+        queue.dequeue_many(min(batch_size, len(queue)))
+    elapsed = time.perf_counter() - start
+    return elapsed / num_items * 1000000
+
+def main():
+    """Prints the time per item of both queues for growing backlogs."""
+    max_items = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print(f"{'backlog':>8} {'list':>12} {'ring buffer':>14} {'speedup':>8} "
+    f"{'batched':>12}")
+    num_items = 1000
+    while num_items <= max_items:
+        list_time = benchmark(queue_list.Queue(), num_items)
+        ring_time = benchmark(queue_ring_buffer.Queue(), num_items)
+        batch_time = benchmark_batches(queue_ring_buffer.Queue(), num_items)
+        print(f"{num_items:>8} {list_time:>9.3f} us {ring_time:>11.3f} us "
+        f"{list_time / ring_time:>7.2f}x {batch_time:>9.3f} us")
+        num_items *= 4
+
+if __name__ == "__main__":
+    main()
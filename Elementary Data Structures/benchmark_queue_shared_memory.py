@@ -0,0 +1,64 @@
+"""
+Benchmarks the SharedMemoryQueue against multiprocessing.Queue.
+
+A child process sends n items of 64 bytes to the parent through each queue, and
+the number of items per second is reported.
+
+Usage: python benchmark_queue_shared_memory.py [number of items]
+"""
+
+import sys
+import time
+from multiprocessing import Process, Queue
+from queue_shared_memory import SharedMemoryQueue
+
+ITEM = bytes(64)
+
+def produce(queue, num_items):
+    """
+    Enqueues num_items items.
+    @param queue: A SharedMemoryQueue or a multiprocessing.Queue.
+    @param num_items: The number of items to send.
+    """
+    if isinstance(queue, SharedMemoryQueue):
+        for _ in range(num_items):
+            queue.enqueue(ITEM)
+        queue.close()
+    else:
+        for _ in range(num_items):
+            queue.put(ITEM)
+
+def benchmark(queue, receive, num_items):
+    """
+    Receives num_items items sent by a child process.
+    @param queue: The queue to send the items through.
+    @param receive: The function receiving one item from the queue.
+    @param num_items: The number of items to send.
+    @return: The number of items per second.
+    """
+    producer = Process(target=produce, args=(queue, num_items))
+    start = time.perf_counter()
+    producer.start()
+    for _ in range(num_items):
+        receive()
+    elapsed = time.perf_counter() - start
+    producer.join()
+    return num_items / elapsed
+
+def main():
+    """Prints the throughput of both queues."""
+    num_items = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    pipe_queue = Queue()
+    pipe_rate = benchmark(pipe_queue, pipe_queue.get, num_items)
+    shared_queue = SharedMemoryQueue(capacity=1 << 20)
+    try:
+        shared_rate = benchmark(shared_queue, shared_queue.dequeue, num_items)
+    finally:
+        shared_queue.close()
+        shared_queue.unlink()
+    print(f"multiprocessing.Queue: {pipe_rate:>10.0f} items/s")
+    print(f"SharedMemoryQueue:     {shared_rate:>10.0f} items/s "
+    f"({shared_rate / pipe_rate:.2f}x)")
+
+if __name__ == "__main__":
+    main()
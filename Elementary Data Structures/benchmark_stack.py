@@ -0,0 +1,58 @@
+"""
+Benchmarks the typed array Stack against the list Stack.
+
+Pushes n ints onto each stack, then pops all of them, and reports the memory
+used per item and the time per item.
+
+Usage: python benchmark_stack.py [number of items]
+"""
+
+import sys
+import time
+import tracemalloc
+import stack_array
+import stack_list
+
+def push_all(stack, num_items):
+    """
+    Pushes num_items large ints onto the stack.
+    @param stack: The stack to push onto.
+    @param num_items: The number of items to push.
+    """
+    # Ints of 2^30 and above are never cached, so each one is a new object.
+    for item in range(1 << 30, (1 << 30) + num_items):
+        stack.push(item)
+
+def benchmark(make_stack, num_items):
+    """
+    Pushes num_items ints onto a stack and then pops all of them.
+    @param make_stack: The function creating an empty stack.
+    @param num_items: The number of items to push.
+    @return: A tuple (bytes per item, microseconds per item).
+    """
+    stack = make_stack()
+    start = time.perf_counter()
+    push_all(stack, num_items)
+    while not stack.is_empty():
+        stack.pop()
+    elapsed = time.perf_counter() - start
+
+    # Measured separately, tracing allocations slows everything down.
+    tracemalloc.start()
+    stack = make_stack()
+    push_all(stack, num_items)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return memory / num_items, elapsed / num_items * 1000000
+
+def main():
+    """Prints the memory and time per item of both stacks."""
+    num_items = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print(f"{'stack':>12} {'memory':>14} {'time':>12}")
+    for name, make_stack in (("list", stack_list.Stack),
+    ("array q", lambda: stack_array.Stack("q"))):
+        memory, elapsed = benchmark(make_stack, num_items)
+        print(f"{name:>12} {memory:>8.1f} B/item {elapsed:>7.3f} us")
+
+if __name__ == "__main__":
+    main()
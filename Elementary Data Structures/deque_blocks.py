@@ -0,0 +1,290 @@
+"""
+Deque ADT Operations:
+1. push_front(item): Add an item to the front of the deque.
+2. push_back(item): Add an item to the back of the deque.
+3. pop_front(): Remove the front item of the deque.
+4. pop_back(): Remove the back item of the deque.
+5. front(), back(): Return the front or back item of the deque.
+6. is_empty(): Return true if and only if the deque is empty.
+"""
+
+"""
+Block Deque Operations:
+1. deque[i], deque[i] = item: Read or replace the item at index i.
+2. rotate(n): Move the last n items to the front (the first -n items to the
+back when n is negative).
+3. len(deque), iter(deque): The number of items, and the items front to back.
+"""
+
+"""
+Time Complexity:
+- push_front(item), push_back(item): O(1)
+- pop_front(), pop_back(): O(1)
+- front(), back(): O(1)
+- is_empty(): O(1)
+- deque[i]: O(n / block_size)
+- rotate(n): O(min(n, len - n))
+"""
+
+# The most freed blocks kept for reuse.
+POOL_SIZE = 16
+
+class Block():
+    """A fixed size array of items, linked to the blocks on both sides."""
+
+    def __init__(self, block_size):
+        """
+        Creates an empty block.
+        @param block_size: The number of items the block holds.
+        """
+        self.data = block_size * [None]
+        self.prev = None
+        self.next = None
+
+class Deque():
+    """
+    Implementation of the deque ADT using a doubly linked list of fixed size
+    blocks, as CPython's collections.deque does.
+    """
+
+    def __init__(self, maxlen=None, block_size=64):
+        """
+        Create an empty deque.
+        @param maxlen: The maximum number of items. Once the deque is full,
+        pushing to one end drops the item at the other end. None for no limit.
+        @param block_size: The number of items per block, at least 2.
+        """
+        if maxlen != None and maxlen < 0:
+            raise Exception("Error: maxlen must not be negative.")
+        if block_size < 2:
+            raise Exception("Error: block_size must be at least 2.")
+        self.maxlen = maxlen
+        self.block_size = block_size
+        self.free_blocks = []
+        self.left_block = self.right_block = Block(block_size)
+        self.num_items = 0
+        self.recenter()
+
+    def recenter(self):
+        """
+        Moves the empty deque's position to the middle of its block, so it can
+        grow in either direction before needing another block.
+        """
+        center = (self.block_size - 1) // 2
+        self.left_index = center + 1
+        self.right_index = center
+
+    def new_block(self):
+        """
+        Gets an empty block, from the pool if one is free.
+        @return: The block.
+        """
+        if len(self.free_blocks) > 0:
+            return self.free_blocks.pop()
+        return Block(self.block_size)
+
+    def free_block(self, block):
+        """
+        Returns a block that no longer holds any item to the pool.
+        @param block: The block. Every slot must already be None.
+        """
+        if len(self.free_blocks) < POOL_SIZE:
+            block.prev = block.next = None
+            self.free_blocks.append(block)
+
+    def is_empty(self):
+        """
+        Checks to see if the deque is empty.
+        @return: True if the deque is empty, false otherwise.
+        """
+        return self.num_items == 0
+
+    def push_back(self, item):
+        """
+        Adds an item to the back of the deque. If the deque is full, the front
+        item is dropped.
+        @param item: The item to add.
+        """
+        if self.maxlen == 0:
+            return
+        if self.right_index == self.block_size - 1:
+            block = self.new_block()
+            block.prev = self.right_block
+            self.right_block.next = block
+            self.right_block = block
+            self.right_index = -1
+        self.right_index += 1
+        self.right_block.data[self.right_index] = item
+        self.num_items += 1
+        if self.maxlen != None and self.num_items > self.maxlen:
+            self.pop_front()
+
+    def push_front(self, item):
+        """
+        Adds an item to the front of the deque. If the deque is full, the back
+        item is dropped.
+        @param item: The item to add.
+        """
+        if self.maxlen == 0:
+            return
+        if self.left_index == 0:
+            block = self.new_block()
+            block.next = self.left_block
+            self.left_block.prev = block
+            self.left_block = block
+            self.left_index = self.block_size
+        self.left_index -= 1
+        self.left_block.data[self.left_index] = item
+        self.num_items += 1
+        if self.maxlen != None and self.num_items > self.maxlen:
+            self.pop_back()
+
+    def pop_back(self):
+        """
+        Removes the back item of the deque.
+        @return: The item removed.
+        """
+        if self.num_items == 0:
+            raise Exception("Error: Cannot pop from an empty deque.")
+        item = self.right_block.data[self.right_index]
+        self.right_block.data[self.right_index] = None
+        self.right_index -= 1
+        self.num_items -= 1
+        if self.num_items == 0:
+            self.recenter()
+        elif self.right_index < 0:
+            block = self.right_block
+            self.right_block = block.prev
+            self.right_block.next = None
+            self.right_index = self.block_size - 1
+            self.free_block(block)
+        return item
+
+    def pop_front(self):
+        """
+        Removes the front item of the deque.
+        @return: The item removed.
+        """
+        if self.num_items == 0:
+            raise Exception("Error: Cannot pop from an empty deque.")
+        item = self.left_block.data[self.left_index]
+        self.left_block.data[self.left_index] = None
+        self.left_index += 1
+        self.num_items -= 1
+        if self.num_items == 0:
+            self.recenter()
+        elif self.left_index == self.block_size:
+            block = self.left_block
+            self.left_block = block.next
+            self.left_block.prev = None
+            self.left_index = 0
+            self.free_block(block)
+        return item
+
+    def front(self):
+        """
+        Peeks at the front item of the deque without removing it.
+        @return: The front item.
+        """
+        if self.num_items == 0:
+            raise Exception("Error: Deque is empty.")
+        return self.left_block.data[self.left_index]
+
+    def back(self):
+        """
+        Peeks at the back item of the deque without removing it.
+        @return: The back item.
+        """
+        if self.num_items == 0:
+            raise Exception("Error: Deque is empty.")
+        return self.right_block.data[self.right_index]
+
+    def locate(self, index):
+        """
+        Finds the block and slot holding the item at an index, walking the
+        blocks from the nearer end.
+        @param index: The index of the item, negative to count from the back.
+        @return: A tuple (block, slot).
+        """
+        if index < 0:
+            index += self.num_items
+        if not 0 <= index < self.num_items:
+            raise IndexError("Error: Deque index out of range.")
+
+        if index < self.num_items // 2:
+            position = self.left_index + index
+            block = self.left_block
+            while position >= self.block_size:
+                block = block.next
+                position -= self.block_size
+        else:
+            # Count back from the slot after the back item.
+            position = self.right_index + 1 - (self.num_items - index)
+            block = self.right_block
+            while position < 0:
+                block = block.prev
+                position += self.block_size
+        return block, position
+
+    def __getitem__(self, index):
+        """Returns deque[index]."""
+        block, position = self.locate(index)
+        return block.data[position]
+
+    def __setitem__(self, index, item):
+        """Sets deque[index] = item."""
+        block, position = self.locate(index)
+        block.data[position] = item
+
+    def rotate(self, n=1):
+        """
+        Rotates the deque n steps to the right: the last n items move to the
+        front. A negative n rotates to the left.
+        @param n: The number of steps.
+        """
+        if self.num_items <= 1:
+            return
+        # Rotating by n or by n - len gives the same deque, move the fewest.
+        n %= self.num_items
+        if n > self.num_items // 2:
+            n -= self.num_items
+        for _ in range(n):
+            self.push_front(self.pop_back())
+        for _ in range(-n):
+            self.push_back(self.pop_front())
+
+    def __len__(self):
+        """Returns len(deque)."""
+        return self.num_items
+
+    def __iter__(self):
+        """Iterates over the items, front to back."""
+        block = self.left_block
+        position = self.left_index
+        for _ in range(self.num_items):
+            if position == self.block_size:
+                block = block.next
+                position = 0
+            yield block.data[position]
+            position += 1
+
+"""
+Notes:
+- Uses both FIFO (push_back, pop_front) and LIFO (push_back, pop_back) ordering.
+- A list is O(1) at its end but O(n) at its front, since every item shifts. A
+ring buffer (queue_ring_buffer.py) is O(1) at both ends but copies every item
+when it grows.
+- Here the items live in fixed size blocks linked in both directions. Each end
+fills its own block and links a new block when it runs out, so no item ever
+moves and no operation touches more than one block.
+- A linked list of single items would also be O(1) at both ends, but allocates
+a node and two pointers per item. Blocks amortize that over block_size items,
+and items stored next to each other are faster to walk.
+- A block whose last item is popped is kept in a small pool (POOL_SIZE blocks)
+and reused by the next push that needs a block. A deque going back and forth
+across a block boundary, as a sliding window does, then allocates nothing.
+- Indexing skips whole blocks, starting from the nearer end, so it takes
+O(n / block_size) rather than O(n).
+- With a maxlen, pushing to a full deque drops an item from the other end, which
+keeps the last maxlen items seen (a sliding window).
+"""
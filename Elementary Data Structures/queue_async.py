@@ -0,0 +1,225 @@
+"""
+Queue and stack for handing work between asyncio coroutines.
+
+Async Queue Operations:
+1. await enqueue(item, timeout): Add an item to the end of the queue, waiting
+for room if the queue is full.
+2. await dequeue(timeout): Remove the first item in the queue, waiting for one
+if the queue is empty.
+3. front(): Return the front item in the queue.
+4. is_empty(), is_full(), len(queue): Check how many items the queue holds.
+
+Async Stack Operations:
+1. await push(item, timeout): Add an item to the top of the stack, waiting for
+room if the stack is full.
+2. await pop(timeout): Remove the top item from the stack, waiting for one if
+the stack is empty.
+3. top(): Return the top of the stack.
+4. is_empty(), is_full(), len(stack): Check how many items the stack holds.
+"""
+
+"""
+Time Complexity (excluding the time spent waiting):
+- enqueue(item), push(item): O(1) amortized
+- dequeue(), pop(): O(1)
+- front(), top(): O(1)
+- is_empty(), is_full(): O(1)
+"""
+
+import asyncio
+from queue_ring_buffer import Queue
+from stack_list import Stack
+
+class AsyncContainer():
+    """
+    Wraps a queue or stack with two asyncio conditions, so producing coroutines
+    wait while it is full and consuming coroutines wait while it is empty.
+    """
+
+    def __init__(self, storage, add, take, peek, max_capacity):
+        """
+        Wraps an empty queue or stack.
+        @param storage: The queue or stack holding the items.
+        @param add: The method of storage adding an item.
+        @param take: The method of storage removing an item.
+        @param peek: The method of storage returning the next item to take.
+        @param max_capacity: The maximum number of items held, None for no
+        limit.
+        """
+        if max_capacity != None and max_capacity < 1:
+            raise Exception("Error: max_capacity must be at least 1.")
+        self.storage = storage
+        self.add = add
+        self.take = take
+        self.peek = peek
+        self.max_capacity = max_capacity
+        self.lock = asyncio.Lock()
+        self.not_empty = asyncio.Condition(self.lock)
+        self.not_full = asyncio.Condition(self.lock)
+
+    async def put(self, item, timeout=None):
+        """
+        Adds an item, waiting for room while the container is full.
+        @param item: The item to add.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        """
+        async with self.not_full:
+            await self.wait(self.not_full, self.has_room, timeout,
+            "Error: Timed out waiting for room.")
+            self.add(item)
+            self.not_empty.notify()
+
+    async def get(self, timeout=None):
+        """
+        Removes an item, waiting for one while the container is empty.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        @return: The item removed.
+        """
+        async with self.not_empty:
+            await self.wait(self.not_empty, self.has_items, timeout,
+            "Error: Timed out waiting for an item.")
+            item = self.take()
+            self.not_full.notify()
+            return item
+
+    async def wait(self, condition, predicate, timeout, message):
+        """
+        Waits on a condition until predicate is true. The condition's lock must
+        be held.
+        @param condition: The condition to wait on.
+        @param predicate: The function checking what is waited for.
+        @param timeout: The maximum number of seconds to wait, None for no
+        limit.
+        @param message: The message of the TimeoutError raised on timeout.
+        """
+        # Checking first never suspends the coroutine when there is no need to.
+        if predicate():
+            return
+        try:
+            await asyncio.wait_for(condition.wait_for(predicate), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(message) from None
+
+    def has_items(self):
+        """
+        Checks to see if the container holds any item.
+        @return: True if there is an item to remove, false otherwise.
+        """
+        return len(self.storage) > 0
+
+    def has_room(self):
+        """
+        Checks to see if the container has room for an item.
+        @return: True if an item can be added, false otherwise.
+        """
+        return self.max_capacity == None or \
+        len(self.storage) < self.max_capacity
+
+    def is_empty(self):
+        """
+        Checks to see if the container is empty.
+        @return: True if the container is empty, false otherwise.
+        """
+        return len(self.storage) == 0
+
+    def is_full(self):
+        """
+        Checks to see if the container holds max_capacity items.
+        @return: True if the container is full, false otherwise.
+        """
+        return len(self.storage) == self.max_capacity
+
+    def __len__(self):
+        """Returns the number of items held."""
+        return len(self.storage)
+
+class AsyncQueue(AsyncContainer):
+    """Asyncio queue stored in a ring buffer Queue."""
+
+    def __init__(self, max_capacity=None):
+        """
+        Create an empty queue.
+        @param max_capacity: The maximum number of items the queue holds, None
+        for no limit.
+        """
+        queue = Queue()
+        super().__init__(queue, queue.enqueue, queue.dequeue, queue.front,
+        max_capacity)
+
+    async def enqueue(self, item, timeout=None):
+        """
+        Adds an item to the end of the queue, waiting while the queue is full.
+        @param item: The item to add to the end of the queue.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        """
+        await self.put(item, timeout)
+
+    async def dequeue(self, timeout=None):
+        """
+        Removes the front item from the queue, waiting while the queue is
+        empty.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        @return: The element dequeued from the queue.
+        """
+        return await self.get(timeout)
+
+    def front(self):
+        """
+        Peeks at the front item in the queue without removing it.
+        @return: The element at the front of the queue.
+        """
+        return self.peek()
+
+class AsyncStack(AsyncContainer):
+    """Asyncio stack stored in a list Stack."""
+
+    def __init__(self, max_capacity=None):
+        """
+        Create an empty stack.
+        @param max_capacity: The maximum number of items the stack holds, None
+        for no limit.
+        """
+        stack = Stack()
+        super().__init__(stack, stack.push, stack.pop, stack.top, max_capacity)
+
+    async def push(self, item, timeout=None):
+        """
+        Adds an item to the top of the stack, waiting while the stack is full.
+        @param item: The item to add to the top of the stack.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        """
+        await self.put(item, timeout)
+
+    async def pop(self, timeout=None):
+        """
+        Removes the top item from the stack, waiting while the stack is empty.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        @return: The element popped from the stack.
+        """
+        return await self.get(timeout)
+
+    def top(self):
+        """
+        Peeks at the top item of the stack without popping it.
+        @return: The element on top of the stack.
+        """
+        return self.peek()
+
+"""
+Notes:
+- The asyncio versions of queue_blocking.py. A coroutine waiting for an item or
+for room suspends on an asyncio condition, so the event loop keeps running
+other coroutines instead of blocking the thread.
+- Bounding the capacity gives back-pressure: a producing coroutine is suspended
+until the consumers catch up.
+- They belong to the event loop they are first used on and are not thread-safe.
+Use queue_blocking.py between threads.
+- A wait that times out raises TimeoutError. An operation that does not need to
+wait completes without suspending the coroutine.
+"""
@@ -0,0 +1,219 @@
+"""
+Thread-safe queue and stack for handing work between threads.
+
+Blocking Queue Operations:
+1. enqueue(item, timeout): Add an item to the end of the queue, waiting for
+room if the queue is full.
+2. dequeue(timeout): Remove the first item in the queue, waiting for one if the
+queue is empty.
+3. front(): Return the front item in the queue.
+4. is_empty(), is_full(), len(queue): Check how many items the queue holds.
+
+Blocking Stack Operations:
+1. push(item, timeout): Add an item to the top of the stack, waiting for room
+if the stack is full.
+2. pop(timeout): Remove the top item from the stack, waiting for one if the
+stack is empty.
+3. top(): Return the top of the stack.
+4. is_empty(), is_full(), len(stack): Check how many items the stack holds.
+"""
+
+"""
+Time Complexity (excluding the time spent waiting):
+- enqueue(item), push(item): O(1) amortized
+- dequeue(), pop(): O(1)
+- front(), top(): O(1)
+- is_empty(), is_full(): O(1)
+"""
+
+from threading import Condition, Lock
+from queue_ring_buffer import Queue
+from stack_list import Stack
+
+class BlockingContainer():
+    """
+    Guards a queue or stack with one lock and two conditions, so producers wait
+    while it is full and consumers wait while it is empty.
+    """
+
+    def __init__(self, storage, add, take, peek, max_capacity):
+        """
+        Wraps an empty queue or stack.
+        @param storage: The queue or stack holding the items.
+        @param add: The method of storage adding an item.
+        @param take: The method of storage removing an item.
+        @param peek: The method of storage returning the next item to take.
+        @param max_capacity: The maximum number of items held, None for no
+        limit.
+        """
+        if max_capacity != None and max_capacity < 1:
+            raise Exception("Error: max_capacity must be at least 1.")
+        self.storage = storage
+        self.add = add
+        self.take = take
+        self.peek = peek
+        self.max_capacity = max_capacity
+        self.lock = Lock()
+        self.not_empty = Condition(self.lock)
+        self.not_full = Condition(self.lock)
+
+    def put(self, item, timeout=None):
+        """
+        Adds an item, waiting for room while the container is full.
+        @param item: The item to add.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        """
+        with self.not_full:
+            if not self.not_full.wait_for(self.has_room, timeout):
+                raise TimeoutError("Error: Timed out waiting for room.")
+            self.add(item)
+            self.not_empty.notify()
+
+    def get(self, timeout=None):
+        """
+        Removes an item, waiting for one while the container is empty.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        @return: The item removed.
+        """
+        with self.not_empty:
+            if not self.not_empty.wait_for(self.has_items, timeout):
+                raise TimeoutError("Error: Timed out waiting for an item.")
+            item = self.take()
+            self.not_full.notify()
+            return item
+
+    def peek_item(self):
+        """
+        Returns the next item to be removed without removing it.
+        @return: The next item.
+        """
+        with self.lock:
+            return self.peek()
+
+    def has_items(self):
+        """
+        Checks to see if the container holds any item. The lock must be held.
+        @return: True if there is an item to remove, false otherwise.
+        """
+        return len(self.storage) > 0
+
+    def has_room(self):
+        """
+        Checks to see if the container has room for an item. The lock must be
+        held.
+        @return: True if an item can be added, false otherwise.
+        """
+        return self.max_capacity == None or \
+        len(self.storage) < self.max_capacity
+
+    def is_empty(self):
+        """
+        Checks to see if the container is empty.
+        @return: True if the container is empty, false otherwise.
+        """
+        return len(self.storage) == 0
+
+    def is_full(self):
+        """
+        Checks to see if the container holds max_capacity items.
+        @return: True if the container is full, false otherwise.
+        """
+        return len(self.storage) == self.max_capacity
+
+    def __len__(self):
+        """Returns the number of items held."""
+        return len(self.storage)
+
+class BlockingQueue(BlockingContainer):
+    """Thread-safe queue stored in a ring buffer Queue."""
+
+    def __init__(self, max_capacity=None):
+        """
+        Create an empty queue.
+        @param max_capacity: The maximum number of items the queue holds, None
+        for no limit.
+        """
+        queue = Queue()
+        super().__init__(queue, queue.enqueue, queue.dequeue, queue.front,
+        max_capacity)
+
+    def enqueue(self, item, timeout=None):
+        """
+        Adds an item to the end of the queue, waiting while the queue is full.
+        @param item: The item to add to the end of the queue.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        """
+        self.put(item, timeout)
+
+    def dequeue(self, timeout=None):
+        """
+        Removes the front item from the queue, waiting while the queue is
+        empty.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        @return: The element dequeued from the queue.
+        """
+        return self.get(timeout)
+
+    def front(self):
+        """
+        Peeks at the front item in the queue without removing it.
+        @return: The element at the front of the queue.
+        """
+        return self.peek_item()
+
+class BlockingStack(BlockingContainer):
+    """Thread-safe stack stored in a list Stack."""
+
+    def __init__(self, max_capacity=None):
+        """
+        Create an empty stack.
+        @param max_capacity: The maximum number of items the stack holds, None
+        for no limit.
+        """
+        stack = Stack()
+        super().__init__(stack, stack.push, stack.pop, stack.top, max_capacity)
+
+    def push(self, item, timeout=None):
+        """
+        Adds an item to the top of the stack, waiting while the stack is full.
+        @param item: The item to add to the top of the stack.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        """
+        self.put(item, timeout)
+
+    def pop(self, timeout=None):
+        """
+        Removes the top item from the stack, waiting while the stack is empty.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        @return: The element popped from the stack.
+        """
+        return self.get(timeout)
+
+    def top(self):
+        """
+        Peeks at the top item of the stack without popping it.
+        @return: The element on top of the stack.
+        """
+        return self.peek_item()
+
+"""
+Notes:
+- The plain Queue and Stack raise an exception when they are empty, so a
+consumer waiting for work has to poll them in a loop. Here a consumer sleeps on
+the not_empty condition until a producer adds an item, and a producer sleeps on
+not_full until a consumer makes room.
+- Bounding the capacity gives back-pressure: a producer that is faster than its
+consumers is slowed down to their pace instead of growing an unbounded backlog.
+- Both conditions share one lock, so each operation takes a single lock and
+notifies a single waiter.
+- A wait that times out raises TimeoutError, which a caller can tell apart from
+the generic exceptions raised elsewhere.
+- The items are kept in the same ring buffer Queue and list Stack used on their
+own. See queue_async.py for the asyncio versions.
+"""
@@ -6,12 +6,22 @@ Queue ADT Operations:
 4. is_empty(): Return true if and only if the queue is empty. 
 """
 
+"""
+Batch Operations:
+1. enqueue_many(items): Add items to the end of the queue, in order.
+2. dequeue_many(n): Remove the first n items in the queue.
+3. drain(): Remove every item from the queue.
+"""
+
 """
 Time Complexity:
 - enqueue(item): O(1)
-- dequeue(): 0(1)
+- dequeue(): O(n)
 - front(): 0(1)
 - is_empty(): 0(1) 
+- enqueue_many(items): O(k) for k items
+- dequeue_many(n): O(n + the number of items left)
+- drain(): O(1)
 """
 
 class Queue:
@@ -55,9 +65,48 @@ class Queue:
         """
         self.queue.append(item)
 
+    def enqueue_many(self, items):
+        """
+        Adds items to the end of the queue in one operation, as if each was
+        enqueued in order.
+        @param items: An iterable of the items to enqueue.
+        """
+        self.queue.extend(items)
+
+    def dequeue_many(self, n):
+        """
+        Removes the first n items from the queue in one operation. The
+        remaining items are shifted once, rather than once per item.
+        @param n: The number of items to dequeue.
+        @return: A list of the dequeued items, in queue order.
+        """
+        if n > len(self.queue):
+            raise Exception(f"Error: Cannot dequeue {n} items from a queue of "
+            f"{len(self.queue)} items.")
+        if n <= 0:
+            return []
+        items = self.queue[:n]
+        del self.queue[:n]
+        return items
+
+    def drain(self):
+        """
+        Removes every item from the queue.
+        @return: A list of the items, in queue order.
+        """
+        items = self.queue
+        self.queue = []
+        return items
+
 """
 Notes:
 - Uses FIFO (first in, first out) ordering.
 - Simple arrays with the restrictions that data can only be inserted at the end, 
 deleted from the front, and accessed from the front of the queue.
+- dequeue uses list.pop(0), which shifts every remaining item one position to
+the left, so it is O(n) and draining a backlog of n items takes O(n^2). See
+queue_ring_buffer.py for a queue with an O(1) dequeue.
+- dequeue_many(n) removes n items with a single shift of the remaining items,
+so draining a backlog in batches of k items takes O(n^2 / k) rather than
+O(n^2).
 """
\ No newline at end of file
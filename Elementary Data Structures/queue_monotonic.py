@@ -0,0 +1,236 @@
+"""
+Queues that keep an aggregate (min, max, sum, ...) of their items up to date,
+for computing rolling aggregates over a sliding window.
+
+Monotonic Queue Operations:
+1. enqueue(item): Add an item to the end of the queue.
+2. dequeue(): Remove the first item in the queue.
+3. front(): Return the front item in the queue.
+4. is_empty(): Return true if and only if the queue is empty.
+5. aggregate(): Return the smallest (or largest) item in the queue.
+
+Sliding Window Aggregator Operations:
+1. enqueue(item), dequeue(), front(), is_empty(): As for the monotonic queue.
+2. aggregate(): Return combine applied over the items, oldest first.
+"""
+
+"""
+Time Complexity:
+- enqueue(item): O(1) amortized
+- dequeue(): O(1) amortized
+- front(): O(1)
+- is_empty(): O(1)
+- aggregate(): O(1)
+"""
+
+from deque_blocks import Deque
+from queue_ring_buffer import Queue
+from stack_list import Stack
+
+class MonotonicQueue():
+    """
+    Queue tracking its smallest or largest item with a monotonic deque of the
+    items that can still become the answer.
+    """
+
+    def __init__(self, mode="min", window_size=None):
+        """
+        Create an empty queue.
+        @param mode: "min" to track the smallest item, "max" for the largest.
+        @param window_size: If given, enqueue dequeues the oldest item once the
+        queue holds more than window_size items.
+        """
+        if mode not in ("min", "max"):
+            raise Exception(f"Error: Unknown mode {mode}.")
+        self.mode = mode
+        self.window_size = window_size
+        self.queue = Queue()
+        # (position, item) of the candidates, oldest first. Their items are in
+        # increasing order for "min" and decreasing order for "max".
+        self.candidates = Deque()
+        # Positions of the oldest item in the queue and of the next item.
+        self.head = 0
+        self.tail = 0
+
+    def enqueue(self, item):
+        """
+        Adds an item to the end of the queue.
+        @param item: The item to add to the end of the queue.
+        """
+        # An older candidate that is no better than the new item can never be
+        # the answer again: it leaves the queue first.
+        if self.mode == "min":
+            while not self.candidates.is_empty() and \
+            self.candidates.back()[1] >= item:
+                self.candidates.pop_back()
+        else:
+            while not self.candidates.is_empty() and \
+            self.candidates.back()[1] <= item:
+                self.candidates.pop_back()
+        self.candidates.push_back((self.tail, item))
+        self.queue.enqueue(item)
+        self.tail += 1
+        if self.window_size != None and len(self.queue) > self.window_size:
+            self.dequeue()
+
+    def dequeue(self):
+        """
+        Removes the front item from the queue.
+        @return: The element dequeued from the queue.
+        """
+        item = self.queue.dequeue()
+        if self.candidates.front()[0] == self.head:
+            self.candidates.pop_front()
+        self.head += 1
+        return item
+
+    def aggregate(self):
+        """
+        Finds the smallest (or largest) item in the queue.
+        @return: The smallest item for "min" mode, the largest for "max".
+        """
+        if self.is_empty():
+            raise Exception("Error: Queue is empty.")
+        return self.candidates.front()[1]
+
+    def front(self):
+        """
+        Peeks at the front item in the queue without removing it.
+        @return: The element at the front of the queue.
+        """
+        return self.queue.front()
+
+    def is_empty(self):
+        """
+        Checks to see if the queue is empty.
+        @return: True if the queue is empty, false otherwise.
+        """
+        return self.queue.is_empty()
+
+    def __len__(self):
+        """Returns len(queue)."""
+        return len(self.queue)
+
+class SlidingWindowAggregator():
+    """
+    Queue tracking any associative aggregate of its items, built from two
+    Stacks (the two-stack queue).
+    """
+
+    def __init__(self, combine, window_size=None):
+        """
+        Create an empty queue.
+        @param combine: An associative function of two values, for example
+        operator.add, min, max or math.gcd. It need not be commutative.
+        @param window_size: If given, enqueue dequeues the oldest item once the
+        queue holds more than window_size items.
+        """
+        self.combine = combine
+        self.window_size = window_size
+        # The oldest items, with the oldest on top. Each entry is a tuple
+        # (item, aggregate of item and every item below it).
+        self.front_stack = Stack()
+        # The newest items, with the newest on top, and their aggregate.
+        self.back_stack = Stack()
+        self.back_aggregate = None
+
+    def enqueue(self, item):
+        """
+        Adds an item to the end of the queue.
+        @param item: The item to add to the end of the queue.
+        """
+        if self.back_stack.is_empty():
+            self.back_aggregate = item
+        else:
+            self.back_aggregate = self.combine(self.back_aggregate, item)
+        self.back_stack.push(item)
+        if self.window_size != None and len(self) > self.window_size:
+            self.dequeue()
+
+    def dequeue(self):
+        """
+        Removes the front item from the queue.
+        @return: The element dequeued from the queue.
+        """
+        if self.front_stack.is_empty():
+            self.transfer()
+        return self.front_stack.pop()[0]
+
+    def transfer(self):
+        """
+        Moves every item of the back stack to the front stack, reversing their
+        order and computing the aggregate of each item and the items newer than
+        it.
+        """
+        if self.back_stack.is_empty():
+            raise Exception("Error: Cannot dequeue from an empty queue.")
+        # drain returns the newest item first.
+        for item in self.back_stack.drain():
+            if self.front_stack.is_empty():
+                self.front_stack.push((item, item))
+            else:
+                self.front_stack.push((item,
+                self.combine(item, self.front_stack.top()[1])))
+        self.back_aggregate = None
+
+    def aggregate(self):
+        """
+        Combines every item of the queue, oldest first.
+        @return: The aggregate of the items.
+        """
+        if self.front_stack.is_empty():
+            if self.back_stack.is_empty():
+                raise Exception("Error: Queue is empty.")
+            return self.back_aggregate
+        if self.back_stack.is_empty():
+            return self.front_stack.top()[1]
+        return self.combine(self.front_stack.top()[1], self.back_aggregate)
+
+    def front(self):
+        """
+        Peeks at the front item in the queue without removing it.
+        @return: The element at the front of the queue.
+        """
+        if self.front_stack.is_empty():
+            self.transfer()
+        return self.front_stack.top()[0]
+
+    def is_empty(self):
+        """
+        Checks to see if the queue is empty.
+        @return: True if the queue is empty, false otherwise.
+        """
+        return self.front_stack.is_empty() and self.back_stack.is_empty()
+
+    def __len__(self):
+        """Returns len(queue)."""
+        return len(self.front_stack) + len(self.back_stack)
+
+"""
+Notes:
+- Recomputing the minimum of a window of w items after every new item takes
+O(w), so a stream of n items takes O(n * w). Both queues here keep the answer
+up to date in amortized O(1) per item.
+
+Monotonic Queue:
+- For min (or max), an item that is older and no smaller than a newer item can
+never be the minimum again, since the newer item stays in the window longer.
+Such items are dropped from the candidates when the newer item arrives, so the
+candidates stay in increasing order and the front candidate is the minimum.
+- Each item is added to and removed from the candidates at most once, so the
+work per item is O(1) amortized.
+- Only works for min and max (any total order), since it relies on discarding
+items that can no longer matter.
+
+Two Stack Aggregator:
+- Works for any associative aggregate, including ones with no inverse (min,
+max, gcd) where subtracting the item leaving the window is not possible.
+- New items are pushed on the back stack, keeping one running aggregate of it.
+Items are dequeued from the front stack, where each entry records the aggregate
+of itself and every newer item in that stack, so the aggregate of the window is
+the top entry's aggregate combined with the back stack's.
+- When the front stack runs out, the back stack is moved over in one pass. Each
+item moves once, so dequeue is O(1) amortized.
+- combine is applied oldest item first, so non-commutative aggregates (string
+concatenation, matrix products) work too.
+"""
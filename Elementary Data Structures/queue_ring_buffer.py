@@ -0,0 +1,270 @@
+"""
+Queue ADT Operations:
+1. enqueue(item): Add an item to the end of the queue.
+2. dequeue(): Remove the first item in the queue.
+3. front(): Return the front item in the queue.
+4. is_empty(): Return true if and only if the queue is empty.
+"""
+
+"""
+Ring Buffer Queue Operations:
+1. is_full(): Return true if and only if the queue holds max_capacity items.
+2. len(queue): Return the number of items in the queue.
+3. enqueue_many(items): Add items to the end of the queue, in order.
+4. dequeue_many(n): Remove the first n items in the queue.
+5. drain(): Remove every item from the queue.
+"""
+
+"""
+Time Complexity:
+- enqueue(item): O(1) amortized (O(n) when the buffer doubles)
+- dequeue(): O(1)
+- front(): O(1)
+- is_empty(): O(1)
+- enqueue_many(items): O(k) amortized for k items
+- dequeue_many(n): O(n)
+- drain(): O(n)
+"""
+
+from threading import Condition
+
+OVERFLOW_POLICIES = ("raise", "drop_oldest", "block")
+
+class Queue:
+    """Implementation of the queue ADT using a ring buffer."""
+
+    def __init__(self, capacity=8, max_capacity=None, overflow="raise"):
+        """
+        Create an empty queue.
+        @param capacity: The initial size of the buffer, rounded up to a power
+        of two.
+        @param max_capacity: The maximum number of items the queue holds, None
+        for no limit.
+        @param overflow: What enqueue does once the queue holds max_capacity
+        items. "raise" raises an exception, "drop_oldest" dequeues the front
+        item to make room and "block" waits until another thread dequeues.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise Exception(f"Error: Unknown overflow policy {overflow}.")
+        if max_capacity != None:
+            if max_capacity < 1:
+                raise Exception("Error: max_capacity must be at least 1.")
+            capacity = min(capacity, max_capacity)
+        size = 1
+        while size < capacity:
+            size *= 2
+        self.buffer = size * [None]
+        # size is a power of two, so index & mask == index % size.
+        self.mask = size - 1
+        self.head = 0
+        self.num_items = 0
+        self.max_capacity = max_capacity
+        self.overflow = overflow
+        # Only blocking queues pay for a lock.
+        self.not_full = Condition() if overflow == "block" else None
+
+    def is_empty(self):
+        """
+        Checks to see if the queue is empty.
+        @return: True if the queue is empty, false otherwise.
+        """
+        return self.num_items == 0
+
+    def is_full(self):
+        """
+        Checks to see if the queue holds max_capacity items.
+        @return: True if the queue is full, false otherwise (always false
+        without a max_capacity).
+        """
+        return self.num_items == self.max_capacity
+
+    def dequeue(self):
+        """
+        Removes the front item from the queue.
+        @return: The element dequeued from the queue.
+        """
+        if self.not_full != None:
+            with self.not_full:
+                item = self.pop_front()
+                self.not_full.notify()
+                return item
+        return self.pop_front()
+
+    def pop_front(self):
+        """
+        Removes the front item from the buffer.
+        @return: The element at the front of the buffer.
+        """
+        if self.num_items == 0:
+            raise Exception("Error: Cannot dequeue from an empty queue.")
+        item = self.buffer[self.head]
+        # Drop the buffer's reference so the item can be garbage collected.
+        self.buffer[self.head] = None
+        self.head = (self.head + 1) & self.mask
+        self.num_items -= 1
+        return item
+
+    def front(self):
+        """
+        Peeks at the front item in the queue without removing it.
+        @return: The element at the front of the queue.
+        """
+        if self.is_empty():
+            raise Exception("Error: Queue is empty.")
+        else:
+            return self.buffer[self.head]
+
+    def enqueue(self, item):
+        """
+        Adds an item to the end of the queue. If the queue is full, the
+        overflow policy decides what happens.
+        @param item: The item to add to the end of the queue.
+        """
+        if self.not_full != None:
+            with self.not_full:
+                while self.is_full():
+                    self.not_full.wait()
+                self.push_back(item)
+            return
+
+        if self.is_full():
+            if self.overflow == "raise":
+                raise Exception("Error: Cannot enqueue to a full queue.")
+            self.pop_front()
+        self.push_back(item)
+
+    def enqueue_many(self, items):
+        """
+        Adds items to the end of the queue in one operation, as if each was
+        enqueued in order. The buffer grows at most once and the items are
+        copied in with at most two slice assignments.
+        @param items: An iterable of the items to enqueue.
+        """
+        items = list(items)
+        if self.not_full != None:
+            # Blocking queues may have to wait for room part way through.
+            for item in items:
+                self.enqueue(item)
+            return
+
+        if self.max_capacity != None and \
+        self.num_items + len(items) > self.max_capacity:
+            if self.overflow == "raise":
+                raise Exception(f"Error: Cannot enqueue {len(items)} items to "
+                f"a queue with room for "
+                f"{self.max_capacity - self.num_items}.")
+            # Drop the oldest items, queued or new, to keep the newest ones.
+            if len(items) >= self.max_capacity:
+                self.drain()
+                items = items[len(items) - self.max_capacity:]
+            else:
+                self.dequeue_many(self.num_items + len(items) -
+                self.max_capacity)
+
+        size = len(self.buffer)
+        while size < self.num_items + len(items):
+            size *= 2
+        if size > len(self.buffer):
+            self.grow(size)
+        size = len(self.buffer)
+        start = (self.head + self.num_items) & self.mask
+        first = min(len(items), size - start)
+        self.buffer[start:start + first] = items[:first]
+        self.buffer[:len(items) - first] = items[first:]
+        self.num_items += len(items)
+
+    def dequeue_many(self, n):
+        """
+        Removes the first n items from the queue in one operation, copying them
+        out with at most two slices.
+        @param n: The number of items to dequeue.
+        @return: A list of the dequeued items, in queue order.
+        """
+        if self.not_full != None:
+            with self.not_full:
+                items = self.pop_front_many(n)
+                self.not_full.notify_all()
+                return items
+        return self.pop_front_many(n)
+
+    def pop_front_many(self, n):
+        """
+        Removes the first n items from the buffer.
+        @param n: The number of items to remove.
+        @return: A list of the items, in queue order.
+        """
+        if n > self.num_items:
+            raise Exception(f"Error: Cannot dequeue {n} items from a queue of "
+            f"{self.num_items} items.")
+        if n <= 0:
+            return []
+        size = len(self.buffer)
+        first = min(n, size - self.head)
+        items = self.buffer[self.head:self.head + first] + \
+        self.buffer[:n - first]
+        self.buffer[self.head:self.head + first] = first * [None]
+        self.buffer[:n - first] = (n - first) * [None]
+        self.head = (self.head + n) & self.mask
+        self.num_items -= n
+        return items
+
+    def drain(self):
+        """
+        Removes every item from the queue.
+        @return: A list of the items, in queue order.
+        """
+        return self.dequeue_many(self.num_items)
+
+    def push_back(self, item):
+        """
+        Adds an item to the end of the buffer, doubling the buffer if it is
+        full.
+        @param item: The item to add to the end of the buffer.
+        """
+        if self.num_items == len(self.buffer):
+            self.grow(2 * len(self.buffer))
+        self.buffer[(self.head + self.num_items) & self.mask] = item
+        self.num_items += 1
+
+    def grow(self, new_size):
+        """
+        Enlarges the buffer, moving the items to its start in queue order.
+        @param new_size: The new size of the buffer, a larger power of two.
+        """
+        size = len(self.buffer)
+        self.buffer = (self.buffer[self.head:] + self.buffer[:self.head] +
+        (new_size - size) * [None])
+        self.mask = new_size - 1
+        self.head = 0
+
+    def __len__(self):
+        """Returns len(queue)."""
+        return self.num_items
+
+"""
+Notes:
+- Uses FIFO (first in, first out) ordering.
+- queue_list.py dequeues with list.pop(0), which shifts every remaining item and
+takes O(n), so draining a queue of n items takes O(n^2).
+- A ring buffer keeps the items in a fixed size list and moves the front
+(head) instead of the items. The end of the queue wraps around to the start
+of the list, so both ends are O(1).
+- The buffer size is a power of two, so wrapping an index is a bitwise and with
+size - 1 rather than a modulo.
+- When the buffer is full it doubles, copying the items once in queue order.
+Each item is copied O(1) times on average, so enqueue is O(1) amortized.
+- The batch operations copy items in and out with at most two slices (one up to
+the end of the buffer, one after wrapping around), so moving k items costs a
+couple of list operations rather than k method calls.
+- For a backlog of a few thousand items the list queue is still faster, since
+list.pop(0) is a single fast memory move while the ring buffer runs more Python
+code per operation. benchmark_queue.py shows where the two cross over.
+
+Bounded Queues:
+- With a max_capacity, the queue never holds more than max_capacity items. This
+bounds the memory used by a backlog of work and pushes back on producers.
+- "raise" refuses the new item, "drop_oldest" discards the front item (keeping
+the most recent items, like a log buffer) and "block" makes the producer wait
+for a consumer in another thread. A blocking enqueue in a single threaded
+program would wait forever.
+"""
@@ -0,0 +1,283 @@
+"""
+Single-producer/single-consumer queue of bytes in shared memory, for handing
+items between processes without pickling them.
+
+Shared Memory Queue Operations:
+1. enqueue(item, timeout): Add an item to the end of the queue, waiting for
+room if the queue is full.
+2. dequeue(timeout): Remove the first item in the queue, waiting for one if the
+queue is empty.
+3. try_enqueue(item), try_dequeue(): Versions of enqueue and dequeue that
+never wait.
+4. is_empty(): Return true if and only if the queue is empty.
+5. close(), unlink(): Detach from the shared memory and destroy it.
+"""
+
+"""
+Time Complexity (excluding the time spent waiting):
+- enqueue(item): O(k) for an item of k bytes
+- dequeue(): O(k) for an item of k bytes
+- is_empty(): O(1)
+"""
+
+"""
+Shared Memory Layout:
+1. The head cursor (bytes dequeued so far), written only by the consumer.
+2. The tail cursor (bytes enqueued so far), written only by the producer.
+3. The capacity of the ring and the record size (0 for variable size items).
+4. The ring: capacity bytes (a power of two) of items. A variable size item is
+stored as a 4 byte length followed by its bytes, padded to a multiple of 8. A
+fixed size record is stored as its record_size bytes.
+Each of the first three parts is on its own 64 byte cache line.
+"""
+
+import struct
+import time
+from multiprocessing import shared_memory
+
+CURSOR = struct.Struct("<Q")
+INFO = struct.Struct("<QQ")
+LENGTH = struct.Struct("<I")
+HEAD_OFFSET = 0
+TAIL_OFFSET = 64
+INFO_OFFSET = 128
+RING_OFFSET = 192
+# Seconds a waiting enqueue or dequeue sleeps between two attempts.
+POLL_INTERVAL = 0.00005
+
+class SharedMemoryQueue():
+    """
+    Implementation of a single-producer/single-consumer queue using a ring
+    buffer in shared memory. The producer only moves the tail and the consumer
+    only moves the head, so neither needs a lock.
+    """
+
+    def __init__(self, name=None, capacity=65536, record_size=None):
+        """
+        Creates a queue in new shared memory, or attaches to an existing one.
+        @param name: The name of the shared memory of an existing queue. None
+        creates a new queue.
+        @param capacity: The size of the ring in bytes, rounded up to a power
+        of two. Ignored when attaching.
+        @param record_size: The size in bytes of every item, None for items of
+        any size. Ignored when attaching.
+        """
+        if name == None:
+            size = 8
+            while size < capacity:
+                size *= 2
+            self.memory = shared_memory.SharedMemory(create=True,
+            size=RING_OFFSET + size)
+            CURSOR.pack_into(self.memory.buf, HEAD_OFFSET, 0)
+            CURSOR.pack_into(self.memory.buf, TAIL_OFFSET, 0)
+            INFO.pack_into(self.memory.buf, INFO_OFFSET, size,
+            record_size or 0)
+        else:
+            self.memory = attach_shared_memory(name)
+        self.name = self.memory.name
+        self.capacity, record_size = INFO.unpack_from(self.memory.buf,
+        INFO_OFFSET)
+        self.record_size = record_size or None
+        self.mask = self.capacity - 1
+        self.ring = self.memory.buf[RING_OFFSET:RING_OFFSET + self.capacity]
+        # Each side keeps the last value it read of the other side's cursor,
+        # and only reads it again from shared memory when the queue looks full
+        # (producer) or empty (consumer). A queue attached after items have
+        # gone through it starts from the current cursors.
+        self.cached_head = CURSOR.unpack_from(self.memory.buf, HEAD_OFFSET)[0]
+        self.cached_tail = CURSOR.unpack_from(self.memory.buf, TAIL_OFFSET)[0]
+
+    def item_size(self, length):
+        """
+        Computes the number of ring bytes an item takes.
+        @param length: The length of the item in bytes.
+        @return: The number of bytes the item takes in the ring.
+        """
+        if self.record_size != None:
+            return self.record_size
+        return (LENGTH.size + length + 7) & ~7
+
+    def try_enqueue(self, item):
+        """
+        Adds an item to the end of the queue if there is room for it. Must only
+        be called by the producer.
+        @param item: A bytes-like object. Its length must be record_size for a
+        queue of fixed size records.
+        @return: True if the item was added, false if the queue is full.
+        """
+        item = memoryview(item).cast("B")
+        if self.record_size != None and len(item) != self.record_size:
+            raise Exception(f"Error: Records must be {self.record_size} "
+            "bytes long.")
+        size = self.item_size(len(item))
+        if size > self.capacity:
+            raise Exception("Error: Item is larger than the queue.")
+
+        tail = CURSOR.unpack_from(self.memory.buf, TAIL_OFFSET)[0]
+        if size > self.capacity - (tail - self.cached_head):
+            self.cached_head = CURSOR.unpack_from(self.memory.buf,
+            HEAD_OFFSET)[0]
+            if size > self.capacity - (tail - self.cached_head):
+                return False
+
+        if self.record_size == None:
+            # Items start on a multiple of 8, so the length never wraps.
+            LENGTH.pack_into(self.ring, tail & self.mask, len(item))
+            self.write(tail + LENGTH.size, item)
+        else:
+            self.write(tail, item)
+        # Publishing the new tail last makes the item visible to the consumer
+        # only once it has been written.
+        CURSOR.pack_into(self.memory.buf, TAIL_OFFSET, tail + size)
+        return True
+
+    def try_dequeue(self):
+        """
+        Removes the front item from the queue if there is one. Must only be
+        called by the consumer.
+        @return: The item as bytes, None if the queue is empty.
+        """
+        head = CURSOR.unpack_from(self.memory.buf, HEAD_OFFSET)[0]
+        if head >= self.cached_tail:
+            self.cached_tail = CURSOR.unpack_from(self.memory.buf,
+            TAIL_OFFSET)[0]
+            if head >= self.cached_tail:
+                return None
+
+        if self.record_size == None:
+            length = LENGTH.unpack_from(self.ring, head & self.mask)[0]
+            item = self.read(head + LENGTH.size, length)
+        else:
+            length = self.record_size
+            item = self.read(head, length)
+        # Publishing the new head last frees the item's bytes only once they
+        # have been copied out.
+        CURSOR.pack_into(self.memory.buf, HEAD_OFFSET,
+        head + self.item_size(length))
+        return item
+
+    def enqueue(self, item, timeout=None):
+        """
+        Adds an item to the end of the queue, waiting while the queue is full.
+        Must only be called by the producer.
+        @param item: A bytes-like object.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        """
+        deadline = None if timeout == None else time.monotonic() + timeout
+        while not self.try_enqueue(item):
+            if deadline != None and time.monotonic() >= deadline:
+                raise TimeoutError("Error: Timed out waiting for room.")
+            time.sleep(POLL_INTERVAL)
+
+    def dequeue(self, timeout=None):
+        """
+        Removes the front item from the queue, waiting while the queue is
+        empty. Must only be called by the consumer.
+        @param timeout: The maximum number of seconds to wait. None waits
+        forever and 0 does not wait at all.
+        @return: The item as bytes.
+        """
+        deadline = None if timeout == None else time.monotonic() + timeout
+        while True:
+            item = self.try_dequeue()
+            if item != None:
+                return item
+            if deadline != None and time.monotonic() >= deadline:
+                raise TimeoutError("Error: Timed out waiting for an item.")
+            time.sleep(POLL_INTERVAL)
+
+    def write(self, position, data):
+        """
+        Copies bytes into the ring, wrapping around its end.
+        @param position: The cursor position to write at.
+        @param data: A memoryview of the bytes to write.
+        """
+        start = position & self.mask
+        first = min(len(data), self.capacity - start)
+        self.ring[start:start + first] = data[:first]
+        self.ring[:len(data) - first] = data[first:]
+
+    def read(self, position, length):
+        """
+        Copies bytes out of the ring, wrapping around its end.
+        @param position: The cursor position to read from.
+        @param length: The number of bytes to read.
+        @return: The bytes read.
+        """
+        start = position & self.mask
+        first = min(length, self.capacity - start)
+        if first == length:
+            return bytes(self.ring[start:start + length])
+        return bytes(self.ring[start:]) + bytes(self.ring[:length - first])
+
+    def is_empty(self):
+        """
+        Checks to see if the queue is empty.
+        @return: True if the queue is empty, false otherwise.
+        """
+        return CURSOR.unpack_from(self.memory.buf, HEAD_OFFSET)[0] == \
+        CURSOR.unpack_from(self.memory.buf, TAIL_OFFSET)[0]
+
+    def close(self):
+        """Detaches this process from the shared memory."""
+        self.ring.release()
+        self.memory.close()
+
+    def unlink(self):
+        """
+        Destroys the shared memory once every process has closed it. Must be
+        called once, usually by the process that created the queue.
+        """
+        self.memory.unlink()
+
+    def __reduce__(self):
+        """Pickles the queue as its name, so a child process attaches to it."""
+        return (SharedMemoryQueue, (self.name,))
+
+    def __enter__(self):
+        """Returns the queue for a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the queue at the end of a with statement."""
+        self.close()
+
+def attach_shared_memory(name):
+    """
+    Attaches to existing shared memory.
+    @param name: The name of the shared memory.
+    @return: The SharedMemory.
+    """
+    try:
+        # Python 3.13+: only the creator should track, and unlink, the memory.
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+"""
+Notes:
+- multiprocessing.Queue pickles every item and sends it through a pipe, paying
+for the pickling, a system call and a copy through the kernel on each side.
+Here an item is copied once into shared memory by the producer and once out by
+the consumer, with no pickling and no system call.
+- With a single producer and a single consumer, each cursor has one writer: the
+producer moves the tail once an item is written, and the consumer moves the
+head once an item is read. So no lock is needed.
+- The cursors count bytes and only ever grow, so tail - head is the number of
+bytes queued and cursor & (capacity - 1) is the position in the ring.
+- The head and tail are on different cache lines, so the producer and the
+consumer do not invalidate each other's cache line on every write (false
+sharing). Each side also caches the other side's cursor and only reads it again
+when the queue looks full or empty.
+- Publishing a cursor after writing the item relies on the stores reaching the
+other processor in order, which x86 guarantees. Weakly ordered processors
+(ARM) would need memory barriers that Python does not expose.
+- Items never need to fit before the end of the ring, they wrap around it. Only
+the length of a variable size item must not wrap, which padding every item to
+a multiple of 8 guarantees.
+- Waiting enqueues and dequeues poll every POLL_INTERVAL seconds, since there is
+no lock to wait on.
+- Pass the queue itself to a multiprocessing.Process: it is pickled as its name
+and the child attaches to the same shared memory.
+"""
@@ -0,0 +1,185 @@
+"""
+Stack ADT Operations:
+1. pop(): Remove the top item from the stack.
+2. push(item): Add an item to the top of the stack.
+3. top(): Return the top of the stack.
+4. is_empty(): Return true if and only if the stack is empty.
+"""
+
+"""
+Typed Stack Operations:
+1. push_many(items): Add items to the top of the stack, in order. Buffers of
+the same type (array.array, NumPy arrays, ...) are copied in as raw memory.
+2. pop_many(n): Remove the top n items from the stack.
+3. drain(): Remove every item from the stack.
+4. view(): Return a memoryview of the items, without copying them.
+5. to_numpy(): Return a NumPy array of the items, without copying them.
+6. len(stack): Return the number of items in the stack.
+"""
+
+"""
+Time Complexity:
+- pop(): O(1)
+- push(item): O(1) amortized
+- top(): O(1)
+- is_empty(): O(1)
+- push_many(items): O(k) for k items
+- pop_many(n): O(n)
+- drain(): O(n)
+- view(), to_numpy(): O(1)
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Type codes of the same kind, which only differ by their item size.
+TYPE_KINDS = ("bhilq", "BHILQ", "fd")
+
+class Stack:
+    """Implementation of the stack ADT using a typed array.array."""
+
+    def __init__(self, type_code="q"):
+        """
+        Create an empty stack.
+        @param type_code: The array module type code of the items, for example
+        "q" for 64 bit ints or "d" for floats.
+        """
+        self.stack = array(type_code)
+        self.type_code = type_code
+
+    def is_empty(self):
+        """
+        Checks to see if the stack is empty.
+        @return: True if the stack is empty, false otherwise.
+        """
+        return len(self.stack) == 0
+
+    def pop(self):
+        """
+        Removes the top item from the stack.
+        @return: The element popped from the stack.
+        """
+        if self.is_empty():
+            raise Exception("Error: Cannot pop from an empty stack.")
+        else:
+            return self.stack.pop()
+
+    def top(self):
+        """
+        Peeks at the top item of the stack without popping it.
+        @return: The element on top of the stack.
+        """
+        if self.is_empty():
+            raise Exception("Error: Stack is empty.")
+        else:
+            return self.stack[-1]
+
+    def push(self, item):
+        """
+        Adds an item to the top of the stack.
+        @param item: The item to add to the top of the stack. Must fit the type
+        code of the stack.
+        """
+        self.stack.append(item)
+
+    def push_many(self, items):
+        """
+        Adds items to the top of the stack in one operation, as if each was
+        pushed in order. A buffer holding items of the same type is copied in
+        as raw memory, without converting each item.
+        @param items: A buffer (array.array, NumPy array, memoryview, ...) or
+        any iterable of the items to push.
+        """
+        try:
+            buffer = memoryview(items)
+        except TypeError:
+            self.stack.extend(items)
+            return
+        if self.same_type(buffer) and buffer.c_contiguous:
+            self.stack.frombytes(buffer.cast("B"))
+        else:
+            self.stack.extend(buffer.tolist())
+
+    def same_type(self, buffer):
+        """
+        Checks to see if a buffer holds items of the stack's type.
+        @param buffer: A memoryview of the buffer.
+        @return: True if the buffer's bytes can be copied in as they are.
+        """
+        type_code = buffer.format.lstrip("@=")
+        if buffer.itemsize != self.stack.itemsize or len(type_code) != 1:
+            return False
+        return any(type_code in kind and self.type_code in kind
+        for kind in TYPE_KINDS)
+
+    def pop_many(self, n):
+        """
+        Removes the top n items from the stack in one operation.
+        @param n: The number of items to pop.
+        @return: An array of the popped items, in the order pop would return
+        them.
+        """
+        if n > len(self.stack):
+            raise Exception(f"Error: Cannot pop {n} items from a stack of "
+            f"{len(self.stack)} items.")
+        if n <= 0:
+            return array(self.type_code)
+        items = self.stack[-n:]
+        del self.stack[-n:]
+        items.reverse()
+        return items
+
+    def drain(self):
+        """
+        Removes every item from the stack.
+        @return: An array of the items, in the order pop would return them.
+        """
+        items = self.stack
+        self.stack = array(self.type_code)
+        items.reverse()
+        return items
+
+    def view(self):
+        """
+        Exports the items, bottom first, without copying them. The stack cannot
+        grow or shrink until the view is released.
+        @return: A memoryview of the items.
+        """
+        return memoryview(self.stack)
+
+    def to_numpy(self):
+        """
+        Exports the items, bottom first, as a NumPy array sharing the stack's
+        memory. The stack cannot grow or shrink while the array exists.
+        @return: A NumPy array of the items.
+        """
+        if np == None:
+            raise Exception("Error: to_numpy requires NumPy.")
+        return np.asarray(memoryview(self.stack))
+
+    def __len__(self):
+        """Returns len(stack)."""
+        return len(self.stack)
+
+"""
+Notes:
+- Uses LIFO (last in, first out) ordering.
+- A list stores a pointer to a separately allocated object for every item. An
+int takes 28 bytes plus the 8 byte pointer, so a list of ints uses about 36
+bytes per item. An array.array stores the raw values, 8 bytes per item for
+type code "q" (4 for "l" on some platforms, "i" or "f"), and only creates an
+int object when an item is popped.
+- Fewer bytes per item also means fewer cache misses when the stack is large.
+Pushing and popping one item at a time is slightly slower than with a list,
+since each int is converted to and from its raw value (see benchmark_stack.py).
+The batch operations avoid that cost.
+- push_many copies a buffer of the same type with a single memory copy, and
+view() and to_numpy() export the items through the buffer protocol without
+copying them. While an export is alive the array cannot be resized, so pushing
+or popping raises BufferError until the view is released.
+- NumPy is optional, only to_numpy needs it.
+"""
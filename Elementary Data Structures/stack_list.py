@@ -6,12 +6,22 @@ Stack ADT Operations:
 4. is_empty(): Return true if and only if the stack is empty.
 """
 
+"""
+Batch Operations:
+1. push_many(items): Add items to the top of the stack, in order.
+2. pop_many(n): Remove the top n items from the stack.
+3. drain(): Remove every item from the stack.
+"""
+
 """
 Time Complexity:
 - pop(): O(1)
 - push(item): O(1)
 - top(): 0(1)
 - is_empty(): 0(1)
+- push_many(items): O(k) for k items
+- pop_many(n): O(n)
+- drain(): O(n)
 """
 
 class Stack:
@@ -55,9 +65,50 @@ class Stack:
         """
         self.stack.append(item)
 
+    def push_many(self, items):
+        """
+        Adds items to the top of the stack in one operation, as if each was
+        pushed in order.
+        @param items: An iterable of the items to push.
+        """
+        self.stack.extend(items)
+
+    def pop_many(self, n):
+        """
+        Removes the top n items from the stack in one operation.
+        @param n: The number of items to pop.
+        @return: A list of the popped items, in the order pop would return them.
+        """
+        if n > len(self.stack):
+            raise Exception(f"Error: Cannot pop {n} items from a stack of "
+            f"{len(self.stack)} items.")
+        if n <= 0:
+            return []
+        items = self.stack[-n:]
+        del self.stack[-n:]
+        items.reverse()
+        return items
+
+    def drain(self):
+        """
+        Removes every item from the stack.
+        @return: A list of the items, in the order pop would return them.
+        """
+        items = self.stack
+        self.stack = []
+        items.reverse()
+        return items
+
+    def __len__(self):
+        """Returns len(stack)."""
+        return len(self.stack)
+
 """
 Notes:
 - Uses LIFO (last in, first out) ordering.
 - Simple arrays with the restrictions that data can only be inserted, deleted, 
 and accessed at the end of a stack.
+- The batch operations move whole slices of the list at once, so pushing or
+popping k items costs one method call and one list operation rather than k
+method calls and k is_empty() checks.
 """
\ No newline at end of file
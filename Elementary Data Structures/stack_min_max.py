@@ -0,0 +1,119 @@
+"""
+Min Max Stack Operations:
+1. pop(): Remove the top item from the stack.
+2. push(item): Add an item to the top of the stack.
+3. top(): Return the top of the stack.
+4. is_empty(): Return true if and only if the stack is empty.
+5. min(), max(): Return the smallest or largest item in the stack.
+6. push_many(items), pop_many(n), drain(): Batch versions of push and pop.
+"""
+
+"""
+Time Complexity:
+- pop(): O(1)
+- push(item): O(1)
+- top(): O(1)
+- is_empty(): O(1)
+- min(), max(): O(1)
+"""
+
+from stack_list import Stack
+
+class MinMaxStack(Stack):
+    """
+    Implementation of the stack ADT using a list, also tracking the smallest
+    and largest item.
+    """
+
+    def __init__(self):
+        """Create an empty stack."""
+        super().__init__()
+        # mins[i] and maxes[i] are the smallest and largest of stack[:i + 1].
+        self.mins = []
+        self.maxes = []
+
+    def push(self, item):
+        """
+        Adds an item to the top of the stack.
+        @param item: The item to add to the top of the stack. Must be
+        comparable with the other items.
+        """
+        if self.is_empty():
+            self.mins.append(item)
+            self.maxes.append(item)
+        else:
+            self.mins.append(item if item < self.mins[-1] else self.mins[-1])
+            self.maxes.append(item if item > self.maxes[-1] else
+            self.maxes[-1])
+        self.stack.append(item)
+
+    def pop(self):
+        """
+        Removes the top item from the stack.
+        @return: The element popped from the stack.
+        """
+        item = super().pop()
+        self.mins.pop()
+        self.maxes.pop()
+        return item
+
+    def min(self):
+        """
+        Finds the smallest item in the stack.
+        @return: The smallest item.
+        """
+        if self.is_empty():
+            raise Exception("Error: Stack is empty.")
+        return self.mins[-1]
+
+    def max(self):
+        """
+        Finds the largest item in the stack.
+        @return: The largest item.
+        """
+        if self.is_empty():
+            raise Exception("Error: Stack is empty.")
+        return self.maxes[-1]
+
+    def push_many(self, items):
+        """
+        Adds items to the top of the stack, as if each was pushed in order.
+        @param items: An iterable of the items to push.
+        """
+        for item in items:
+            self.push(item)
+
+    def pop_many(self, n):
+        """
+        Removes the top n items from the stack in one operation.
+        @param n: The number of items to pop.
+        @return: A list of the popped items, in the order pop would return them.
+        """
+        items = super().pop_many(n)
+        del self.mins[len(self.stack):]
+        del self.maxes[len(self.stack):]
+        return items
+
+    def drain(self):
+        """
+        Removes every item from the stack.
+        @return: A list of the items, in the order pop would return them.
+        """
+        self.mins = []
+        self.maxes = []
+        return super().drain()
+
+"""
+Notes:
+- Uses LIFO (last in, first out) ordering.
+- Finding the minimum of a plain stack means scanning every item, O(n). Here
+every push also records the minimum and maximum of the stack up to and
+including the new item. A pop only removes items above the ones those values
+were computed from, so the records below the top stay valid and min() and max()
+just read the top record.
+- This costs two extra list slots per item.
+- Two of these stacks would make a queue with O(1) amortized min and max (the
+two-stack queue). queue_monotonic.py does not use this class: MonotonicQueue
+tracks the min or max with a monotonic deque, and SlidingWindowAggregator
+keeps any associative aggregate over two plain Stacks.
+"""
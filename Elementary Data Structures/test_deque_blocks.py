@@ -0,0 +1,54 @@
+from deque_blocks import Deque
+from collections import deque
+import random
+import unittest
+
+class TestBlockDeque(unittest.TestCase):
+    """Tests for the block Deque class."""
+
+    def test_matches_collections_deque(self):
+        """Does a random mix of operations match collections.deque?"""
+        rng = random.Random(0)
+        for maxlen in (None, 7):
+            test_deque = Deque(maxlen=maxlen, block_size=4)
+            expected = deque(maxlen=maxlen)
+            for item in range(2000):
+                operation = rng.randrange(6)
+                if operation == 0:
+                    test_deque.push_back(item)
+                    expected.append(item)
+                elif operation == 1:
+                    test_deque.push_front(item)
+                    expected.appendleft(item)
+                elif operation == 2 and len(expected) > 0:
+                    self.assertEqual(test_deque.pop_back(), expected.pop())
+                elif operation == 3 and len(expected) > 0:
+                    self.assertEqual(test_deque.pop_front(),
+                    expected.popleft())
+                elif operation == 4:
+                    steps = rng.randrange(-10, 10)
+                    test_deque.rotate(steps)
+                    expected.rotate(steps)
+                elif operation == 5 and len(expected) > 0:
+                    index = rng.randrange(-len(expected), len(expected))
+                    self.assertEqual(test_deque[index], expected[index])
+                self.assertEqual(list(test_deque), list(expected))
+
+    def test_blocks_are_reused(self):
+        """Does a sliding window reuse freed blocks instead of new ones?"""
+        test_deque = Deque(block_size=4)
+        for item in range(6):
+            test_deque.push_back(item)
+        blocks = set()
+        for item in range(6, 100):
+            test_deque.push_back(item)
+            test_deque.pop_front()
+            blocks.add(id(test_deque.right_block))
+        self.assertLessEqual(len(blocks), 3)
+        self.assertEqual(list(test_deque), list(range(94, 100)))
+        with self.assertRaises(IndexError):
+            test_deque[6]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+from queue_async import AsyncQueue, AsyncStack
+from queue_blocking import BlockingQueue, BlockingStack
+from threading import Thread
+import asyncio
+import unittest
+
+class TestBlockingQueue(unittest.TestCase):
+    """Tests for the blocking and asyncio queues and stacks."""
+
+    def test_producer_consumer(self):
+        """Do consumers wait for producers, in FIFO and LIFO order?"""
+        test_queue = BlockingQueue(max_capacity=2)
+        producer = Thread(target=lambda: [test_queue.enqueue(item)
+        for item in range(100)])
+        producer.start()
+        items = [test_queue.dequeue(timeout=5) for _ in range(100)]
+        producer.join()
+        self.assertEqual(items, list(range(100)))
+
+        test_stack = BlockingStack(max_capacity=2)
+        test_stack.push(1)
+        test_stack.push(2)
+        self.assertEqual(test_stack.top(), 2)
+        self.assertEqual(test_stack.pop(), 2)
+        self.assertEqual(len(test_stack), 1)
+
+    def test_timeouts(self):
+        """Do full and empty containers raise TimeoutError after a timeout?"""
+        test_queue = BlockingQueue(max_capacity=1)
+        with self.assertRaises(TimeoutError):
+            test_queue.dequeue(timeout=0.01)
+        test_queue.enqueue(1)
+        with self.assertRaises(TimeoutError):
+            test_queue.enqueue(2, timeout=0)
+        self.assertTrue(test_queue.is_full())
+
+    def test_asyncio(self):
+        """Do the asyncio versions suspend producers and consumers?"""
+        async def run():
+            test_queue = AsyncQueue(max_capacity=2)
+
+            async def produce():
+                for item in range(20):
+                    await test_queue.enqueue(item)
+
+            producer = asyncio.create_task(produce())
+            items = [await test_queue.dequeue(timeout=5) for _ in range(20)]
+            await producer
+            self.assertEqual(items, list(range(20)))
+            with self.assertRaises(TimeoutError):
+                await test_queue.dequeue(timeout=0.01)
+
+            test_stack = AsyncStack(max_capacity=1)
+            await test_stack.push(1, timeout=0)
+            with self.assertRaises(TimeoutError):
+                await test_stack.push(2, timeout=0)
+            self.assertEqual(await test_stack.pop(), 1)
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
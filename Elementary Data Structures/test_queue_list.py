@@ -0,0 +1,24 @@
+from queue_list import Queue
+import unittest
+
+class TestQueueList(unittest.TestCase):
+    """Tests for the list based Queue class."""
+
+    def test_batches(self):
+        """Do the batch operations keep FIFO order?"""
+        test_queue = Queue()
+        test_queue.enqueue_many(range(5))
+        test_queue.enqueue(5)
+        self.assertEqual(test_queue.dequeue_many(2), [0, 1])
+        self.assertEqual(test_queue.dequeue_many(0), [])
+        self.assertEqual(test_queue.dequeue_many(-1), [])
+        self.assertEqual(test_queue.front(), 2)
+        with self.assertRaises(Exception):
+            test_queue.dequeue_many(5)
+        self.assertEqual(test_queue.drain(), [2, 3, 4, 5])
+        self.assertTrue(test_queue.is_empty())
+        self.assertEqual(test_queue.drain(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
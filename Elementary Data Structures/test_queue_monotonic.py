@@ -0,0 +1,53 @@
+from queue_monotonic import MonotonicQueue, SlidingWindowAggregator
+from stack_min_max import MinMaxStack
+import math
+import operator
+import random
+import unittest
+
+class TestSlidingWindows(unittest.TestCase):
+    """Tests for MonotonicQueue, SlidingWindowAggregator and MinMaxStack."""
+
+    def test_rolling_aggregates(self):
+        """Do the queues match aggregates recomputed over each window?"""
+        rng = random.Random(0)
+        items = [rng.randrange(1, 100) for _ in range(500)]
+        window_size = 8
+        minimum = MonotonicQueue("min", window_size)
+        maximum = MonotonicQueue("max", window_size)
+        gcd = SlidingWindowAggregator(math.gcd, window_size)
+        joined = SlidingWindowAggregator(operator.add, window_size)
+        for index, item in enumerate(items):
+            minimum.enqueue(item)
+            maximum.enqueue(item)
+            gcd.enqueue(item)
+            joined.enqueue(str(item) + " ")
+            window = items[max(0, index - window_size + 1):index + 1]
+            self.assertEqual(minimum.aggregate(), min(window))
+            self.assertEqual(maximum.aggregate(), max(window))
+            self.assertEqual(gcd.aggregate(), math.gcd(*window))
+            # Concatenation is not commutative, so the order must be kept.
+            self.assertEqual(joined.aggregate(),
+            "".join(str(value) + " " for value in window))
+        self.assertEqual(len(gcd), window_size)
+        self.assertEqual(minimum.dequeue(), items[-window_size])
+
+        with self.assertRaises(Exception):
+            SlidingWindowAggregator(min).aggregate()
+
+    def test_min_max_stack(self):
+        """Are min and max restored as items are popped?"""
+        test_stack = MinMaxStack()
+        test_stack.push_many([5, 3, 8, 1, 9])
+        self.assertEqual((test_stack.min(), test_stack.max()), (1, 9))
+        self.assertEqual(test_stack.pop(), 9)
+        self.assertEqual((test_stack.min(), test_stack.max()), (1, 8))
+        self.assertEqual(test_stack.pop_many(2), [1, 8])
+        self.assertEqual((test_stack.min(), test_stack.max()), (3, 5))
+        test_stack.drain()
+        with self.assertRaises(Exception):
+            test_stack.min()
+
+
+if __name__ == '__main__':
+    unittest.main()
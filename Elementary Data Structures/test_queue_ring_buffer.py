@@ -0,0 +1,74 @@
+from queue_ring_buffer import Queue
+from threading import Thread
+import unittest
+
+class TestRingBufferQueue(unittest.TestCase):
+    """Tests for the ring buffer Queue class."""
+
+    def test_wraparound_and_growth(self):
+        """Are items dequeued in order after wrapping around and doubling?"""
+        test_queue = Queue(capacity=4)
+        for item in range(3):
+            test_queue.enqueue(item)
+        self.assertEqual(test_queue.dequeue(), 0)
+        self.assertEqual(test_queue.dequeue(), 1)
+        for item in range(3, 10):
+            test_queue.enqueue(item)
+        self.assertEqual(len(test_queue.buffer), 8)
+        self.assertEqual(len(test_queue), 8)
+        self.assertEqual(test_queue.front(), 2)
+        self.assertEqual([test_queue.dequeue() for _ in range(8)],
+        list(range(2, 10)))
+        self.assertTrue(test_queue.is_empty())
+        with self.assertRaises(Exception):
+            test_queue.dequeue()
+
+    def test_batches(self):
+        """Do batches wrap around the buffer and keep queue order?"""
+        test_queue = Queue(capacity=8)
+        test_queue.enqueue_many(range(6))
+        self.assertEqual(test_queue.dequeue_many(4), [0, 1, 2, 3])
+        test_queue.enqueue_many(range(6, 12))
+        self.assertEqual(len(test_queue.buffer), 8)
+        test_queue.enqueue_many(range(12, 20))
+        self.assertEqual(len(test_queue.buffer), 16)
+        self.assertEqual(test_queue.dequeue_many(3), [4, 5, 6])
+        self.assertEqual(test_queue.drain(), list(range(7, 20)))
+        self.assertEqual(test_queue.buffer, 16 * [None])
+        with self.assertRaises(Exception):
+            test_queue.dequeue_many(1)
+
+        test_queue = Queue(max_capacity=4, overflow="drop_oldest")
+        test_queue.enqueue_many(range(3))
+        test_queue.enqueue_many(range(3, 6))
+        self.assertEqual(test_queue.drain(), [2, 3, 4, 5])
+
+    def test_overflow_policies(self):
+        """Does a full queue raise, drop its oldest item or block?"""
+        test_queue = Queue(max_capacity=3)
+        for item in range(3):
+            test_queue.enqueue(item)
+        self.assertTrue(test_queue.is_full())
+        with self.assertRaises(Exception):
+            test_queue.enqueue(3)
+
+        test_queue = Queue(max_capacity=3, overflow="drop_oldest")
+        for item in range(5):
+            test_queue.enqueue(item)
+        self.assertEqual([test_queue.dequeue() for _ in range(3)], [2, 3, 4])
+
+        test_queue = Queue(max_capacity=2, overflow="block")
+        producer = Thread(target=lambda: [test_queue.enqueue(item)
+        for item in range(5)])
+        producer.start()
+        items = []
+        while len(items) < 5:
+            if not test_queue.is_empty():
+                items.append(test_queue.dequeue())
+            self.assertLessEqual(len(test_queue), 2)
+        producer.join()
+        self.assertEqual(items, list(range(5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
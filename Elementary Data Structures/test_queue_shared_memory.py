@@ -0,0 +1,82 @@
+from queue_shared_memory import SharedMemoryQueue
+from multiprocessing import Process
+import unittest
+
+def produce(test_queue, num_items):
+    """Enqueues num_items numbered items from a child process."""
+    for item in range(num_items):
+        test_queue.enqueue(item.to_bytes(4, "little") * (item % 7))
+    test_queue.close()
+
+class TestSharedMemoryQueue(unittest.TestCase):
+    """Tests for the SharedMemoryQueue class."""
+
+    def setUp(self):
+        self.queues = []
+
+    def tearDown(self):
+        for test_queue in self.queues:
+            test_queue.close()
+            test_queue.unlink()
+
+    def make_queue(self, **kwargs):
+        test_queue = SharedMemoryQueue(**kwargs)
+        self.queues.append(test_queue)
+        return test_queue
+
+    def test_wraparound(self):
+        """Are items of any size dequeued intact after wrapping around?"""
+        test_queue = self.make_queue(capacity=64)
+        for turn in range(20):
+            items = [bytes([turn]) * length for length in (0, 5, 13)]
+            for item in items:
+                self.assertTrue(test_queue.try_enqueue(item))
+            self.assertEqual([test_queue.dequeue() for _ in items], items)
+        self.assertTrue(test_queue.is_empty())
+        self.assertIsNone(test_queue.try_dequeue())
+
+        self.assertTrue(test_queue.try_enqueue(bytes(56)))
+        self.assertFalse(test_queue.try_enqueue(b"x"))
+        with self.assertRaises(TimeoutError):
+            test_queue.enqueue(b"x", timeout=0.01)
+
+    def test_fixed_size_records(self):
+        """Do fixed size records fill the ring without padding?"""
+        test_queue = self.make_queue(capacity=16, record_size=3)
+        for turn in range(10):
+            for item in (b"abc", b"def", b"ghi", b"jkl", b"mno"):
+                self.assertTrue(test_queue.try_enqueue(item))
+            self.assertFalse(test_queue.try_enqueue(b"pqr"))
+            self.assertEqual(b"".join(test_queue.dequeue() for _ in range(5)),
+            b"abcdefghijklmno")
+        with self.assertRaises(Exception):
+            test_queue.try_enqueue(b"ab")
+
+    def test_attach_after_traffic(self):
+        """Does a queue attached after items went through see it as empty?"""
+        test_queue = self.make_queue(capacity=64)
+        test_queue.enqueue(b"first")
+        self.assertEqual(test_queue.dequeue(), b"first")
+        consumer = SharedMemoryQueue(test_queue.name)
+        try:
+            self.assertIsNone(consumer.try_dequeue())
+            self.assertTrue(consumer.is_empty())
+            test_queue.enqueue(b"second")
+            self.assertEqual(consumer.try_dequeue(), b"second")
+            self.assertIsNone(consumer.try_dequeue())
+        finally:
+            consumer.close()
+
+    def test_between_processes(self):
+        """Does a child process hand items to its parent in order?"""
+        test_queue = self.make_queue(capacity=256)
+        producer = Process(target=produce, args=(test_queue, 2000))
+        producer.start()
+        for item in range(2000):
+            self.assertEqual(test_queue.dequeue(timeout=10),
+            item.to_bytes(4, "little") * (item % 7))
+        producer.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+from stack_array import Stack, np
+from array import array
+import unittest
+
+class TestArrayStack(unittest.TestCase):
+    """Tests for the typed array Stack class."""
+
+    def test_push_pop(self):
+        """Are items popped in LIFO order and checked against the type?"""
+        test_stack = Stack("q")
+        for item in range(5):
+            test_stack.push(item)
+        self.assertEqual(test_stack.top(), 4)
+        self.assertEqual(test_stack.pop(), 4)
+        self.assertEqual(test_stack.pop_many(2).tolist(), [3, 2])
+        self.assertEqual(len(test_stack), 2)
+        with self.assertRaises(TypeError):
+            test_stack.push("not an int")
+        self.assertEqual(test_stack.drain().tolist(), [1, 0])
+        with self.assertRaises(Exception):
+            test_stack.pop()
+
+    def test_buffers(self):
+        """Are buffers copied in and the items exported without copies?"""
+        test_stack = Stack("d")
+        test_stack.push_many(array("d", [1.0, 2.0]))
+        test_stack.push_many(array("f", [3.0]))
+        test_stack.push_many(range(4, 6))
+        view = test_stack.view()
+        self.assertEqual(view.tolist(), [1.0, 2.0, 3.0, 4.0, 5.0])
+        with self.assertRaises(BufferError):
+            test_stack.push(6.0)
+        view.release()
+        test_stack.push(6.0)
+
+        if np != None:
+            test_stack = Stack("q")
+            test_stack.push_many(np.arange(10, dtype=np.int64))
+            exported = test_stack.to_numpy()
+            self.assertEqual(exported.dtype, np.int64)
+            self.assertEqual(exported.sum(), 45)
+            test_stack.stack[0] = 100
+            self.assertEqual(exported[0], 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+from stack_list import Stack
+import unittest
+
+class TestStackList(unittest.TestCase):
+    """Tests for the list based Stack class."""
+
+    def test_batches(self):
+        """Do the batch operations keep LIFO order?"""
+        test_stack = Stack()
+        test_stack.push_many(range(5))
+        test_stack.push(5)
+        self.assertEqual(len(test_stack), 6)
+        self.assertEqual(test_stack.pop_many(2), [5, 4])
+        self.assertEqual(test_stack.pop_many(0), [])
+        self.assertEqual(test_stack.pop_many(-1), [])
+        self.assertEqual(test_stack.top(), 3)
+        with self.assertRaises(Exception):
+            test_stack.pop_many(5)
+        self.assertEqual(test_stack.drain(), [3, 2, 1, 0])
+        self.assertTrue(test_stack.is_empty())
+        self.assertEqual(test_stack.drain(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
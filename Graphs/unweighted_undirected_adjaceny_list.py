@@ -28,6 +28,9 @@ Space Complexity: O(|V| + |E|)
 class Vertex:
     """Implementation of a class to create vertices."""
 
+    # Fixed attributes instead of a per-vertex __dict__.
+    __slots__ = ("data", "adj_vertices")
+
     def __init__(self, data=None):
         """Create a vertex."""
         self.data = data
@@ -0,0 +1,93 @@
+"""
+Benchmarks the ConcurrentHashMap against the separate chaining HashMap behind a
+single global lock, with a growing number of threads.
+
+Every thread runs the same mix of operations (mostly get, some insert and
+remove) on its own range of keys, and the total throughput is reported.
+
+Usage: python benchmark_concurrent_hash_map.py [operations per thread]
+"""
+
+import random
+import sys
+import time
+from threading import Lock, Thread
+from concurrent_hash_map import ConcurrentHashMap
+from hash_map_separate_chaining import HashMap
+
+class GlobalLockHashMap():
+    """A separate chaining HashMap where every operation takes one lock."""
+
+    def __init__(self):
+        """Creates an empty hash map and its lock."""
+        self.hash_map = HashMap()
+        self.lock = Lock()
+
+    def insert(self, key, value):
+        """Inserts a key while holding the global lock."""
+        with self.lock:
+            self.hash_map.insert(key, value)
+
+    def get(self, key, default=None):
+        """Looks up a key while holding the global lock."""
+        with self.lock:
+            return self.hash_map.get(key, default)
+
+    def remove(self, key):
+        """Removes a key while holding the global lock."""
+        with self.lock:
+            self.hash_map.remove(key)
+
+def run_worker(hash_map, thread_id, num_operations):
+    """
+    Runs a mix of 80% get, 15% insert and 5% remove operations.
+    @param hash_map: The hash map to run the operations on.
+    @param thread_id: Used to seed the operations and pick the thread's keys.
+    @param num_operations: The number of operations to run.
+    """
+    rng = random.Random(thread_id)
+    base = thread_id * 1000000
+    for _ in range(num_operations):
+        key = base + rng.randrange(10000)
+        operation = rng.random()
+        if operation < 0.8:
+            hash_map.get(key)
+        elif operation < 0.95:
+            hash_map.insert(key, key)
+        else:
+            hash_map.remove(key)
+
+def benchmark(hash_map, num_threads, num_operations):
+    """
+    Runs run_worker on num_threads threads at once.
+    @param hash_map: The hash map shared by the threads.
+    @param num_threads: The number of threads.
+    @param num_operations: The number of operations each thread runs.
+    @return: The total number of operations per second.
+    """
+    threads = [Thread(target=run_worker, args=(hash_map, i, num_operations))
+    for i in range(num_threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return num_threads * num_operations / elapsed
+
+def main():
+    """Prints the throughput of both hash maps for 1 to 16 threads."""
+    num_operations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'on' if gil else 'off'}, "
+    f"{num_operations} operations per thread")
+    print(f"{'threads':>8} {'global lock':>14} {'striped':>14} {'speedup':>8}")
+    for num_threads in (1, 2, 4, 8, 16):
+        global_lock = benchmark(GlobalLockHashMap(), num_threads,
+        num_operations)
+        striped = benchmark(ConcurrentHashMap(), num_threads, num_operations)
+        print(f"{num_threads:>8} {global_lock:>10.0f} op/s {striped:>10.0f} "
+        f"op/s {striped / global_lock:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,479 @@
+"""
+A concurrent hash map is a hash map that can be shared between threads.
+
+Concurrent Hash Map Operations:
+1. insert(key, value), setdefault(key, default): Add a (key, value) pair while
+holding the lock of the key's stripe.
+2. remove(key), pop(key, default): Remove a key while holding the lock of the
+key's stripe.
+3. find(key), get(key, default), items(): Read without taking any lock.
+4. insert_many(keys, values), find_many(keys), remove_many(keys): Batch
+versions of insert, find and remove.
+5. resize(new_num_slots): Resizes the array while holding every stripe lock.
+6. size(): Returns the number of (key, value) pairs, summed over the stripes.
+The rest of the HashMap API (update, hash_map[key], key in hash_map, ...) is
+built on the operations above.
+"""
+
+"""
+Concurrent Hash Map Time-Complexity (expected):
+1. find(x): O(1)
+2. insert(x): O(1)
+3. remove(x): O(1)
+4. size(): O(s), where s is the number of stripes
+5. resize(): 0(n)
+"""
+
+from itertools import repeat
+from threading import Lock
+from time import perf_counter
+from hash_functions import hash_many
+from hash_map_separate_chaining import HashMap, MISSING
+
+class ConcurrentHashMap(HashMap):
+    """
+    Implementation of a thread safe hash map built on the separate chaining
+    HashMap.
+    Hash Function: Static hashing, using the division method unless another
+    hash strategy is given.
+    Collision Resolution Strategy: Closed Addressing with Separate Chaining
+    Synchronization: Lock striping. The buckets are split into num_stripes
+    contiguous ranges, each guarded by its own lock.
+    """
+
+    def __init__(self, num_slots=11, load_factor=0.75,
+    hash_strategy="division", seed=0, min_load_factor=None, num_stripes=16):
+        """
+        Creates an empty concurrent hash map.
+        @param num_slots: Number of slots (ideally a prime number) to initialize
+        the hash map with.
+        @param load_factor: The maximum accepted ratio of entries to slots
+        acceptable until resizing and rehashing into a larger arrary occurs.
+        @param hash_strategy: The name of a hash function from hash_functions,
+        or a callable taking a key and returning its full hash.
+        @param seed: The seed of the hash function.
+        @param min_load_factor: The ratio of entries to slots below which
+        removing keys shrinks the array.
+        @param num_stripes: The number of locks the buckets are split between.
+        """
+        self.num_stripes = num_stripes
+        self.stripe_locks = [Lock() for _ in range(num_stripes)]
+        # Each stripe counts its own entries and filled buckets, so writers
+        # never update a counter shared with other stripes.
+        self.stripe_entries = num_stripes * [0]
+        self.stripe_buckets_filled = num_stripes * [0]
+        super().__init__(num_slots, load_factor, hash_strategy, seed,
+        min_load_factor=min_load_factor)
+
+    @property
+    def num_entries(self):
+        """The number of entries, summed over the stripes."""
+        return sum(self.stripe_entries)
+
+    @num_entries.setter
+    def num_entries(self, num_entries):
+        self.stripe_entries = self.num_stripes * [0]
+        self.stripe_entries[0] = num_entries
+
+    @property
+    def buckets_filled(self):
+        """The number of non-empty buckets, summed over the stripes."""
+        return sum(self.stripe_buckets_filled)
+
+    @buckets_filled.setter
+    def buckets_filled(self, buckets_filled):
+        self.stripe_buckets_filled = self.num_stripes * [0]
+        self.stripe_buckets_filled[0] = buckets_filled
+
+    def insert(self, key, value):
+        """
+        Inserts a key into the hash map. If the key already exists, its value is
+        overwritten. Only the stripe of the key's bucket is locked. If the load
+        factor is too high afterwards, the hash map is resized.
+        @param key: Value used to hash an index to store this value at.
+        @param value: value associated with the given key.
+        """
+        key_hash = self.hasher(key)
+        stripe = self.lock_stripe(key_hash)
+        try:
+            self.insert_entry(key, value, key_hash)
+        finally:
+            self.stripe_locks[stripe].release()
+
+        if not self.load_factor_in_range():
+            self.grow()
+
+    def insert_many(self, keys, values):
+        """
+        Inserts a batch of (key, value) pairs. The array is resized at most once
+        up front, then every pair is inserted under the lock of its stripe.
+        @param keys: The keys to insert. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        @param values: The values associated with the keys, in the same order.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        self.reserve(self.num_entries + len(keys))
+        for key, value, key_hash in zip(keys, values, key_hashes):
+            stripe = self.lock_stripe(key_hash)
+            try:
+                self.insert_entry(key, value, key_hash)
+            finally:
+                self.stripe_locks[stripe].release()
+
+        if not self.load_factor_in_range():
+            self.grow()
+
+    def insert_entry(self, key, value, key_hash, overwrite=True):
+        """
+        Stores a (key, value) pair in a single scan of the key's bucket. The
+        lock of the bucket's stripe must be held.
+        @param key: The key to store.
+        @param value: value associated with the given key.
+        @param key_hash: The full hash of key.
+        @param overwrite: Whether to replace the value if the key already
+        exists.
+        @return: The value previously associated with key, MISSING if the key
+        was not in the hash map.
+        """
+        index = key_hash % self.num_slots
+        bucket = self.hash_map[index]
+        for position, kvp in enumerate(bucket):
+            if kvp[2] == key_hash and kvp[0] == key:
+                if overwrite:
+                    # Replacing the tuple is a single store, so readers see
+                    # either the old or the new pair.
+                    bucket[position] = (key, value, key_hash)
+                return kvp[1]
+
+        stripe = self.stripe(index, self.num_slots)
+        if len(bucket) == 0:
+            self.stripe_buckets_filled[stripe] += 1
+        bucket.append((key, value, key_hash))
+        self.stripe_entries[stripe] += 1
+        return MISSING
+
+    def find(self, key, value=MISSING):
+        """
+        Searches for a key within the hash map without taking any lock.
+        @param key: Key to search for within the hash map.
+        @param value: If given, the key only counts as found when it is
+        associated with this value.
+        @return: True if the key is in the hash map, false otherwise.
+        """
+        kvp = self.lookup(key, self.hasher(key))
+        return kvp != None and (value is MISSING or kvp[1] == value)
+
+    def find_many(self, keys, values=None):
+        """
+        Searches for a batch of keys without taking any lock.
+        @param keys: The keys to search for. A NumPy array of integer keys is
+        hashed in one vectorised operation.
+        @param values: If given, the values the keys must be associated with,
+        in the same order.
+        @return: A list holding True for every key in the hash map, false
+        otherwise.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        if values is None:
+            values = repeat(MISSING)
+
+        results = []
+        for key, value, key_hash in zip(keys, values, key_hashes):
+            kvp = self.lookup(key, key_hash)
+            results.append(kvp != None and (value is MISSING or
+            kvp[1] == value))
+        return results
+
+    def get(self, key, default=None):
+        """
+        Looks up the value associated with a key without taking any lock.
+        @param key: The key to look up.
+        @param default: The value to return if the key is not in the hash map.
+        @return: The value associated with key, or default.
+        """
+        kvp = self.lookup(key, self.hasher(key))
+        if kvp == None:
+            return default
+        return kvp[1]
+
+    def lookup(self, key, key_hash):
+        """
+        Searches a snapshot of the key's bucket. Reading the array reference
+        once and copying the bucket with a slice are each atomic under the GIL,
+        so the search never sees a half resized array or a bucket being
+        modified.
+        @param key: Key to search for.
+        @param key_hash: The full hash of key.
+        @return: The (key, value, key_hash) entry, None if the key is not in the
+        hash map.
+        """
+        hash_map = self.hash_map
+        for kvp in hash_map[key_hash % len(hash_map)][:]:
+            if kvp[2] == key_hash and kvp[0] == key:
+                return kvp
+        return None
+
+    def setdefault(self, key, default=None):
+        """
+        Looks up the value associated with a key, inserting the key with a
+        default value if it is not in the hash map. The lookup and the insert
+        happen under the same lock, so only one thread's default is stored.
+        @param key: The key to look up.
+        @param default: The value to insert if the key is not in the hash map.
+        @return: The value associated with key.
+        """
+        key_hash = self.hasher(key)
+        stripe = self.lock_stripe(key_hash)
+        try:
+            previous = self.insert_entry(key, default, key_hash,
+            overwrite=False)
+        finally:
+            self.stripe_locks[stripe].release()
+
+        if previous is not MISSING:
+            return previous
+        if not self.load_factor_in_range():
+            self.grow()
+        return default
+
+    def remove(self, key, value=MISSING):
+        """
+        Removes a key from the hash map. Only the stripe of the key's bucket is
+        locked.
+        @param key: The key to remove.
+        @param value: If given, the key is only removed when it is associated
+        with this value.
+        """
+        key_hash = self.hasher(key)
+        stripe = self.lock_stripe(key_hash)
+        try:
+            self.remove_entry(key, value, key_hash)
+        finally:
+            self.stripe_locks[stripe].release()
+        self.shrink_if_sparse()
+
+    def remove_many(self, keys, values=None):
+        """
+        Removes a batch of keys from the hash map, each under the lock of its
+        stripe.
+        @param keys: The keys to remove. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        @param values: If given, the values the keys must be associated with to
+        be removed, in the same order.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        if values is None:
+            values = repeat(MISSING)
+
+        for key, value, key_hash in zip(keys, values, key_hashes):
+            stripe = self.lock_stripe(key_hash)
+            try:
+                self.remove_entry(key, value, key_hash)
+            finally:
+                self.stripe_locks[stripe].release()
+        self.shrink_if_sparse()
+
+    def pop(self, key, default=MISSING):
+        """
+        Removes a key from the hash map and returns its value.
+        @param key: The key to remove.
+        @param default: The value to return if the key is not in the hash map.
+        @return: The value that was associated with key, or default.
+        """
+        key_hash = self.hasher(key)
+        stripe = self.lock_stripe(key_hash)
+        try:
+            previous = self.remove_entry(key, MISSING, key_hash)
+        finally:
+            self.stripe_locks[stripe].release()
+
+        if previous is not MISSING:
+            self.shrink_if_sparse()
+            return previous
+        if default is MISSING:
+            raise KeyError(key)
+        return default
+
+    def remove_entry(self, key, value, key_hash):
+        """
+        Deletes a key from its bucket. The lock of the bucket's stripe must be
+        held.
+        @param key: The key to remove.
+        @param value: The value the key must be associated with, or MISSING to
+        remove the key whatever its value.
+        @param key_hash: The full hash of key.
+        @return: The value that was removed, MISSING if nothing was removed.
+        """
+        index = key_hash % self.num_slots
+        bucket = self.hash_map[index]
+        for position, kvp in enumerate(bucket):
+            if kvp[2] == key_hash and kvp[0] == key:
+                if value is not MISSING and kvp[1] != value:
+                    return MISSING
+                del bucket[position]
+
+                stripe = self.stripe(index, self.num_slots)
+                self.stripe_entries[stripe] -= 1
+                if len(bucket) == 0:
+                    self.stripe_buckets_filled[stripe] -= 1
+                return kvp[1]
+        return MISSING
+
+    def items(self):
+        """
+        Iterates over the entries of the hash map without taking any lock. The
+        iteration is weakly consistent: every entry present for the whole
+        iteration is returned once, entries inserted or removed meanwhile may or
+        may not be.
+        @return: A generator of (key, value) pairs.
+        """
+        for bucket in self.hash_map:
+            for kvp in bucket[:]:
+                yield kvp[0], kvp[1]
+
+    def stripe(self, index, num_slots):
+        """
+        Finds the stripe covering a bucket.
+        @param index: The index of the bucket.
+        @param num_slots: The size of the array the index is into.
+        @return: The index of the stripe's lock.
+        """
+        return index * self.num_stripes // num_slots
+
+    def lock_stripe(self, key_hash):
+        """
+        Acquires the lock of the stripe covering a key's bucket. If the array
+        was resized while waiting for the lock, the bucket may now belong to a
+        different stripe, so the lock is released and the stripe looked up
+        again.
+        @param key_hash: The full hash of the key.
+        @return: The index of the stripe whose lock is now held.
+        """
+        while True:
+            num_slots = self.num_slots
+            stripe = self.stripe(key_hash % num_slots, num_slots)
+            self.stripe_locks[stripe].acquire()
+            # num_slots only changes while every lock is held.
+            if self.num_slots == num_slots:
+                return stripe
+            self.stripe_locks[stripe].release()
+
+    def lock_all_stripes(self):
+        """Acquires every stripe lock, always in the same order."""
+        for lock in self.stripe_locks:
+            lock.acquire()
+
+    def unlock_all_stripes(self):
+        """Releases every stripe lock."""
+        for lock in reversed(self.stripe_locks):
+            lock.release()
+
+    def grow(self):
+        """
+        Grows the array once the load factor is surpassed. Several threads may
+        see the load factor surpassed at once, so it is checked again once all
+        stripes are locked and only the first of them resizes.
+        """
+        self.lock_all_stripes()
+        try:
+            if not self.load_factor_in_range():
+                # Often a prime number.
+                self.start_resize(2 * len(self.hash_map) - 1)
+        finally:
+            self.unlock_all_stripes()
+
+    def shrink_if_sparse(self):
+        """
+        Shrinks the array once removals take the load factor below
+        min_load_factor. The condition is checked without locks first, since
+        it rarely holds, and again once all stripes are locked.
+        """
+        if (self.num_slots <= self.min_num_slots or
+        self.num_entries / self.num_slots >= self.min_load_factor):
+            return
+        self.lock_all_stripes()
+        try:
+            super().shrink_if_sparse()
+        finally:
+            self.unlock_all_stripes()
+
+    def resize(self, new_num_slots):
+        """
+        Resizes the array while holding every stripe lock.
+        @param new_num_slots: Size to resize the array to (ideally a prime
+        number).
+        """
+        self.lock_all_stripes()
+        try:
+            self.start_resize(new_num_slots)
+        finally:
+            self.unlock_all_stripes()
+
+    def start_resize(self, new_num_slots):
+        """
+        Rebuilds the array. Every stripe lock must be held. The new array is
+        filled before it replaces the old one, so lock-free readers always see
+        a complete array, and the stripe counters are recounted since buckets
+        move between stripes.
+        @param new_num_slots: Size to resize the array to (ideally a prime
+        number).
+        """
+        start = perf_counter()
+        hash_map = [[] for _ in range(new_num_slots)]
+        stripe_entries = self.num_stripes * [0]
+        stripe_buckets_filled = self.num_stripes * [0]
+
+        for bucket in self.hash_map:
+            for kvp in bucket:
+                index = kvp[2] % new_num_slots
+                stripe = self.stripe(index, new_num_slots)
+                if len(hash_map[index]) == 0:
+                    stripe_buckets_filled[stripe] += 1
+                hash_map[index].append(kvp)
+                stripe_entries[stripe] += 1
+
+        self.stripe_entries = stripe_entries
+        self.stripe_buckets_filled = stripe_buckets_filled
+        self.hash_map = hash_map
+        self.num_slots = new_num_slots
+        self.num_resizes += 1
+        self.resize_time += perf_counter() - start
+
+"""
+Notes:
+
+Lock Striping:
+- A single lock around the whole hash map lets only one thread use it at a
+time. Lock striping splits the buckets into num_stripes contiguous ranges, each
+with its own lock, so threads working on keys in different stripes never wait
+for each other.
+- Every write locks only the stripe of the key's bucket. The number of entries
+and filled buckets are counted per stripe, so writers in different stripes
+never update the same counter.
+- Like java.util.concurrent.ConcurrentHashMap, which this design follows, the
+entry count is only summed when it is needed.
+
+Resizing:
+- Resizing moves entries between stripes, so it locks every stripe, always in
+the same order to avoid deadlocks. A writer never holds its stripe lock while
+resizing, it releases it first.
+- A writer that was waiting for its stripe lock during a resize may have locked
+the wrong stripe for the new array, so it checks num_slots again after
+acquiring the lock and retries if it changed.
+
+Lock-Free Reads:
+- find, get and items take no lock. They read the array reference once and copy
+the key's bucket with a slice. Under the GIL both are atomic, and writers only
+change buckets with single list operations (append, del, or replacing a tuple),
+so a reader always sees a consistent bucket, either before or after any write.
+- A resize fills the new array completely before publishing it, so a reader
+holding the old array still finds every entry in it.
+- These guarantees rely on the GIL. On a free-threaded build of Python, the
+reads would need to lock the stripe as well.
+
+Scaling:
+- Under the GIL, only one thread runs Python code at a time, so striping mostly
+removes lock contention (threads queueing on one lock and being woken up)
+rather than letting threads run in parallel. benchmark_concurrent_hash_map.py
+compares it against a single global lock.
+"""
@@ -0,0 +1,632 @@
+"""
+A membership filter is a probabilistic implementation of the Set ADT. It uses a
+small fraction of the memory of a hash table but may answer that a key is in the
+set when it is not (a false positive). It never answers that a key is missing
+when it was inserted (no false negatives).
+
+Filter Operations:
+1. insert(key): Adds key to the filter.
+2. find(key): Returns false if key is definitely not in the filter, true if it
+probably is.
+3. remove(key): Removes key from the filter (counting Bloom and cuckoo filters
+only).
+4. insert_many(keys), find_many(keys): Batch versions of insert and find.
+5. size(): Returns the number of keys inserted.
+6. false_positive_rate(): Estimates the current false positive rate.
+"""
+
+"""
+Filter Time-Complexity:
+1. find(x): O(k) for Bloom filters, where k is the number of hash functions.
+O(1) for the cuckoo filter (two buckets are probed).
+2. insert(x): O(k) for Bloom filters, O(1) expected for the cuckoo filter.
+3. remove(x): O(k) for the counting Bloom filter, O(1) for the cuckoo filter.
+"""
+
+import math
+import random
+from array import array
+from hash_functions import get_hash_function, hash_many, mix_64
+from hash_table_separate_chaining import HashTable
+
+class BloomFilter():
+    """
+    Implementation of a Bloom filter over a bit array.
+    Hash Function: k bit positions derived from one 64 bit hash of the key with
+    double hashing (h1 + i * h2).
+    """
+
+    def __init__(self, capacity, false_positive_rate=0.01,
+    hash_strategy="python", seed=0):
+        """
+        Creates an empty Bloom filter sized for a number of keys.
+        @param capacity: The number of keys the filter is sized for.
+        @param false_positive_rate: The false positive rate the filter should
+        have once capacity keys are inserted.
+        @param hash_strategy: The name of a hash function from hash_functions,
+        or a callable taking a key and returning its full hash.
+        @param seed: The seed of the hash function.
+        """
+        if capacity < 1 or not 0 < false_positive_rate < 1:
+            raise Exception("Error: The capacity must be positive and the "
+            "false positive rate between 0 and 1.")
+        # The optimal sizes: m = -n ln(p) / ln(2)^2 bits and k = m / n ln(2).
+        self.num_bits = max(8, math.ceil(-capacity *
+        math.log(false_positive_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.capacity = capacity
+        self.num_entries = 0
+        self.hash_strategy = hash_strategy
+        self.seed = seed
+        self.hasher = get_hash_function(hash_strategy, seed)
+
+    def positions(self, key_hash):
+        """
+        Computes the positions of a key in the array.
+        @param key_hash: The full hash of the key.
+        @return: A list of num_hashes positions.
+        """
+        # Mixing first gives well spread bits even for the division strategy.
+        key_hash = mix_64(key_hash)
+        h1 = key_hash & 0xFFFFFFFF
+        # An odd step never gets stuck on a subset of the positions.
+        h2 = (key_hash >> 32) | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def insert(self, key):
+        """
+        Adds a key to the filter.
+        @param key: The key to add.
+        """
+        self.insert_hash(self.hasher(key))
+
+    def insert_many(self, keys):
+        """
+        Adds a batch of keys to the filter.
+        @param keys: The keys to add. A NumPy array of integer keys is hashed in
+        one vectorised operation.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        for key_hash in key_hashes:
+            self.insert_hash(key_hash)
+
+    def insert_hash(self, key_hash):
+        """
+        Sets the bits of a key.
+        @param key_hash: The full hash of the key.
+        """
+        for position in self.positions(key_hash):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.num_entries += 1
+
+    def find(self, key):
+        """
+        Checks whether a key may be in the filter.
+        @param key: The key to check.
+        @return: False if key was never inserted, true if it probably was.
+        """
+        return self.find_hash(self.hasher(key))
+
+    def find_many(self, keys):
+        """
+        Checks a batch of keys.
+        @param keys: The keys to check. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        @return: A list holding the result of find for every key.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        return [self.find_hash(key_hash) for key_hash in key_hashes]
+
+    def find_hash(self, key_hash):
+        """
+        Checks the bits of a key.
+        @param key_hash: The full hash of the key.
+        @return: True if every bit of the key is set, false otherwise.
+        """
+        for position in self.positions(key_hash):
+            if not self.bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def false_positive_rate(self):
+        """
+        Estimates the false positive rate for the keys inserted so far.
+        @return: (1 - e^(-kn/m))^k.
+        """
+        return (1 - math.exp(-self.num_hashes * self.num_entries /
+        self.num_bits)) ** self.num_hashes
+
+    def size(self):
+        """
+        Checks to see the number of keys inserted.
+        @return: Number of keys inserted into the filter.
+        """
+        return self.num_entries
+
+    def __contains__(self, key):
+        """Checks key in filter."""
+        return self.find(key)
+
+    def __len__(self):
+        """Returns len(filter)."""
+        return self.num_entries
+
+class CountingBloomFilter(BloomFilter):
+    """
+    Implementation of a counting Bloom filter, which replaces every bit by an 8
+    bit counter so keys can be removed.
+    Hash Function: Same as BloomFilter.
+    """
+
+    def __init__(self, capacity, false_positive_rate=0.01,
+    hash_strategy="python", seed=0):
+        """
+        Creates an empty counting Bloom filter sized for a number of keys.
+        @param capacity: The number of keys the filter is sized for.
+        @param false_positive_rate: The false positive rate the filter should
+        have once capacity keys are inserted.
+        @param hash_strategy: The name of a hash function from hash_functions,
+        or a callable taking a key and returning its full hash.
+        @param seed: The seed of the hash function.
+        """
+        super().__init__(capacity, false_positive_rate, hash_strategy, seed)
+        # The counters replace the bit array.
+        self.bits = None
+        self.counters = bytearray(self.num_bits)
+
+    def insert_hash(self, key_hash):
+        """
+        Increments the counters of a key. A counter that reaches 255 stays
+        there for good, since it can no longer tell how many keys share it.
+        @param key_hash: The full hash of the key.
+        """
+        for position in self.positions(key_hash):
+            if self.counters[position] < 255:
+                self.counters[position] += 1
+        self.num_entries += 1
+
+    def find_hash(self, key_hash):
+        """
+        Checks the counters of a key.
+        @param key_hash: The full hash of the key.
+        @return: True if every counter of the key is non-zero, false otherwise.
+        """
+        for position in self.positions(key_hash):
+            if self.counters[position] == 0:
+                return False
+        return True
+
+    def remove(self, key):
+        """
+        Removes a key from the filter. Only keys that were inserted should be
+        removed, otherwise the counters of other keys are decremented and
+        false negatives become possible.
+        @param key: The key to remove.
+        """
+        key_hash = self.hasher(key)
+        if not self.find_hash(key_hash):
+            return
+        for position in self.positions(key_hash):
+            if self.counters[position] < 255:
+                self.counters[position] -= 1
+        self.num_entries -= 1
+
+class CuckooFilter():
+    """
+    Implementation of a cuckoo filter, which stores a short fingerprint of every
+    key in a cuckoo hash table with 4 slot buckets.
+    Hash Function: Partial-key cuckoo hashing. The second bucket of a key is
+    its first bucket XOR the hash of its fingerprint, so either bucket can be
+    found from the other and the fingerprint alone.
+    """
+
+    def __init__(self, capacity, false_positive_rate=0.01, bucket_size=4,
+    max_kicks=500, hash_strategy="python", seed=0):
+        """
+        Creates an empty cuckoo filter sized for a number of keys.
+        @param capacity: The number of keys the filter is sized for.
+        @param false_positive_rate: The false positive rate the filter should
+        have once capacity keys are inserted.
+        @param bucket_size: The number of fingerprints in each bucket.
+        @param max_kicks: The number of fingerprints an insert may kick out
+        before the filter is considered full.
+        @param hash_strategy: The name of a hash function from hash_functions,
+        or a callable taking a key and returning its full hash.
+        @param seed: The seed of the hash function.
+        """
+        if capacity < 1 or not 0 < false_positive_rate < 1:
+            raise Exception("Error: The capacity must be positive and the "
+            "false positive rate between 0 and 1.")
+        # A lookup compares 2 * bucket_size fingerprints, each matching by
+        # chance with probability 1 / 2^f.
+        self.fingerprint_bits = min(32, math.ceil(math.log2(2 * bucket_size /
+        false_positive_rate)))
+        # XORing bucket indices needs a power of two number of buckets. Cuckoo
+        # filters with 4 slot buckets fill up to about 95%.
+        num_buckets = 1
+        while num_buckets * bucket_size * 0.95 < capacity:
+            num_buckets *= 2
+        self.num_buckets = num_buckets
+        self.bucket_size = bucket_size
+        # The smallest unsigned type that holds a fingerprint. 0 marks an empty
+        # slot, so fingerprints are never 0.
+        typecode = next(code for code in "BHIL"
+        if 8 * array(code).itemsize >= self.fingerprint_bits)
+        self.slots = array(typecode, [0]) * (num_buckets * bucket_size)
+        self.max_kicks = max_kicks
+        self.capacity = capacity
+        self.num_entries = 0
+        # Fingerprint that could not be placed once the filter filled up.
+        self.victim = None
+        self.hash_strategy = hash_strategy
+        self.seed = seed
+        self.hasher = get_hash_function(hash_strategy, seed)
+        self.rng = random.Random(seed)
+
+    def locate(self, key_hash):
+        """
+        Computes the fingerprint and the two buckets of a key.
+        @param key_hash: The full hash of the key.
+        @return: A tuple (fingerprint, bucket, other_bucket).
+        """
+        key_hash = mix_64(key_hash)
+        fingerprint = (key_hash >> 32) & ((1 << self.fingerprint_bits) - 1)
+        if fingerprint == 0:
+            fingerprint = 1
+        bucket = key_hash & (self.num_buckets - 1)
+        return fingerprint, bucket, self.other_bucket(bucket, fingerprint)
+
+    def other_bucket(self, bucket, fingerprint):
+        """
+        Computes the alternate bucket of a fingerprint.
+        @param bucket: One of the fingerprint's buckets.
+        @param fingerprint: The fingerprint.
+        @return: The fingerprint's other bucket.
+        """
+        return (bucket ^ mix_64(fingerprint)) & (self.num_buckets - 1)
+
+    def insert(self, key):
+        """
+        Adds a key to the filter. Inserting the same key twice stores its
+        fingerprint twice.
+        @param key: The key to add.
+        """
+        self.insert_hash(self.hasher(key))
+
+    def insert_many(self, keys):
+        """
+        Adds a batch of keys to the filter.
+        @param keys: The keys to add. A NumPy array of integer keys is hashed in
+        one vectorised operation.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        for key_hash in key_hashes:
+            self.insert_hash(key_hash)
+
+    def insert_hash(self, key_hash):
+        """
+        Stores the fingerprint of a key in a free slot of one of its buckets,
+        kicking fingerprints out to their other bucket if both are full.
+        @param key_hash: The full hash of the key.
+        """
+        if self.victim != None:
+            raise Exception("Error: Cuckoo filter is full.")
+        fingerprint, bucket, other_bucket = self.locate(key_hash)
+        self.num_entries += 1
+        if self.store(bucket, fingerprint) or \
+        self.store(other_bucket, fingerprint):
+            return
+
+        bucket = self.rng.choice((bucket, other_bucket))
+        for _ in range(self.max_kicks):
+            slot = bucket * self.bucket_size + \
+            self.rng.randrange(self.bucket_size)
+            fingerprint, self.slots[slot] = self.slots[slot], fingerprint
+            bucket = self.other_bucket(bucket, fingerprint)
+            if self.store(bucket, fingerprint):
+                return
+        # Keeping the last fingerprint aside avoids a false negative for the
+        # key it belongs to.
+        self.victim = (fingerprint, bucket)
+
+    def store(self, bucket, fingerprint):
+        """
+        Stores a fingerprint in the first free slot of a bucket.
+        @param bucket: The bucket to store the fingerprint in.
+        @param fingerprint: The fingerprint to store.
+        @return: True if the fingerprint was stored, false if the bucket is
+        full.
+        """
+        start = bucket * self.bucket_size
+        for slot in range(start, start + self.bucket_size):
+            if self.slots[slot] == 0:
+                self.slots[slot] = fingerprint
+                return True
+        return False
+
+    def find(self, key):
+        """
+        Checks whether a key may be in the filter.
+        @param key: The key to check.
+        @return: False if key was never inserted, true if it probably was.
+        """
+        return self.find_hash(self.hasher(key))
+
+    def find_many(self, keys):
+        """
+        Checks a batch of keys.
+        @param keys: The keys to check. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        @return: A list holding the result of find for every key.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        return [self.find_hash(key_hash) for key_hash in key_hashes]
+
+    def find_hash(self, key_hash):
+        """
+        Looks for the fingerprint of a key in its two buckets.
+        @param key_hash: The full hash of the key.
+        @return: True if the fingerprint is found, false otherwise.
+        """
+        located = self.locate(key_hash)
+        return self.find_slot(*located) != None or \
+        self.victim_matches(*located)
+
+    def find_slot(self, fingerprint, bucket, other_bucket):
+        """
+        Searches two buckets for a fingerprint.
+        @param fingerprint: The fingerprint to search for.
+        @param bucket: One of the fingerprint's buckets.
+        @param other_bucket: The fingerprint's other bucket.
+        @return: The index of a slot holding fingerprint, None if there is none.
+        """
+        for start in (bucket * self.bucket_size,
+        other_bucket * self.bucket_size):
+            for slot in range(start, start + self.bucket_size):
+                if self.slots[slot] == fingerprint:
+                    return slot
+        return None
+
+    def victim_matches(self, fingerprint, bucket, other_bucket):
+        """
+        Checks whether the fingerprint set aside when the filter filled up
+        belongs to a key.
+        @param fingerprint: The fingerprint of the key.
+        @param bucket: One of the key's buckets.
+        @param other_bucket: The key's other bucket.
+        @return: True if the victim has this fingerprint and one of these
+        buckets.
+        """
+        return self.victim != None and self.victim[0] == fingerprint and \
+        self.victim[1] in (bucket, other_bucket)
+
+    def remove(self, key):
+        """
+        Removes one copy of a key's fingerprint. Only keys that were inserted
+        should be removed, otherwise the fingerprint of another key may be
+        removed instead and false negatives become possible.
+        @param key: The key to remove.
+        """
+        located = self.locate(self.hasher(key))
+        slot = self.find_slot(*located)
+        if slot != None:
+            self.slots[slot] = 0
+            self.num_entries -= 1
+            if self.victim != None:
+                # The freed slot may take the fingerprint set aside.
+                fingerprint, bucket = self.victim
+                self.victim = None
+                self.num_entries -= 1
+                self.insert_fingerprint(fingerprint, bucket)
+        elif self.victim_matches(*located):
+            self.victim = None
+            self.num_entries -= 1
+
+    def insert_fingerprint(self, fingerprint, bucket):
+        """
+        Stores a fingerprint whose bucket is known, used to place the victim
+        again.
+        @param fingerprint: The fingerprint to store.
+        @param bucket: One of the fingerprint's buckets.
+        """
+        self.num_entries += 1
+        if not self.store(bucket, fingerprint) and not self.store(
+        self.other_bucket(bucket, fingerprint), fingerprint):
+            self.victim = (fingerprint, bucket)
+
+    def false_positive_rate(self):
+        """
+        Estimates the false positive rate for the keys inserted so far.
+        @return: The chance that one of the fingerprints in a key's two buckets
+        matches the key's fingerprint by accident.
+        """
+        occupancy = self.num_entries / len(self.slots)
+        return 1 - (1 - 2 ** -self.fingerprint_bits) ** (2 * self.bucket_size *
+        occupancy)
+
+    def size(self):
+        """
+        Checks to see the number of keys inserted.
+        @return: Number of keys inserted into the filter.
+        """
+        return self.num_entries
+
+    def __contains__(self, key):
+        """Checks key in filter."""
+        return self.find(key)
+
+    def __len__(self):
+        """Returns len(filter)."""
+        return self.num_entries
+
+class FilteredHashTable():
+    """
+    A hash table fronted by a membership filter. Keys the filter rules out are
+    answered without touching the hash table.
+    """
+
+    def __init__(self, capacity, false_positive_rate=0.01, hash_table=None,
+    membership_filter=None):
+        """
+        Creates an empty filtered hash table.
+        @param capacity: The number of keys the default filter is sized for.
+        @param false_positive_rate: The false positive rate of the default
+        filter.
+        @param hash_table: The hash table holding the keys, a separate chaining
+        HashTable by default. Any object with insert, find and remove works.
+        @param membership_filter: The filter, a CuckooFilter by default. A plain
+        BloomFilter cannot remove keys, so removed keys keep passing the filter
+        (they are still not found in the hash table). Once it fills up, it is
+        replaced by a filter of the same class and twice the capacity.
+        """
+        if hash_table == None:
+            hash_table = HashTable()
+        if membership_filter == None:
+            membership_filter = CuckooFilter(capacity, false_positive_rate)
+        self.hash_table = hash_table
+        # None once the filter filled up and could not be rebuilt, every
+        # lookup then goes to the hash table.
+        self.filter = membership_filter
+        self.false_positive_rate = false_positive_rate
+        # Lookups answered by the filter alone.
+        self.num_filtered = 0
+
+    def insert(self, key):
+        """
+        Inserts a key into the filter and then the hash table. A filter that
+        is full is grown first, so that every key in the hash table passes it.
+        @param key: The key to insert.
+        """
+        if self.hash_table.find(key):
+            return
+        if self.filter != None and self.filter.size() >= self.filter.capacity:
+            self.grow_filter()
+        if self.filter != None:
+            try:
+                self.filter.insert(key)
+            except Exception:
+                # A cuckoo filter may fill up before reaching its capacity.
+                self.grow_filter()
+                if self.filter != None:
+                    self.filter.insert(key)
+        self.hash_table.insert(key)
+
+    def grow_filter(self):
+        """
+        Replaces the filter with one of twice its capacity holding every key of
+        the hash table, keeping the hash strategy, seed and bucket settings of
+        the old filter. If the hash table cannot list its keys, the filter is
+        dropped and lookups go straight to the hash table.
+        """
+        if not hasattr(self.hash_table, "keys"):
+            self.filter = None
+            return
+        settings = {"hash_strategy": self.filter.hash_strategy,
+        "seed": self.filter.seed}
+        if isinstance(self.filter, CuckooFilter):
+            settings["bucket_size"] = self.filter.bucket_size
+            settings["max_kicks"] = self.filter.max_kicks
+        membership_filter = type(self.filter)(2 * self.filter.capacity,
+        self.false_positive_rate, **settings)
+        membership_filter.insert_many(self.hash_table.keys())
+        self.filter = membership_filter
+
+    def insert_many(self, keys):
+        """
+        Inserts a batch of keys.
+        @param keys: The keys to insert.
+        """
+        for key in keys:
+            self.insert(key)
+
+    def find(self, key):
+        """
+        Searches for a key, only asking the hash table if the filter does not
+        rule the key out.
+        @param key: The key to search for.
+        @return: True if the key is in the hash table, false otherwise.
+        """
+        if self.filter != None and not self.filter.find(key):
+            self.num_filtered += 1
+            return False
+        return self.hash_table.find(key)
+
+    def find_many(self, keys):
+        """
+        Searches for a batch of keys. The whole batch goes through the filter
+        first and only the keys that pass it are looked up in the hash table.
+        @param keys: The keys to search for.
+        @return: A list holding True for every key in the hash table, false
+        otherwise.
+        """
+        keys = list(keys)
+        if self.filter == None:
+            return [self.hash_table.find(key) for key in keys]
+        passed = self.filter.find_many(keys)
+        self.num_filtered += passed.count(False)
+        return [passes and self.hash_table.find(key)
+        for key, passes in zip(keys, passed)]
+
+    def remove(self, key):
+        """
+        Removes a key from the hash table and the filter.
+        @param key: The key to remove.
+        """
+        if self.hash_table.find(key):
+            self.hash_table.remove(key)
+            if self.filter != None and hasattr(self.filter, "remove"):
+                self.filter.remove(key)
+
+    def size(self):
+        """
+        Checks to see the number of keys in the hash table.
+        @return: Number of keys within the hash table.
+        """
+        return self.hash_table.size()
+
+    def __contains__(self, key):
+        """Checks key in filtered_hash_table."""
+        return self.find(key)
+
+    def __len__(self):
+        """Returns len(filtered_hash_table)."""
+        return self.size()
+
+"""
+Notes:
+
+Bloom Filter:
+- An array of m bits and k hash functions. Inserting a key sets its k bits, a
+lookup checks whether all k are set. A key that was inserted always has all of
+its bits set, so there are no false negatives. Other keys may find all of their
+bits set by chance.
+- For n keys and a target false positive rate p, m = -n ln(p) / ln(2)^2 bits
+and k = (m / n) ln(2) hash functions are optimal. That is about 9.6 bits per
+key for 1% and 14.4 bits per key for 0.1%, whatever the size of the keys.
+- The k positions come from a single hash with double hashing (h1 + i * h2),
+which is as good as k independent hash functions (Kirsch and Mitzenmacher).
+
+Counting Bloom Filter:
+- Every bit becomes an 8 bit counter. Inserting increments the key's counters
+and removing decrements them, at 8 times the memory of a Bloom filter.
+
+Cuckoo Filter:
+- Stores an f bit fingerprint of every key in one of two buckets of 4 slots.
+Since only the fingerprint is stored, the second bucket is computed as the
+first XOR the hash of the fingerprint, so a fingerprint can be moved to its
+other bucket without knowing its key.
+- Supports remove and, below false positive rates of about 3%, uses less memory
+per key than a Bloom filter. Lookups probe exactly two buckets.
+- An insert that still has a fingerprint left after max_kicks kicks keeps it
+aside as the victim. The filter is then full and further inserts fail.
+
+Fronting a Hash Table:
+- When most lookups are for keys that are not in the set, putting a filter in
+front of the hash table answers almost all of them from a structure small
+enough to stay in cache, and only the false positives reach the hash table.
+- A key goes into the filter before the hash table, so a failed filter insert
+never leaves a key in the table that the filter rules out (a false negative).
+A full filter is rebuilt from the table's keys at twice the capacity, which
+costs O(n) but happens after the table doubled in size, O(1) amortized.
+"""
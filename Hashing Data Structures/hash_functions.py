@@ -0,0 +1,218 @@
+"""
+A collection of hash functions that the hashing data structures can be
+configured with.
+
+Every hash function takes a key and a seed and returns the full hash of the
+key as an integer. The data structures reduce the full hash to a valid index
+with hash % num_slots and cache it next to the key, so it never needs to be
+recomputed when resizing.
+"""
+
+"""
+Hash Functions:
+1. division: The key itself. Combined with % num_slots this is the division
+method. Integer keys only.
+2. multiplicative: Fibonacci hashing, multiplies the key by 2^64 / phi. Integer
+keys only.
+3. tabulation: XORs together random table entries picked by each byte of the
+key. Integer keys only.
+4. keyed: A keyed 64 bit BLAKE2b digest of the key's bytes (in the spirit of
+SipHash and xxHash). Integer, str and bytes keys.
+5. python: Python's built-in hash() mixed with the seed. Any hashable key.
+"""
+
+import hashlib
+import random
+from functools import lru_cache, partial
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MASK_64 = (1 << 64) - 1
+# 2^64 divided by the golden ratio, rounded to an odd number.
+GOLDEN_RATIO_64 = 0x9E3779B97F4A7C15
+
+# The number of seeds whose tabulation tables are kept, the least recently
+# used ones are dropped first.
+TABULATION_CACHE_SIZE = 4
+
+def mix_64(h):
+    """
+    Scrambles the bits of a 64 bit integer (the finalizer of SplitMix64) so
+    that every input bit affects every output bit.
+    @param h: The integer to mix.
+    @return: The mixed 64 bit integer.
+    """
+    h &= MASK_64
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return h ^ (h >> 31)
+
+def division_hash(key, seed=0):
+    """
+    Hashes a key for the division method. The seed is ignored.
+    @param key: The integer key to hash.
+    @return: The key itself.
+    """
+    return key
+
+def multiplicative_hash(key, seed=0):
+    """
+    Hashes a key using Fibonacci (multiplicative) hashing.
+    @param key: The integer key to hash.
+    @param seed: Value XORed into the key before multiplying.
+    @return: The 64 bit hash of the key.
+    """
+    h = ((key ^ seed) * GOLDEN_RATIO_64) & MASK_64
+    # The high bits of the product are the well mixed ones, fold them down so
+    # they still matter once the hash is reduced modulo the number of slots.
+    return h ^ (h >> 32)
+
+def tabulation_hash(key, seed=0):
+    """
+    Hashes a key using simple tabulation hashing over its 8 low bytes.
+    @param key: The integer key to hash.
+    @param seed: Seed of the random tables.
+    @return: The 64 bit hash of the key.
+    """
+    tables = tabulation_tables(seed)
+    key &= MASK_64
+    h = 0
+    for table in tables:
+        h ^= table[key & 0xFF]
+        key >>= 8
+    return h
+
+@lru_cache(maxsize=TABULATION_CACHE_SIZE)
+def tabulation_tables(seed):
+    """
+    Builds the random tables of tabulation hashing for a seed. Only the tables
+    of the last few seeds used are cached, since cuckoo hashing moves to a new
+    seed every time it rebuilds.
+    @param seed: Seed of the random tables.
+    @return: 8 tables of 256 random 64 bit integers, one per key byte.
+    """
+    rng = random.Random(seed)
+    return [[rng.getrandbits(64) for _ in range(256)] for _ in range(8)]
+
+def keyed_hash(key, seed=0):
+    """
+    Hashes a key using a keyed 64 bit BLAKE2b digest of its bytes.
+    @param key: The int, str or bytes key to hash.
+    @param seed: The secret key of the digest. Different seeds give unrelated
+    hashes, which protects against adversarially chosen keys.
+    @return: The 64 bit hash of the key.
+    """
+    if isinstance(key, str):
+        data = b"s" + key.encode("utf-8")
+    elif isinstance(key, int):
+        data = b"i" + key.to_bytes((key.bit_length() + 8) // 8, "little",
+        signed=True)
+    else:
+        data = b"b" + bytes(key)
+    digest = hashlib.blake2b(data, digest_size=8,
+    key=(seed & MASK_64).to_bytes(8, "little"))
+    return int.from_bytes(digest.digest(), "little")
+
+def python_hash(key, seed=0):
+    """
+    Hashes a key using Python's built-in hash() mixed with a seed.
+    @param key: Any hashable key.
+    @param seed: Value mixed into the hash.
+    @return: The 64 bit hash of the key.
+    """
+    return mix_64(hash(key) ^ seed)
+
+HASH_STRATEGIES = {
+    "division": division_hash,
+    "multiplicative": multiplicative_hash,
+    "tabulation": tabulation_hash,
+    "keyed": keyed_hash,
+    "python": python_hash,
+}
+
+def get_hash_function(hash_strategy="division", seed=0):
+    """
+    Builds the hash function a data structure should use.
+    @param hash_strategy: The name of one of the HASH_STRATEGIES, or a callable
+    taking a key and returning its full hash.
+    @param seed: The seed passed to the named hash function.
+    @return: A function taking a key and returning its full hash.
+    """
+    if callable(hash_strategy):
+        return hash_strategy
+    if hash_strategy not in HASH_STRATEGIES:
+        raise Exception(f"Error: Unknown hash strategy {hash_strategy}.")
+    if hash_strategy == "division":
+        return division_hash
+    return partial(HASH_STRATEGIES[hash_strategy], seed=seed)
+
+def hash_many(hasher, keys):
+    """
+    Computes the full hashes of a batch of keys. A NumPy array of integer keys
+    hashed with the division or multiplicative strategy is hashed in a single
+    vectorised operation.
+    @param hasher: A hash function returned by get_hash_function.
+    @param keys: An iterable of keys, or a NumPy array of integer keys.
+    @return: A tuple (keys, key_hashes) of two lists, the keys as Python
+    objects and their full hashes in the same order.
+    """
+    if np != None and isinstance(keys, np.ndarray) and keys.dtype.kind in "iu":
+        if hasher is division_hash:
+            key_list = keys.tolist()
+            return key_list, key_list
+        if getattr(hasher, "func", None) is multiplicative_hash:
+            seed = np.uint64(hasher.keywords["seed"] & MASK_64)
+            # uint64 arithmetic wraps around, which is the same as & MASK_64.
+            h = (keys.astype(np.uint64) ^ seed) * np.uint64(GOLDEN_RATIO_64)
+            h ^= h >> np.uint64(32)
+            return keys.tolist(), h.tolist()
+        keys = keys.tolist()
+    else:
+        keys = list(keys)
+    return keys, [hasher(key) for key in keys]
+
+def next_prime(n):
+    """
+    Finds the smallest prime number greater than or equal to n.
+    @param n: The number to start searching from.
+    @return: The smallest prime >= n.
+    """
+    if n <= 2:
+        return 2
+    if n % 2 == 0:
+        n += 1
+    while True:
+        divisor = 3
+        while divisor * divisor <= n and n % divisor != 0:
+            divisor += 2
+        if divisor * divisor > n:
+            return n
+        n += 2
+
+"""
+Notes:
+
+Choosing a Hash Function:
+- The division method is the fastest but only spreads keys well when the keys
+themselves are spread out. Sequential ids or ids sharing a common factor with
+the number of slots cluster together.
+- Multiplicative (Fibonacci) hashing is almost as cheap and breaks up
+arithmetic progressions of keys.
+- Tabulation hashing is 3-independent, so it behaves close to a truly random
+function for linear probing and cuckoo hashing.
+- Keyed hashing (like SipHash, which Python itself uses for str) is the choice
+when keys may be picked by an adversary, since colliding keys cannot be found
+without knowing the seed. It is also the only strategy here that gives str and
+bytes keys the same hash in every process.
+- Python's hash() works for any hashable key. Note that hash() of str and bytes
+is randomized per process unless PYTHONHASHSEED is set.
+
+Caching Hashes:
+- The data structures store the full hash next to each key. Resizing then only
+reduces the cached hash modulo the new number of slots, and lookups compare
+the cached hash before the keys, skipping most (possibly expensive) key
+comparisons.
+"""
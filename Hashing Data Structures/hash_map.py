@@ -17,75 +17,500 @@ Hash Map Operations:
 map.
 5. hash_function(key): Returns a hash value for a given key to use to hash map 
 to a valid index.
+6. find_slot(key, key_hash): Walks the probe sequence of a key and returns the
+slot it is stored in (or the slot it should be stored in).
+7. insert_many(keys, values), find_many(keys, values),
+remove_many(keys, values): Batch versions of insert, find and remove.
+8. from_items(items): Builds a hash map sized once for all of the items.
+9. get(key, default), put(key, value), update(items),
+setdefault(key, default), pop(key, default): Look up, overwrite, insert if
+missing and remove values by key. The hash map also supports hash_map[key],
+key in hash_map, len(hash_map) and iterating over its keys.
+10. shrink_to_fit(): Shrinks the array to the smallest size that holds the
+entries.
+11. save(path), open_mmap(path): Write a binary snapshot of the slot array and
+reopen it read-only through mmap as a MappedHashMap.
+12. stats(): Reports the load factor, slot occupancy, probe lengths and resizes.
+start_counting() and stop_counting() turn the operation counts on and off.
 """
 
 """
-Hash Map Time-Complexity: 
+Hash Map Time-Complexity (expected, with the load factor kept below ~0.85):
 1. find(x): O(1)
 2. insert(x): O(1)
 3. remove(x): O(1)
 4. resize(): 0(n)
 """
 
+from itertools import repeat
+from time import perf_counter
+from hash_functions import MASK_64, get_hash_function, hash_many, next_prime
+from hash_snapshot import MAP, ENTRY, EMPTY, decode, open_snapshot, read_slot
+from hash_snapshot import write_snapshot
+from hash_stats import histogram, mean, start_counting, stop_counting
+
+PROBING_STRATEGIES = ("linear", "quadratic", "double")
+
+class Tombstone():
+    """Marker left behind in a slot whose entry has been removed."""
+
+    def __repr__(self):
+        return "TOMBSTONE"
+
+TOMBSTONE = Tombstone()
+
+class Missing():
+    """Marker for an argument that was not given or a key that was not found."""
+
+    def __repr__(self):
+        return "MISSING"
+
+MISSING = Missing()
+
 class HashMap():
     """
-    Implementation of a hash map data structure ignoring the possibility of 
-    collisions. 
-    Hash Function: Static hashing using the division method.
-    Collision Resolution Strategy: None
+    Implementation of a hash map data structure.
+    Hash Function: Static hashing, using the division method unless another
+    hash strategy is given.
+    Collision Resolution Strategy: Open Addressing with linear, quadratic or
+    double hashing probing.
     """
 
-    def __init__(self, num_slots=11, load_factor=0.75):
+    def __init__(self, num_slots=11, load_factor=0.75, probing="linear",
+    hash_strategy="division", seed=0, incremental=False, rehash_step=4,
+    min_load_factor=None):
         """
         Creates an empty hash map.
         @param num_slots: Number of slots (ideally a prime number) to initialize
         the hash map with.
-        @param load_factor: The maximum accepted ratio of entries to slots 
-        acceptable until resizing and rehashing into a larger arrary occurs. 
+        @param load_factor: The maximum accepted ratio of entries (including
+        tombstones) to slots acceptable until resizing and rehashing into a
+        larger arrary occurs.
+        @param probing: The probe sequence used to resolve collisions. One of
+        "linear", "quadratic" or "double".
+        @param hash_strategy: The name of a hash function from hash_functions,
+        or a callable taking a key and returning its full hash.
+        @param seed: The seed of the hash function.
+        @param incremental: If True, the entries are moved into a rebuilt array
+        a few slots at a time by later operations instead of all at once.
+        @param rehash_step: The number of old slots each insert, find and remove
+        migrates while an incremental rehash is in progress.
+        @param min_load_factor: The ratio of entries to slots below which
+        removing keys shrinks the array. Defaults to a quarter of
+        load_factor and must stay below half of it. 0 disables shrinking.
         """
+        if probing not in PROBING_STRATEGIES:
+            raise Exception(f"Error: Unknown probing strategy {probing}.")
         self.hash_map = num_slots * [None]
         self.num_entries = 0
+        self.num_tombstones = 0
         self.num_slots = num_slots
         self.load_factor = load_factor
+        if min_load_factor == None:
+            min_load_factor = load_factor / 4
+        if not 0 <= min_load_factor < load_factor / 2:
+            raise Exception("Error: min_load_factor must be below half of "
+            "load_factor.")
+        self.min_load_factor = min_load_factor
+        # The array never shrinks below the size it was created with.
+        self.min_num_slots = num_slots
+        self.probing = probing
+        self.hash_strategy = hash_strategy
+        self.seed = seed
+        self.hasher = get_hash_function(hash_strategy, seed)
+        self.incremental = incremental
+        self.rehash_step = rehash_step
+        # Array being migrated from while an incremental rehash is in progress.
+        self.old_hash_map = None
+        self.rehash_index = 0
+        # Reported by stats(). Operations are only counted once start_counting
+        # is called.
+        self.num_resizes = 0
+        self.resize_time = 0.0
+        self.operation_counts = None
+
+    @classmethod
+    def from_items(cls, items, load_factor=0.75, **kwargs):
+        """
+        Builds a hash map from (key, value) pairs, sizing the array once for
+        all of them.
+        @param items: An iterable of (key, value) pairs, or a dict.
+        @param load_factor: The load factor of the new hash map.
+        @param kwargs: Any other argument accepted by the constructor.
+        @return: The new hash map.
+        """
+        if isinstance(items, dict):
+            items = items.items()
+        keys = []
+        values = []
+        for key, value in items:
+            keys.append(key)
+            values.append(value)
+
+        num_slots = max(11, next_prime(int(len(keys) / load_factor) + 1))
+        hash_map = cls(num_slots, load_factor, **kwargs)
+        hash_map.insert_many(keys, values)
+        return hash_map
 
     def insert(self, key, value):
         """
-        Inserts a key into the hash map. If the load factor is too high, it
-        resizes the array, rehashes the old keys into the new array, and then
-        inserts the key into the hash map. 
+        Inserts a key into the hash map. If the key already exists, its value is
+        overwritten. If the load factor is too high, it resizes the array,
+        rehashes the old keys into the new array (dropping any tombstones), and
+        then inserts the key into the hash map.
         @param key: Value used to hash an index to store this value at.
         @param value: value associated with the given key.
         """
-        index = self.hash_function(key)
-        if self.hash_map[index] == None:
-                self.hash_map[index] = (key, value)
-                self.num_entries += 1
+        if self.old_hash_map != None:
+            self.rehash_slots(self.rehash_step)
+
+        self.insert_entry(key, value, self.hasher(key))
 
         if not self.load_factor_in_range():
-            # Often a prime number.
-            self.resize(2 * len(self.hash_map) - 1)
-            
-    def find(self, key, value):
+            self.rehash()
+
+    def insert_many(self, keys, values):
+        """
+        Inserts a batch of (key, value) pairs. The array is resized at most once
+        up front instead of checking the load factor after every pair.
+        @param keys: The keys to insert. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        @param values: The values associated with the keys, in the same order.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        self.reserve(self.num_entries + len(keys))
+        if self.old_hash_map != None:
+            self.rehash_slots(self.rehash_step * len(keys))
+
+        for key, value, key_hash in zip(keys, values, key_hashes):
+            self.insert_entry(key, value, key_hash)
+
+    def insert_entry(self, key, value, key_hash, overwrite=True):
+        """
+        Stores a (key, value) pair in a single walk of the key's probe
+        sequence. Does not check the load factor.
+        @param key: The key to store.
+        @param value: value associated with the given key.
+        @param key_hash: The full hash of key.
+        @param overwrite: Whether to replace the value if the key already
+        exists.
+        @return: The value previously associated with key, MISSING if the key
+        was not in the hash map.
+        """
+        index, found = self.find_slot(key, key_hash)
+        if found:
+            previous = self.hash_map[index][1]
+            if overwrite:
+                self.hash_map[index] = (key, value, key_hash)
+            return previous
+
+        if self.old_hash_map != None:
+            old_index, old_found = self.find_slot(key, key_hash,
+            self.old_hash_map)
+            # Not migrated yet, update it where it is.
+            if old_found:
+                previous = self.old_hash_map[old_index][1]
+                if overwrite:
+                    self.old_hash_map[old_index] = (key, value, key_hash)
+                return previous
+
+        # The probe sequence did not reach a free slot.
+        if index == None:
+            self.resize(next_prime(2 * len(self.hash_map) - 1))
+            index, found = self.find_slot(key, key_hash)
+
+        if self.hash_map[index] is TOMBSTONE:
+            self.num_tombstones -= 1
+        self.hash_map[index] = (key, value, key_hash)
+        self.num_entries += 1
+        return MISSING
+
+    def find(self, key, value=MISSING):
         """
         Searches for a key within the hash map.
         @param key: Key to search for within the hash map.
-        @param value: value associated with the given key.
+        @param value: If given, the key only counts as found when it is
+        associated with this value.
         @return: True if the key is in the hash map, false otherwise.
         """
-        index = self.hash_function(key)
-        return self.hash_map[index] == (key, value)
+        if self.old_hash_map != None:
+            self.rehash_slots(self.rehash_step)
 
-    def remove(self, key, value):
+        location = self.find_entry(key, self.hasher(key))
+        if location == None:
+            return False
+        slots, index = location
+        return value is MISSING or slots[index][1] == value
+
+    def remove(self, key, value=MISSING):
         """
-        Removes a key from the hash map.
+        Removes a key from the hash map. The slot is replaced with a tombstone
+        so that probe sequences passing through it are not cut short.
         @param key: The key to remove.
+        @param value: If given, the key is only removed when it is associated
+        with this value.
+        """
+        if self.old_hash_map != None:
+            self.rehash_slots(self.rehash_step)
+
+        self.remove_entry(key, value, self.hasher(key))
+        self.shrink_if_sparse()
+
+    def find_many(self, keys, values=None):
+        """
+        Searches for a batch of keys.
+        @param keys: The keys to search for. A NumPy array of integer keys is
+        hashed in one vectorised operation.
+        @param values: If given, the values the keys must be associated with,
+        in the same order.
+        @return: A list holding True for every key in the hash map, false
+        otherwise.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        if self.old_hash_map != None:
+            self.rehash_slots(self.rehash_step * len(keys))
+        if values is None:
+            values = repeat(MISSING)
+
+        results = []
+        for key, value, key_hash in zip(keys, values, key_hashes):
+            location = self.find_entry(key, key_hash)
+            results.append(location != None and (value is MISSING or
+            location[0][location[1]][1] == value))
+        return results
+
+    def remove_many(self, keys, values=None):
+        """
+        Removes a batch of keys from the hash map.
+        @param keys: The keys to remove. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        @param values: If given, the values the keys must be associated with to
+        be removed, in the same order.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        if self.old_hash_map != None:
+            self.rehash_slots(self.rehash_step * len(keys))
+        if values is None:
+            values = repeat(MISSING)
+
+        for key, value, key_hash in zip(keys, values, key_hashes):
+            self.remove_entry(key, value, key_hash)
+        self.shrink_if_sparse()
+
+    def remove_entry(self, key, value, key_hash):
+        """
+        Replaces the slot holding a key with a tombstone.
+        @param key: The key to remove.
+        @param value: The value the key must be associated with, or MISSING to
+        remove the key whatever its value.
+        @param key_hash: The full hash of key.
+        @return: The value that was removed, MISSING if nothing was removed.
+        """
+        location = self.find_entry(key, key_hash)
+        if location == None:
+            return MISSING
+        slots, index = location
+        previous = slots[index][1]
+        if value is not MISSING and previous != value:
+            return MISSING
+
+        slots[index] = TOMBSTONE
+        self.num_entries -= 1
+        # Tombstones in the old array are discarded with it.
+        if slots is self.hash_map:
+            self.num_tombstones += 1
+        return previous
+
+    def get(self, key, default=None):
+        """
+        Looks up the value associated with a key.
+        @param key: The key to look up.
+        @param default: The value to return if the key is not in the hash map.
+        @return: The value associated with key, or default.
+        """
+        if self.old_hash_map != None:
+            self.rehash_slots(self.rehash_step)
+
+        location = self.find_entry(key, self.hasher(key))
+        if location == None:
+            return default
+        slots, index = location
+        return slots[index][1]
+
+    def put(self, key, value):
+        """
+        Associates a value with a key, overwriting any previous value. Same as
+        insert.
+        @param key: The key to store.
         @param value: value associated with the given key.
         """
-        index = self.hash_function(key)
-        print(index)
-        if self.hash_map[index] != value:
-            self.hash_map[index] = None
-            self.num_entries -= 1
+        self.insert(key, value)
+
+    def update(self, items):
+        """
+        Associates every (key, value) pair of items, overwriting previous
+        values. The array is resized at most once up front.
+        @param items: A dict or an iterable of (key, value) pairs.
+        """
+        if hasattr(items, "items"):
+            items = items.items()
+        keys = []
+        values = []
+        for key, value in items:
+            keys.append(key)
+            values.append(value)
+        self.insert_many(keys, values)
+
+    def setdefault(self, key, default=None):
+        """
+        Looks up the value associated with a key, inserting the key with a
+        default value if it is not in the hash map.
+        @param key: The key to look up.
+        @param default: The value to insert if the key is not in the hash map.
+        @return: The value associated with key.
+        """
+        if self.old_hash_map != None:
+            self.rehash_slots(self.rehash_step)
+
+        previous = self.insert_entry(key, default, self.hasher(key),
+        overwrite=False)
+        if previous is not MISSING:
+            return previous
+
+        if not self.load_factor_in_range():
+            self.rehash()
+        return default
+
+    def pop(self, key, default=MISSING):
+        """
+        Removes a key from the hash map and returns its value.
+        @param key: The key to remove.
+        @param default: The value to return if the key is not in the hash map.
+        @return: The value that was associated with key, or default.
+        """
+        if self.old_hash_map != None:
+            self.rehash_slots(self.rehash_step)
+
+        previous = self.remove_entry(key, MISSING, self.hasher(key))
+        if previous is not MISSING:
+            self.shrink_if_sparse()
+            return previous
+        if default is MISSING:
+            raise KeyError(key)
+        return default
+
+    def items(self):
+        """
+        Iterates over the entries of the hash map, in no particular order.
+        @return: A generator of (key, value) pairs.
+        """
+        for slots in (self.hash_map, self.old_hash_map):
+            if slots == None:
+                continue
+            for kvp in slots:
+                if kvp != None and kvp is not TOMBSTONE:
+                    yield kvp[0], kvp[1]
+
+    def keys(self):
+        """
+        Iterates over the keys of the hash map, in no particular order.
+        @return: A generator of keys.
+        """
+        for key, value in self.items():
+            yield key
+
+    def values(self):
+        """
+        Iterates over the values of the hash map, in no particular order.
+        @return: A generator of values.
+        """
+        for key, value in self.items():
+            yield value
+
+    def __getitem__(self, key):
+        """Returns hash_map[key], raising KeyError if key is missing."""
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        """Sets hash_map[key] = value."""
+        self.insert(key, value)
+
+    def __delitem__(self, key):
+        """Deletes hash_map[key], raising KeyError if key is missing."""
+        self.pop(key)
+
+    def __contains__(self, key):
+        """Checks key in hash_map."""
+        return self.find(key)
+
+    def __len__(self):
+        """Returns len(hash_map)."""
+        return self.num_entries
+
+    def __iter__(self):
+        """Iterates over the keys of the hash map."""
+        return self.keys()
+
+    def find_entry(self, key, key_hash):
+        """
+        Searches for the slot holding a key. While an incremental rehash is in
+        progress, the old array is searched as well.
+        @param key: The key to search for.
+        @param key_hash: The full hash of key.
+        @return: A tuple (array, index) locating the key, None if the key is
+        not in the hash map.
+        """
+        index, found = self.find_slot(key, key_hash)
+        if found:
+            return self.hash_map, index
+
+        if self.old_hash_map != None:
+            index, found = self.find_slot(key, key_hash, self.old_hash_map)
+            if found:
+                return self.old_hash_map, index
+        return None
+
+    def find_slot(self, key, key_hash, hash_map=None):
+        """
+        Walks the probe sequence of a key until it finds the key or an empty
+        slot.
+        @param key: The key to search for.
+        @param key_hash: The full hash of key.
+        @param hash_map: The array to search, the current array by default.
+        @return: A tuple (index, found). If found is True, index is the slot
+        holding key. Otherwise index is the first reusable slot (tombstone or
+        empty) on the probe sequence, or None if the sequence has no free slot.
+        """
+        if hash_map == None:
+            hash_map = self.hash_map
+        num_slots = len(hash_map)
+        home = key_hash % num_slots
+        step = self.probe_step(key_hash, num_slots)
+        first_free = None
+
+        for i in range(num_slots):
+            if self.probing == "quadratic":
+                index = (home + i * i) % num_slots
+            else:
+                index = (home + i * step) % num_slots
+
+            slot = hash_map[index]
+            if slot == None:
+                if first_free == None:
+                    first_free = index
+                return first_free, False
+            elif slot is TOMBSTONE:
+                # Remember the tombstone but keep probing, the key may be
+                # stored further along the sequence.
+                if first_free == None:
+                    first_free = index
+            # Comparing the cached hashes first avoids most key comparisons.
+            elif slot[2] == key_hash and slot[0] == key:
+                return index, True
+        return first_free, False
 
     def hash_function(self, key):
         """
@@ -93,30 +518,159 @@ class HashMap():
         @param key: The key to hash.
         @return: The hashed value to use as the index of the given key.
         """
-        return key % self.num_slots
+        return self.hasher(key) % self.num_slots
+
+    def probe_step(self, key_hash, num_slots):
+        """
+        Computes the distance between consecutive probes for a given key. Only
+        double hashing uses a key dependent step.
+        @param key_hash: The full hash of the key to compute the step for.
+        @param num_slots: The number of slots of the array being probed.
+        @return: The step of the probe sequence (never zero).
+        """
+        if self.probing == "double" and num_slots > 1:
+            return 1 + key_hash % (num_slots - 1)
+        return 1
 
     def resize(self, new_num_slots):
         """
-        Resizes the array. Called once is surpassed.
+        Resizes the array. Called once the load factor is surpassed. Tombstones
+        are not carried over to the new array and the cached hashes are reused
+        rather than recomputed. Any incremental rehash in progress is finished
+        first.
         @param new_num_slots: Size to resize the array to (ideally a prime 
         number).
         """
-        old_hash_map = self.hash_map[:]
+        self.finish_rehash()
+        start = perf_counter()
+        old_hash_map = self.hash_map
         self.hash_map = new_num_slots * [None]
         self.num_slots = new_num_slots
+        self.num_tombstones = 0
         
         for kvp in old_hash_map:
-            if kvp != None:
-                index = self.hash_function(kvp[0])
-                self.hash_map[index] = (kvp[0], kvp[1])
+            if kvp != None and kvp is not TOMBSTONE:
+                self.place(kvp)
+        self.num_resizes += 1
+        self.resize_time += perf_counter() - start
+
+    def place(self, kvp):
+        """
+        Stores an entry whose key is known not to be in the current array in
+        the first free slot of its probe sequence.
+        @param kvp: The (key, value, key_hash) entry to store.
+        """
+        index, found = self.find_slot(kvp[0], kvp[2])
+        if index == None:
+            raise Exception("Error: Hash map is too small to resize.")
+        # During an incremental rehash the new array may hold tombstones.
+        if self.hash_map[index] is TOMBSTONE:
+            self.num_tombstones -= 1
+        self.hash_map[index] = kvp
+
+    def reserve(self, num_entries):
+        """
+        Resizes the array once, if needed, so that num_entries entries fit
+        without exceeding the load factor.
+        @param num_entries: The number of entries to make room for.
+        """
+        if (num_entries + self.num_tombstones) / self.num_slots >= \
+        self.load_factor:
+            self.resize(next_prime(int(num_entries / self.load_factor) + 1))
+
+    def rehash(self):
+        """
+        Rebuilds the array once live entries and tombstones exceed the load
+        factor. If most of the load is tombstones, the array is rebuilt at the
+        same size, otherwise it grows.
+        """
+        if self.num_entries / len(self.hash_map) < self.load_factor / 2:
+            self.start_resize(self.num_slots)
+        else:
+            # Often a prime number.
+            self.start_resize(next_prime(2 * len(self.hash_map) - 1))
+
+    def start_resize(self, new_num_slots):
+        """
+        Starts resizing the array. Unless the hash map is incremental, this
+        resizes the array all at once. Otherwise the current array is kept as
+        the old array and its slots are migrated by later operations.
+        @param new_num_slots: Size to resize the array to (ideally a prime
+        number).
+        """
+        if not self.incremental:
+            self.resize(new_num_slots)
+            return
+
+        # Only one rehash can be in progress at a time.
+        self.finish_rehash()
+        start = perf_counter()
+        self.old_hash_map = self.hash_map
+        self.hash_map = new_num_slots * [None]
+        self.num_slots = new_num_slots
+        self.num_tombstones = 0
+        self.rehash_index = 0
+        self.num_resizes += 1
+        self.resize_time += perf_counter() - start
+
+    def rehash_slots(self, num_slots):
+        """
+        Migrates slots from the old array into the current array during an
+        incremental rehash. Migrated slots become tombstones so the probe
+        sequences of entries not migrated yet stay intact.
+        @param num_slots: The maximum number of old slots to migrate.
+        """
+        start = perf_counter()
+        end = min(self.rehash_index + num_slots, len(self.old_hash_map))
+        while self.rehash_index < end:
+            kvp = self.old_hash_map[self.rehash_index]
+            if kvp != None and kvp is not TOMBSTONE:
+                self.place(kvp)
+                self.old_hash_map[self.rehash_index] = TOMBSTONE
+            self.rehash_index += 1
+        self.resize_time += perf_counter() - start
+
+        if self.rehash_index == len(self.old_hash_map):
+            self.old_hash_map = None
+
+    def finish_rehash(self):
+        """Migrates every remaining slot of an incremental rehash."""
+        if self.old_hash_map != None:
+            self.rehash_slots(len(self.old_hash_map))
 
     def load_factor_in_range(self):
         """
-        Checks to see if the load factor is within range.
+        Checks to see if the load factor is within range. Tombstones count
+        towards the load since they lengthen probe sequences.
         @return: True is the load factor is within range, false otherwise.
         """
-        return (self.num_entries / len(self.hash_map)) < self.load_factor
+        return ((self.num_entries + self.num_tombstones) / len(self.hash_map) <
+        self.load_factor)
     
+    def shrink_if_sparse(self):
+        """
+        Shrinks the array once removals take the load factor below
+        min_load_factor. The smaller array is sized for half of load_factor,
+        the load right after growing, so the hash map must double or halve again
+        before the next resize and alternating inserts and removes around a
+        threshold cannot make it resize back and forth.
+        """
+        if (self.num_slots > self.min_num_slots and
+        self.num_entries / self.num_slots < self.min_load_factor):
+            new_num_slots = max(self.min_num_slots,
+            next_prime(int(2 * self.num_entries / self.load_factor) + 1))
+            if new_num_slots < self.num_slots:
+                self.start_resize(new_num_slots)
+
+    def shrink_to_fit(self):
+        """
+        Resizes the array to the smallest size (at least 11 slots) that holds
+        the current entries without exceeding the load factor, releasing the
+        memory left behind by a burst of inserts. Also drops every tombstone.
+        """
+        self.resize(max(11,
+        next_prime(int(self.num_entries / self.load_factor) + 1)))
+
     def size(self):
         """
         Checks to see the number of entries in the hash map.
@@ -124,10 +678,255 @@ class HashMap():
         """
         return self.num_entries
 
+    def stats(self):
+        """
+        Reports how the entries are spread over the array. Every entry's probe
+        sequence is walked again, so this takes O(n) time. While an incremental
+        rehash is in progress, both arrays are included.
+        @return: A dict holding the load factor, the number of slots holding an
+        entry (buckets_filled), the occupancy histogram (slots holding 0 or 1
+        entries, tombstones counting as 0), the histogram, maximum and mean of
+        the probe lengths (the number of slots examined to find each entry),
+        the number of resizes, the total time spent resizing in seconds and the
+        operation counts (None unless they are being counted).
+        """
+        occupancy = []
+        probe_lengths = []
+        num_tombstones = 0
+        for hash_map in (self.hash_map, self.old_hash_map):
+            if hash_map == None:
+                continue
+            for index, kvp in enumerate(hash_map):
+                if kvp is TOMBSTONE:
+                    num_tombstones += 1
+                if kvp == None or kvp is TOMBSTONE:
+                    occupancy.append(0)
+                    continue
+                occupancy.append(1)
+                probe_lengths.append(self.probe_length(kvp[2], index,
+                len(hash_map)))
+
+        return {
+            "num_entries": self.num_entries,
+            "num_slots": self.num_slots,
+            "num_tombstones": num_tombstones,
+            "load_factor": self.num_entries / self.num_slots,
+            "buckets_filled": len(probe_lengths),
+            "occupancy_histogram": histogram(occupancy),
+            "probe_length_histogram": histogram(probe_lengths),
+            "max_probe_length": max(probe_lengths, default=0),
+            "mean_probe_length": mean(probe_lengths),
+            "num_resizes": self.num_resizes,
+            "resize_time": self.resize_time,
+            "operation_counts": None if self.operation_counts == None else
+            dict(self.operation_counts),
+        }
+
+    def probe_length(self, key_hash, index, num_slots):
+        """
+        Counts the slots examined to find an entry.
+        @param key_hash: The full hash of the entry's key.
+        @param index: The slot holding the entry.
+        @param num_slots: The number of slots of the array holding the entry.
+        @return: The position of index on the key's probe sequence, from 1.
+        """
+        home = key_hash % num_slots
+        step = self.probe_step(key_hash, num_slots)
+        for i in range(num_slots):
+            if self.probing == "quadratic":
+                probe = (home + i * i) % num_slots
+            else:
+                probe = (home + i * step) % num_slots
+            if probe == index:
+                return i + 1
+        return num_slots
+
+    def start_counting(self):
+        """
+        Starts counting calls to insert, find and remove and their batch
+        versions, and how many finds succeed. Hash maps that are not counted pay
+        nothing for it.
+        """
+        start_counting(self)
+
+    def stop_counting(self):
+        """Stops counting operations and discards the counts."""
+        stop_counting(self)
+
+    def save(self, path):
+        """
+        Writes a binary snapshot of the slot array, tombstones included, to a
+        file. Any incremental rehash in progress is finished first.
+        @param path: The file to write.
+        """
+        self.finish_rehash()
+        write_snapshot(path, MAP, self, self.hash_map)
+
+    @staticmethod
+    def open_mmap(path):
+        """
+        Reopens a snapshot written by save without reading it into memory.
+        @param path: The snapshot file.
+        @return: A read-only MappedHashMap over the file.
+        """
+        return MappedHashMap(path)
+
     def print_hash_map(self):
         """Prints the hash map."""
         for index, item in enumerate(self.hash_map):
             print(f"hash_map[{index}] = {item}")
+        if self.old_hash_map != None:
+            for index, item in enumerate(self.old_hash_map):
+                print(f"old_hash_map[{index}] = {item}")
+
+class MappedHashMap():
+    """
+    Read-only hash map over a memory-mapped snapshot written by HashMap.save.
+    Lookups walk the same probe sequence as the saved hash map, reading the
+    slot records straight from the mapped file.
+    """
+
+    # The probe sequence must match the one the snapshot was built with.
+    probe_step = HashMap.probe_step
+
+    def __init__(self, path):
+        """
+        Maps a snapshot file read-only.
+        @param path: The snapshot file.
+        """
+        snapshot = open_snapshot(path, MAP)
+        self.file = snapshot["file"]
+        self.buffer = snapshot["buffer"]
+        self.heap_offset = snapshot["heap_offset"]
+        self.num_slots = snapshot["num_slots"]
+        self.num_entries = snapshot["num_entries"]
+        self.num_tombstones = snapshot["num_tombstones"]
+        self.load_factor = snapshot["load_factor"]
+        self.probing = snapshot["probing"]
+        self.hash_strategy = snapshot["hash_strategy"]
+        self.seed = snapshot["seed"]
+        self.hasher = snapshot["hasher"]
+
+    def find_record(self, key):
+        """
+        Walks the probe sequence of a key over the mapped slot records.
+        @param key: The key to search for.
+        @return: The slot record holding key, None if the key is not in the
+        hash map.
+        """
+        key_hash = self.hasher(key)
+        stored_hash = key_hash & MASK_64
+        home = key_hash % self.num_slots
+        step = self.probe_step(key_hash, self.num_slots)
+
+        for i in range(self.num_slots):
+            if self.probing == "quadratic":
+                index = (home + i * i) % self.num_slots
+            else:
+                index = (home + i * step) % self.num_slots
+
+            record = read_slot(self.buffer, index)
+            if record[0] == EMPTY:
+                return None
+            # Only decode keys whose cached hash matches.
+            if record[0] == ENTRY and record[3] == stored_hash and \
+            decode(self.buffer, self.heap_offset, record[1], record[4],
+            record[5]) == key:
+                return record
+        return None
+
+    def find(self, key, value=MISSING):
+        """
+        Searches for a key within the hash map.
+        @param key: Key to search for within the hash map.
+        @param value: If given, the key only counts as found when it is
+        associated with this value.
+        @return: True if the key is in the hash map, false otherwise.
+        """
+        value_found = self.get(key, MISSING)
+        if value_found is MISSING:
+            return False
+        return value is MISSING or value_found == value
+
+    def get(self, key, default=None):
+        """
+        Looks up the value associated with a key.
+        @param key: The key to look up.
+        @param default: The value to return if the key is not in the hash map.
+        @return: The value associated with key, or default.
+        """
+        record = self.find_record(key)
+        if record == None:
+            return default
+        return decode(self.buffer, self.heap_offset, record[2], record[6],
+        record[7])
+
+    def items(self):
+        """
+        Iterates over the entries of the hash map, in slot order.
+        @return: A generator of (key, value) pairs.
+        """
+        for index in range(self.num_slots):
+            record = read_slot(self.buffer, index)
+            if record[0] == ENTRY:
+                yield (decode(self.buffer, self.heap_offset, record[1],
+                record[4], record[5]), decode(self.buffer, self.heap_offset,
+                record[2], record[6], record[7]))
+
+    def keys(self):
+        """
+        Iterates over the keys of the hash map, in slot order.
+        @return: A generator of keys.
+        """
+        for key, value in self.items():
+            yield key
+
+    def values(self):
+        """
+        Iterates over the values of the hash map, in slot order.
+        @return: A generator of values.
+        """
+        for key, value in self.items():
+            yield value
+
+    def size(self):
+        """
+        Checks to see the number of entries in the hash map.
+        @return: Number of entries within the hash map.
+        """
+        return self.num_entries
+
+    def close(self):
+        """Unmaps the snapshot and closes its file."""
+        self.buffer.close()
+        self.file.close()
+
+    def __getitem__(self, key):
+        """Returns hash_map[key], raising KeyError if key is missing."""
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        """Checks key in hash_map."""
+        return self.find_record(key) != None
+
+    def __len__(self):
+        """Returns len(hash_map)."""
+        return self.num_entries
+
+    def __iter__(self):
+        """Iterates over the keys of the hash map."""
+        return self.keys()
+
+    def __enter__(self):
+        """Allows using the mapped hash map in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the mapped hash map at the end of a with statement."""
+        self.close()
 
 """
 Notes:
@@ -162,4 +961,65 @@ Efficient Hash Maps Consider:
 2. Number of empty cells.
 3. Which hash function(s) to use.
 4. Which collision resolution strategy to use.
+
+Collision Resolution Strategy Used:
+- Open Addressing
+    - Every entry is stored directly in the array. If a collision occurs, the
+    map probes other slots in a fixed order (the probe sequence) until it finds
+    the key or an empty slot.
+    - No per-bucket lists are allocated, so it uses less space than separate
+    chaining.
+    - Linear probing: index = (h(k) + i) % m. Cache friendly but suffers from
+    primary clustering (runs of filled slots grow together).
+    - Quadratic probing: index = (h(k) + i^2) % m. Avoids primary clustering.
+    When m is prime, the first (m + 1) / 2 probes are distinct.
+    - Double hashing: index = (h(k) + i * h2(k)) % m where
+    h2(k) = 1 + hash(k) % (m - 1). Keys that collide on h(k) follow different
+    sequences. When m is prime, the sequence visits every slot.
+
+Tombstones:
+- Removing an entry by emptying its slot would cut the probe sequence of every
+key stored after it, making those keys unreachable.
+- Instead, removed entries are replaced by a tombstone. Searches probe past
+tombstones, and inserts reuse the first tombstone found on the sequence.
+- Tombstones still lengthen probe sequences, so they count towards the load
+factor. When the load is mostly tombstones the array is rebuilt at the same
+size, otherwise it grows. Either way tombstones are discarded.
+
+Incremental Rehashing:
+- Rebuilding the array moves every entry at once, so the insert that triggers
+it takes O(n) and causes a latency spike on large hash maps.
+- In incremental mode (the approach Redis uses for its dictionaries), the old
+array is kept alongside the new one. Every insert, find and remove migrates a
+bounded number of old slots (rehash_step), so the cost of the rebuild is spread
+over the following operations.
+- While the rehash is in progress, new keys only go into the new array and
+lookups search both arrays. Migrated slots are turned into tombstones so the
+old array's probe sequences stay intact until it is discarded.
+
+Shrinking:
+- Without shrinking, a burst of inserts followed by mass removals leaves the
+array at its peak size for good.
+- Once removals take the load factor below min_load_factor (a quarter of
+load_factor by default), the array is rebuilt at the size that puts the load at
+half of load_factor. Growing leaves the load at that same point, so between
+two resizes the number of entries must at least double or halve. This
+hysteresis keeps a hash map hovering around a threshold from resizing on every
+operation, and keeps the amortized cost of insert and remove O(1).
+- Automatic shrinking stops at the size the hash map was created with.
+shrink_to_fit() can be called to go below it, or to release memory right away.
+
+Snapshots:
+- save writes the slot array to a file as fixed size records (see
+hash_snapshot.py) and open_mmap maps that file read-only. Nothing is decoded up
+front, so reopening a large hash map is instant and every process mapping the
+same file shares its pages.
+
+Statistics:
+- stats() walks the arrays to report how full they are and how long the probe
+sequences have grown. A long tail in the probe length histogram points at a
+weak hash function or clustering, and many resizes at a poorly chosen initial
+size.
+- Counting operations wraps the counted methods on the instance itself, so a
+hash map that is not counted runs the plain methods with no added work.
 """
\ No newline at end of file
@@ -0,0 +1,300 @@
+"""
+A hash map is an implementation of the Map ADT (associative array).
+
+Map ADT Operations:
+1. insert(key, value): Adds the (key, value) pair to the map.
+2. find(key): Returns true if key is in the map, otherwise return false.
+3. remove(key): Removes the (key, value) pair associated with key.
+4. size(): Returns the number of (key, value) pairs currently sotred in the map.
+"""
+
+"""
+Hash Map Operations:
+1. insert(key, value): Adds the (key, value) pair to the hash map.
+2. find(key): Returns true if key is in the hash map, otherwise return false.
+3. remove(key): Removes the (key, value) pair associated with key.
+4. size(): Returns the number of (key, value) pairs currently sotred in the hash
+map.
+5. hash_function(key): Returns a hash value for a given key to use to hash map
+to a valid index.
+6. items(): Iterates over the (key, value) pairs in insertion order.
+7. shrink_to_fit(): Shrinks the index array to the smallest size that holds the
+entries and drops the removed entries.
+"""
+
+"""
+Hash Map Time-Complexity (expected):
+1. find(x): O(1)
+2. insert(x): O(1)
+3. remove(x): O(1)
+4. resize(): 0(n)
+"""
+
+from array import array
+from hash_functions import next_prime
+
+# Values stored in the index array for slots that do not point at an entry.
+EMPTY = -1
+DUMMY = -2
+
+class Deleted():
+    """Marker left behind in the entry arrays when an entry is removed."""
+
+    def __repr__(self):
+        return "DELETED"
+
+DELETED = Deleted()
+
+class HashMap():
+    """
+    Implementation of a compact, insertion ordered hash map data structure.
+    The slots only hold indices into dense arrays of keys, values and cached
+    hashes.
+    Hash Function: Python's built-in hash(), cached per entry and reduced
+    modulo the number of slots.
+    Collision Resolution Strategy: Open Addressing with linear probing over the
+    index array.
+    """
+
+    def __init__(self, num_slots=11, load_factor=0.75, min_load_factor=None):
+        """
+        Creates an empty hash map.
+        @param num_slots: Number of slots (ideally a prime number) to initialize
+        the hash map with.
+        @param load_factor: The maximum accepted ratio of entries (including
+        removed ones) to slots acceptable until resizing and rehashing into a
+        larger arrary occurs.
+        @param min_load_factor: The ratio of entries to slots below which
+        removing keys shrinks the array. Defaults to a quarter of load_factor
+        and must stay below half of it. 0 disables shrinking.
+        """
+        self.indices = array("q", [EMPTY]) * num_slots
+        self.hashes = array("q")
+        self.keys = []
+        self.values = []
+        self.num_entries = 0
+        self.num_slots = num_slots
+        self.load_factor = load_factor
+        if min_load_factor == None:
+            min_load_factor = load_factor / 4
+        if not 0 <= min_load_factor < load_factor / 2:
+            raise Exception("Error: min_load_factor must be below half of "
+            "load_factor.")
+        self.min_load_factor = min_load_factor
+        # The array never shrinks below the size it was created with.
+        self.min_num_slots = num_slots
+
+    def insert(self, key, value):
+        """
+        Inserts a key into the hash map. If the key already exists, its value is
+        overwritten in place. If the load factor is too high, it resizes the
+        index array and rehashes the cached hashes into it.
+        @param key: Value used to hash an index to store this value at.
+        @param value: value associated with the given key.
+        """
+        key_hash = hash(key)
+        slot, entry = self.lookup(key, key_hash)
+        if entry != EMPTY:
+            self.values[entry] = value
+            return
+
+        self.indices[slot] = len(self.keys)
+        self.hashes.append(key_hash)
+        self.keys.append(key)
+        self.values.append(value)
+        self.num_entries += 1
+
+        if not self.load_factor_in_range():
+            self.rehash()
+
+    def find(self, key, value):
+        """
+        Searches for a key within the hash map.
+        @param key: Key to search for within the hash map.
+        @param value: value associated with the given key.
+        @return: True if the key is in the hash map, false otherwise.
+        """
+        slot, entry = self.lookup(key, hash(key))
+        return entry != EMPTY and self.values[entry] == value
+
+    def remove(self, key, value):
+        """
+        Removes a key from the hash map. The slot is marked as a dummy so probe
+        sequences passing through it are not cut short, and the entry is marked
+        as deleted until the next resize compacts the entry arrays.
+        @param key: The key to remove.
+        @param value: value associated with the given key.
+        """
+        slot, entry = self.lookup(key, hash(key))
+        if entry != EMPTY and self.values[entry] == value:
+            self.indices[slot] = DUMMY
+            self.keys[entry] = DELETED
+            self.values[entry] = None
+            self.num_entries -= 1
+            self.shrink_if_sparse()
+
+    def lookup(self, key, key_hash):
+        """
+        Walks the probe sequence of a key over the index array.
+        @param key: The key to search for.
+        @param key_hash: The full hash of key.
+        @return: A tuple (slot, entry). If the key is found, slot is its index
+        in the index array and entry its position in the entry arrays.
+        Otherwise entry is EMPTY and slot is the first reusable slot.
+        """
+        slot = key_hash % self.num_slots
+        first_free = None
+        while True:
+            entry = self.indices[slot]
+            if entry == EMPTY:
+                if first_free == None:
+                    first_free = slot
+                return first_free, EMPTY
+            elif entry == DUMMY:
+                if first_free == None:
+                    first_free = slot
+            # Comparing the cached hashes first avoids most key comparisons.
+            elif self.hashes[entry] == key_hash and self.keys[entry] == key:
+                return slot, entry
+            slot = (slot + 1) % self.num_slots
+
+    def hash_function(self, key):
+        """
+        Computes a hash value for a given give to use to map to a valid index.
+        @param key: The key to hash.
+        @return: The hashed value to use as the index of the given key.
+        """
+        return hash(key) % self.num_slots
+
+    def resize(self, new_num_slots):
+        """
+        Resizes the index array. Called once the load factor is surpassed. The
+        entries themselves are never copied or reallocated, only moved down
+        over removed entries, and their cached hashes are reused.
+        @param new_num_slots: Size to resize the array to (ideally a prime
+        number).
+        """
+        if self.num_entries < len(self.keys):
+            self.compact_entries()
+
+        self.indices = array("q", [EMPTY]) * new_num_slots
+        self.num_slots = new_num_slots
+
+        for entry, key_hash in enumerate(self.hashes):
+            slot = key_hash % new_num_slots
+            while self.indices[slot] != EMPTY:
+                slot = (slot + 1) % new_num_slots
+            self.indices[slot] = entry
+
+    def rehash(self):
+        """
+        Rebuilds the index array once live and removed entries exceed the load
+        factor. If most of the load is removed entries, the index array is
+        rebuilt at the same size, otherwise it grows.
+        """
+        if self.num_entries / self.num_slots < self.load_factor / 2:
+            self.resize(self.num_slots)
+        else:
+            # Often a prime number.
+            self.resize(next_prime(2 * self.num_slots - 1))
+
+    def compact_entries(self):
+        """
+        Moves the remaining entries down over the removed ones, keeping their
+        insertion order, and truncates the entry arrays.
+        """
+        write = 0
+        for read in range(len(self.keys)):
+            if self.keys[read] is not DELETED:
+                if write != read:
+                    self.keys[write] = self.keys[read]
+                    self.values[write] = self.values[read]
+                    self.hashes[write] = self.hashes[read]
+                write += 1
+        del self.keys[write:]
+        del self.values[write:]
+        del self.hashes[write:]
+
+    def load_factor_in_range(self):
+        """
+        Checks to see if the load factor is within range. Removed entries count
+        towards the load since their slots are still marked as dummies.
+        @return: True is the load factor is within range, false otherwise.
+        """
+        return (len(self.keys) / self.num_slots) < self.load_factor
+
+    def shrink_if_sparse(self):
+        """
+        Shrinks the array once removals take the load factor below
+        min_load_factor. The smaller array is sized for half of load_factor,
+        the load right after growing, so the hash map must double or halve again
+        before the next resize and alternating inserts and removes around a
+        threshold cannot make it resize back and forth.
+        """
+        if (self.num_slots > self.min_num_slots and
+        self.num_entries / self.num_slots < self.min_load_factor):
+            new_num_slots = max(self.min_num_slots,
+            next_prime(int(2 * self.num_entries / self.load_factor) + 1))
+            if new_num_slots < self.num_slots:
+                self.resize(new_num_slots)
+
+    def shrink_to_fit(self):
+        """
+        Resizes the array to the smallest size (at least 11 slots) that holds
+        the current entries without exceeding the load factor, releasing the
+        memory left behind by a burst of inserts. Also moves the
+        remaining entries down over the removed ones.
+        """
+        self.resize(max(11,
+        next_prime(int(self.num_entries / self.load_factor) + 1)))
+
+    def size(self):
+        """
+        Checks to see the number of entries in the hash map.
+        @return: Number of entries within the hash map.
+        """
+        return self.num_entries
+
+    def items(self):
+        """
+        Iterates over the entries of the hash map in insertion order.
+        @return: A generator of (key, value) pairs.
+        """
+        for key, value in zip(self.keys, self.values):
+            if key is not DELETED:
+                yield key, value
+
+    def print_hash_map(self):
+        """Prints the hash map."""
+        for index, entry in enumerate(self.indices):
+            if entry >= 0:
+                item = (self.keys[entry], self.values[entry])
+            else:
+                item = None
+            print(f"hash_map[{index}] = {item}")
+
+"""
+Notes:
+
+Compact Layout:
+- Rather than storing a (key, value) object in every slot, the slots form an
+index array of 8 byte integers pointing into dense arrays that hold the keys,
+the values and the cached full hash of every key. This is the layout CPython
+has used for dict since 3.6.
+- Each entry costs one slot in the index array plus one position in each of
+the dense arrays. No tuple is allocated per entry, so the memory used per entry
+drops sharply, and empty slots only cost 8 bytes each.
+- Entries are appended to the dense arrays, so iteration follows insertion
+order and walks contiguous memory instead of skipping over empty slots.
+
+Resizing:
+- Only the index array is rebuilt. The cached hashes are rehashed into it
+without calling hash() again and the entries stay where they are.
+- Removed entries leave a gap in the dense arrays until the next resize moves
+the remaining entries down over them.
+
+Collision Resolution Strategy Used:
+- Open Addressing with linear probing over the index array. Removed slots are
+marked as dummies (the equivalent of tombstones) so the probe sequences of
+other keys are not cut short.
+"""
@@ -0,0 +1,285 @@
+"""
+A hash map is an implementation of the Map ADT (associative array).
+
+Map ADT Operations:
+1. insert(key, value): Adds the (key, value) pair to the map.
+2. find(key): Returns true if key is in the map, otherwise return false.
+3. remove(key): Removes the (key, value) pair associated with key.
+4. size(): Returns the number of (key, value) pairs currently sotred in the map.
+"""
+
+"""
+Hash Map Operations:
+1. insert(key, value): Adds the (key, value) pair to the hash map.
+2. find(key): Returns true if key is in the hash map, otherwise return false.
+3. remove(key): Removes the (key, value) pair associated with key.
+4. size(): Returns the number of (key, value) pairs currently sotred in the hash
+map.
+5. hash_function(key): Returns a hash value for a given key to use to hash map
+to a valid index.
+6. max_probe_length(): Returns the largest probe distance of any entry.
+7. probe_distance_histogram(): Returns how many entries sit at each probe
+distance.
+8. shrink_to_fit(): Shrinks the array to the smallest size that holds the
+entries.
+"""
+
+"""
+Hash Map Time-Complexity (expected):
+1. find(x): O(1)
+2. insert(x): O(1)
+3. remove(x): O(1)
+4. resize(): 0(n)
+- The expected longest probe sequence is O(log n) even at high load factors.
+"""
+
+from hash_functions import get_hash_function, next_prime
+
+class HashMap():
+    """
+    Implementation of a hash map data structure using Robin Hood hashing.
+    Hash Function: Static hashing, using the division method unless another
+    hash strategy is given.
+    Collision Resolution Strategy: Open Addressing with linear probing, Robin
+    Hood insertion and backward shift deletion.
+    """
+
+    def __init__(self, num_slots=11, load_factor=0.9,
+    hash_strategy="division", seed=0, min_load_factor=None):
+        """
+        Creates an empty hash map.
+        @param num_slots: Number of slots (ideally a prime number) to initialize
+        the hash map with.
+        @param load_factor: The maximum accepted ratio of entries to slots
+        acceptable until resizing and rehashing into a larger arrary occurs.
+        Must be between 0 and 1, since every entry needs a slot of its own.
+        @param hash_strategy: The name of a hash function from hash_functions,
+        or a callable taking a key and returning its full hash.
+        @param seed: The seed of the hash function.
+        @param min_load_factor: The ratio of entries to slots below which
+        removing keys shrinks the array. Defaults to a quarter of load_factor
+        and must stay below half of it. 0 disables shrinking.
+        """
+        self.hash_map = num_slots * [None]
+        # Distance of each entry from its home slot, -1 for empty slots.
+        self.probe_distances = num_slots * [-1]
+        self.num_entries = 0
+        self.num_slots = num_slots
+        # A full array has no empty slot to end an insert's probe sequence.
+        if not 0 < load_factor < 1:
+            raise Exception("Error: load_factor must be between 0 and 1.")
+        self.load_factor = load_factor
+        if min_load_factor == None:
+            min_load_factor = load_factor / 4
+        if not 0 <= min_load_factor < load_factor / 2:
+            raise Exception("Error: min_load_factor must be below half of "
+            "load_factor.")
+        self.min_load_factor = min_load_factor
+        # The array never shrinks below the size it was created with.
+        self.min_num_slots = num_slots
+        self.hash_strategy = hash_strategy
+        self.seed = seed
+        self.hasher = get_hash_function(hash_strategy, seed)
+
+    def insert(self, key, value):
+        """
+        Inserts a key into the hash map. If the key already exists, its value is
+        overwritten. While probing, an entry closer to its home slot than the
+        one being inserted gives up its slot and continues probing instead.
+        If the load factor is too high, it resizes the array, rehashes the old
+        keys into the new array, and then inserts the key into the hash map.
+        @param key: Value used to hash an index to store this value at.
+        @param value: value associated with the given key.
+        """
+        index = self.hash_function(key)
+        entry = (key, value)
+        distance = 0
+
+        while self.probe_distances[index] != -1:
+            slot_distance = self.probe_distances[index]
+            # Only the original key can already be in the map, and it cannot
+            # sit past a slot where it would have displaced another entry.
+            if (entry[0] == key and slot_distance == distance and
+            self.hash_map[index][0] == key):
+                self.hash_map[index] = entry
+                return
+            if slot_distance < distance:
+                # Take from the rich (entries near home) and give to the poor.
+                self.hash_map[index], entry = entry, self.hash_map[index]
+                self.probe_distances[index], distance = distance, slot_distance
+            index = (index + 1) % self.num_slots
+            distance += 1
+
+        self.hash_map[index] = entry
+        self.probe_distances[index] = distance
+        self.num_entries += 1
+
+        if not self.load_factor_in_range():
+            # Often a prime number.
+            self.resize(next_prime(2 * len(self.hash_map) - 1))
+
+    def find(self, key, value):
+        """
+        Searches for a key within the hash map.
+        @param key: Key to search for within the hash map.
+        @param value: value associated with the given key.
+        @return: True if the key is in the hash map, false otherwise.
+        """
+        index = self.find_index(key)
+        return index != None and self.hash_map[index][1] == value
+
+    def remove(self, key, value):
+        """
+        Removes a key from the hash map. Every following entry that is not in
+        its home slot is shifted back by one, so no tombstones are needed.
+        @param key: The key to remove.
+        @param value: value associated with the given key.
+        """
+        index = self.find_index(key)
+        if index == None or self.hash_map[index][1] != value:
+            return
+
+        next_index = (index + 1) % self.num_slots
+        while self.probe_distances[next_index] > 0:
+            self.hash_map[index] = self.hash_map[next_index]
+            self.probe_distances[index] = self.probe_distances[next_index] - 1
+            index = next_index
+            next_index = (next_index + 1) % self.num_slots
+
+        self.hash_map[index] = None
+        self.probe_distances[index] = -1
+        self.num_entries -= 1
+        self.shrink_if_sparse()
+
+    def find_index(self, key):
+        """
+        Finds the slot holding a key. The search stops early at the first slot
+        whose entry is closer to home than the key would be.
+        @param key: The key to search for.
+        @return: The index of the slot holding key, None if not found.
+        """
+        index = self.hash_function(key)
+        distance = 0
+        while self.probe_distances[index] >= distance:
+            if self.hash_map[index][0] == key:
+                return index
+            index = (index + 1) % self.num_slots
+            distance += 1
+        return None
+
+    def hash_function(self, key):
+        """
+        Computes a hash value for a given give to use to map to a valid index.
+        @param key: The key to hash.
+        @return: The hashed value to use as the index of the given key.
+        """
+        return self.hasher(key) % self.num_slots
+
+    def resize(self, new_num_slots):
+        """
+        Resizes the array. Called once the load factor is surpassed.
+        @param new_num_slots: Size to resize the array to (ideally a prime
+        number).
+        """
+        old_hash_map = self.hash_map
+        self.hash_map = new_num_slots * [None]
+        self.probe_distances = new_num_slots * [-1]
+        self.num_slots = new_num_slots
+        self.num_entries = 0
+
+        for kvp in old_hash_map:
+            if kvp != None:
+                self.insert(kvp[0], kvp[1])
+
+    def load_factor_in_range(self):
+        """
+        Checks to see if the load factor is within range.
+        @return: True is the load factor is within range, false otherwise.
+        """
+        return (self.num_entries / len(self.hash_map)) < self.load_factor
+
+    def shrink_if_sparse(self):
+        """
+        Shrinks the array once removals take the load factor below
+        min_load_factor. The smaller array is sized for half of load_factor,
+        the load right after growing, so the hash map must double or halve again
+        before the next resize and alternating inserts and removes around a
+        threshold cannot make it resize back and forth.
+        """
+        if (self.num_slots > self.min_num_slots and
+        self.num_entries / self.num_slots < self.min_load_factor):
+            new_num_slots = max(self.min_num_slots,
+            next_prime(int(2 * self.num_entries / self.load_factor) + 1))
+            if new_num_slots < self.num_slots:
+                self.resize(new_num_slots)
+
+    def shrink_to_fit(self):
+        """
+        Resizes the array to the smallest size (at least 11 slots) that holds
+        the current entries without exceeding the load factor, releasing the
+        memory left behind by a burst of inserts.
+        """
+        self.resize(max(11,
+        next_prime(int(self.num_entries / self.load_factor) + 1)))
+
+    def size(self):
+        """
+        Checks to see the number of entries in the hash map.
+        @return: Number of entries within the hash map.
+        """
+        return self.num_entries
+
+    def max_probe_length(self):
+        """
+        Finds the largest distance any entry sits from its home slot.
+        @return: The longest probe distance, -1 if the hash map is empty.
+        """
+        return max(self.probe_distances)
+
+    def probe_distance_histogram(self):
+        """
+        Counts the entries at each probe distance.
+        @return: A list where the value at index d is the number of entries
+        stored d slots away from their home slot.
+        """
+        histogram = (self.max_probe_length() + 1) * [0]
+        for distance in self.probe_distances:
+            if distance != -1:
+                histogram[distance] += 1
+        return histogram
+
+    def print_hash_map(self):
+        """Prints the hash map."""
+        for index, item in enumerate(self.hash_map):
+            print(f"hash_map[{index}] = {item} "
+            f"(distance {self.probe_distances[index]})")
+
+"""
+Notes:
+
+Collision Resolution Strategy Used:
+- Open Addressing with Robin Hood hashing
+    - Entries are stored directly in the array and collisions are resolved with
+    linear probing.
+    - The probe distance of an entry is how far it sits from its home slot
+    (the index returned by the hash function).
+    - While inserting, if the entry being placed has probed further than the
+    entry already in a slot, they swap: the new entry takes the slot and the
+    old entry continues probing. This "takes from the rich and gives to the
+    poor" and keeps every probe distance close to the average.
+    - Lower variance in probe distance means the worst case lookups (the tail
+    of the latency distribution) stay short, even at load factors around 0.9.
+
+Early Termination:
+- Along a probe sequence, the probe distances never drop by more than one
+from slot to slot. If the search reaches a slot whose entry is closer to home
+than the key would be, the key would have displaced that entry had it been
+inserted, so it is not in the map.
+
+Backward Shift Deletion:
+- Instead of leaving a tombstone, every following entry that is not in its
+home slot is moved back one slot (and its probe distance decremented) until an
+empty slot or an entry in its home slot is reached.
+- The map never accumulates tombstones, so probe sequences do not degrade after
+many removals.
+"""
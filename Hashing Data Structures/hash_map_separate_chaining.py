@@ -17,6 +17,18 @@ Hash Map Operations:
 map.
 5. hash_function(key): Returns a hash value for a given key to use to hash map 
 to a valid index.
+6. insert_many(keys, values), find_many(keys, values),
+remove_many(keys, values): Batch versions of insert, find and remove.
+7. from_items(items): Builds a hash map sized once for all of the items.
+8. get(key, default), put(key, value), update(items),
+setdefault(key, default), pop(key, default): Look up, overwrite, insert if
+missing and remove values by key. The hash map also supports hash_map[key],
+key in hash_map, len(hash_map) and iterating over its keys.
+9. shrink_to_fit(): Shrinks the array to the smallest size that holds the
+entries.
+10. stats(): Reports the load factor, bucket occupancy, chain lengths and
+resizes. start_counting() and stop_counting() turn the operation counts on and
+off.
 """
 
 """
@@ -27,80 +39,411 @@ Hash Map Time-Complexity:
 4. resize(): 0(n)
 """
 
+from itertools import repeat
+from time import perf_counter
+from hash_functions import get_hash_function, hash_many, next_prime
+from hash_stats import histogram, mean, start_counting, stop_counting
+
+class Missing():
+    """Marker for an argument that was not given or a key that was not found."""
+
+    def __repr__(self):
+        return "MISSING"
+
+MISSING = Missing()
+
 class HashMap():
     """
-    Implementation of a hash map data structure ignoring the possibility of 
-    collisions. 
-    Hash Function: Static hashing using the division method.
+    Implementation of a hash map data structure. 
+    Hash Function: Static hashing, using the division method unless another
+    hash strategy is given.
     Collision Resolution Strategy: Closed Addressing with Separate Chaining.
     """
 
-    def __init__(self, num_slots=11, load_factor=0.75):
+    def __init__(self, num_slots=11, load_factor=0.75,
+    hash_strategy="division", seed=0, incremental=False, rehash_step=4,
+    min_load_factor=None):
         """
         Creates an empty hash map.
         @param num_slots: Number of slots (ideally a prime number) to initialize
         the hash map with.
         @param load_factor: The maximum accepted ratio of entries to slots 
         acceptable until resizing and rehashing into a larger arrary occurs. 
+        @param hash_strategy: The name of a hash function from hash_functions,
+        or a callable taking a key and returning its full hash.
+        @param seed: The seed of the hash function.
+        @param incremental: If True, the entries are moved into a resized array
+        a few buckets at a time by later operations instead of all at once.
+        @param rehash_step: The number of old buckets each insert, find and
+        remove migrates while an incremental rehash is in progress.
+        @param min_load_factor: The ratio of entries to slots below which
+        removing keys shrinks the array. Defaults to a quarter of
+        load_factor and must stay below half of it. 0 disables shrinking.
         """
         self.hash_map = [[] for _ in range(num_slots)]
         self.num_entries = 0
         self.buckets_filled = 0
         self.num_slots = num_slots
         self.load_factor = load_factor
+        if min_load_factor == None:
+            min_load_factor = load_factor / 4
+        if not 0 <= min_load_factor < load_factor / 2:
+            raise Exception("Error: min_load_factor must be below half of "
+            "load_factor.")
+        self.min_load_factor = min_load_factor
+        # The array never shrinks below the size it was created with.
+        self.min_num_slots = num_slots
+        self.hash_strategy = hash_strategy
+        self.seed = seed
+        self.hasher = get_hash_function(hash_strategy, seed)
+        self.incremental = incremental
+        self.rehash_step = rehash_step
+        # Array being migrated from while an incremental rehash is in progress.
+        self.old_hash_map = None
+        self.rehash_index = 0
+        # Reported by stats(). Operations are only counted once start_counting
+        # is called.
+        self.num_resizes = 0
+        self.resize_time = 0.0
+        self.operation_counts = None
+
+    @classmethod
+    def from_items(cls, items, load_factor=0.75, **kwargs):
+        """
+        Builds a hash map from (key, value) pairs, sizing the array once for
+        all of them.
+        @param items: An iterable of (key, value) pairs, or a dict.
+        @param load_factor: The load factor of the new hash map.
+        @param kwargs: Any other argument accepted by the constructor.
+        @return: The new hash map.
+        """
+        if isinstance(items, dict):
+            items = items.items()
+        keys = []
+        values = []
+        for key, value in items:
+            keys.append(key)
+            values.append(value)
+
+        num_slots = max(11, next_prime(int(len(keys) / load_factor) + 1))
+        hash_map = cls(num_slots, load_factor, **kwargs)
+        hash_map.insert_many(keys, values)
+        return hash_map
 
     def insert(self, key, value):
         """
-        Inserts a key into the hash map. If the load factor is too high, it
-        resizes the array, rehashes the old keys into the new array, and then
-        inserts the key into the hash map. 
+        Inserts a key into the hash map. If the key already exists, its value is
+        overwritten. If the load factor is too high, it resizes the array,
+        rehashes the old keys into the new array, and then inserts the key into
+        the hash map. 
         @param key: Value used to hash an index to store this value at.
         @param value: value associated with the given key.
         """
-        index = self.hash_function(key)
+        if self.old_hash_map != None:
+            self.rehash_buckets(self.rehash_step)
+
+        self.insert_entry(key, value, self.hasher(key))
+
+        if not self.load_factor_in_range():
+            # Often a prime number.
+            self.start_resize(2 * len(self.hash_map) - 1)
+
+    def insert_many(self, keys, values):
+        """
+        Inserts a batch of (key, value) pairs. The array is resized at most once
+        up front instead of checking the load factor after every pair.
+        @param keys: The keys to insert. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        @param values: The values associated with the keys, in the same order.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        self.reserve(self.num_entries + len(keys))
+        if self.old_hash_map != None:
+            self.rehash_buckets(self.rehash_step * len(keys))
 
-        for kvp in self.hash_map[index]:
-            # Already exists in hash map.
-            if (kvp[0], kvp[1]) == (key, value):
-                return
+        for key, value, key_hash in zip(keys, values, key_hashes):
+            self.insert_entry(key, value, key_hash)
 
-        if len(self.hash_map[index]) == 0:
+    def insert_entry(self, key, value, key_hash, overwrite=True):
+        """
+        Stores a (key, value) pair in a single scan of the key's bucket. Does
+        not check the load factor.
+        @param key: The key to store.
+        @param value: value associated with the given key.
+        @param key_hash: The full hash of key.
+        @param overwrite: Whether to replace the value if the key already
+        exists.
+        @return: The value previously associated with key, MISSING if the key
+        was not in the hash map.
+        """
+        location = self.find_entry(key, key_hash)
+        if location != None:
+            bucket, position = location
+            previous = bucket[position][1]
+            if overwrite:
+                bucket[position] = (key, value, key_hash)
+            return previous
+
+        index = key_hash % self.num_slots
+        bucket = self.hash_map[index]
+        if len(bucket) == 0:
             self.buckets_filled += 1
+            bucket = self.hash_map[index] = []
 
-        self.hash_map[index].append((key, value))
+        bucket.append((key, value, key_hash))
         self.num_entries += 1
-
-        if not self.load_factor_in_range():
-            # Often a prime number.
-            self.resize(2 * len(self.hash_map) - 1)
+        return MISSING
             
-    def find(self, key, value):
+    def find(self, key, value=MISSING):
         """
         Searches for a key within the hash map.
         @param key: Key to search for within the hash map.
-        @param value: value associated with the given key.
+        @param value: If given, the key only counts as found when it is
+        associated with this value.
         @return: True if the key is in the hash map, false otherwise.
         """
-        index = self.hash_function(key)
-        for kvp in self.hash_map[index]:
-            if (kvp[0], kvp[1]) == (key, value):
-                return True
-        return False
+        if self.old_hash_map != None:
+            self.rehash_buckets(self.rehash_step)
+
+        location = self.find_entry(key, self.hasher(key))
+        if location == None:
+            return False
+        bucket, position = location
+        return value is MISSING or bucket[position][1] == value
+
+    def find_many(self, keys, values=None):
+        """
+        Searches for a batch of keys.
+        @param keys: The keys to search for. A NumPy array of integer keys is
+        hashed in one vectorised operation.
+        @param values: If given, the values the keys must be associated with,
+        in the same order.
+        @return: A list holding True for every key in the hash map, false
+        otherwise.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        if self.old_hash_map != None:
+            self.rehash_buckets(self.rehash_step * len(keys))
+        if values is None:
+            values = repeat(MISSING)
+
+        results = []
+        for key, value, key_hash in zip(keys, values, key_hashes):
+            location = self.find_entry(key, key_hash)
+            results.append(location != None and (value is MISSING or
+            location[0][location[1]][1] == value))
+        return results
 
-    def remove(self, key, value):
+    def remove(self, key, value=MISSING):
         """
         Removes a key from the hash map.
         @param key: The key to remove.
-        @param value: value associated with the given key.
+        @param value: If given, the key is only removed when it is associated
+        with this value.
+        """
+        if self.old_hash_map != None:
+            self.rehash_buckets(self.rehash_step)
+        self.remove_entry(key, value, self.hasher(key))
+        self.shrink_if_sparse()
+
+    def remove_many(self, keys, values=None):
+        """
+        Removes a batch of keys from the hash map.
+        @param keys: The keys to remove. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        @param values: If given, the values the keys must be associated with to
+        be removed, in the same order.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        if self.old_hash_map != None:
+            self.rehash_buckets(self.rehash_step * len(keys))
+        if values is None:
+            values = repeat(MISSING)
+        for key, value, key_hash in zip(keys, values, key_hashes):
+            self.remove_entry(key, value, key_hash)
+        self.shrink_if_sparse()
+
+    def remove_entry(self, key, value, key_hash):
+        """
+        Deletes a key from its bucket.
+        @param key: The key to remove.
+        @param value: The value the key must be associated with, or MISSING to
+        remove the key whatever its value.
+        @param key_hash: The full hash of key.
+        @return: The value that was removed, MISSING if nothing was removed.
         """
-        index = self.hash_function(key)
-        for kvp in self.hash_map[index]:
-            if (kvp[0], kvp[1]) == (key, value):
-                self.hash_map[index].remove((key, value))
-                self.num_entries -= 1
+        location = self.find_entry(key, key_hash)
+        if location == None:
+            return MISSING
+
+        bucket, position = location
+        previous = bucket[position][1]
+        if value is not MISSING and previous != value:
+            return MISSING
 
-        if len(self.hash_map[index]) == 0:
+        del bucket[position]
+        self.num_entries -= 1
+        # Only buckets of the current array are counted as filled.
+        if (len(bucket) == 0 and
+        bucket is self.hash_map[key_hash % self.num_slots]):
             self.buckets_filled -= 1
+        return previous
+
+    def find_entry(self, key, key_hash):
+        """
+        Searches the bucket of a key for the key. While an incremental rehash
+        is in progress, the key's bucket in the old array is searched as well.
+        @param key: Key to search for.
+        @param key_hash: The full hash of key.
+        @return: A tuple (bucket, position) locating the key, None if the key
+        is not in the hash map.
+        """
+        bucket = self.hash_map[key_hash % self.num_slots]
+        for position, kvp in enumerate(bucket):
+            # Comparing the cached hashes first avoids most key comparisons.
+            if kvp[2] == key_hash and kvp[0] == key:
+                return bucket, position
+
+        if self.old_hash_map != None:
+            bucket = self.old_hash_map[key_hash % len(self.old_hash_map)]
+            for position, kvp in enumerate(bucket):
+                if kvp[2] == key_hash and kvp[0] == key:
+                    return bucket, position
+        return None
+
+    def get(self, key, default=None):
+        """
+        Looks up the value associated with a key.
+        @param key: The key to look up.
+        @param default: The value to return if the key is not in the hash map.
+        @return: The value associated with key, or default.
+        """
+        if self.old_hash_map != None:
+            self.rehash_buckets(self.rehash_step)
+
+        location = self.find_entry(key, self.hasher(key))
+        if location == None:
+            return default
+        bucket, position = location
+        return bucket[position][1]
+
+    def put(self, key, value):
+        """
+        Associates a value with a key, overwriting any previous value. Same as
+        insert.
+        @param key: The key to store.
+        @param value: value associated with the given key.
+        """
+        self.insert(key, value)
+
+    def update(self, items):
+        """
+        Associates every (key, value) pair of items, overwriting previous
+        values. The array is resized at most once up front.
+        @param items: A dict or an iterable of (key, value) pairs.
+        """
+        if hasattr(items, "items"):
+            items = items.items()
+        keys = []
+        values = []
+        for key, value in items:
+            keys.append(key)
+            values.append(value)
+        self.insert_many(keys, values)
+
+    def setdefault(self, key, default=None):
+        """
+        Looks up the value associated with a key, inserting the key with a
+        default value if it is not in the hash map.
+        @param key: The key to look up.
+        @param default: The value to insert if the key is not in the hash map.
+        @return: The value associated with key.
+        """
+        if self.old_hash_map != None:
+            self.rehash_buckets(self.rehash_step)
+
+        previous = self.insert_entry(key, default, self.hasher(key),
+        overwrite=False)
+        if previous is not MISSING:
+            return previous
+
+        if not self.load_factor_in_range():
+            # Often a prime number.
+            self.start_resize(2 * len(self.hash_map) - 1)
+        return default
+
+    def pop(self, key, default=MISSING):
+        """
+        Removes a key from the hash map and returns its value.
+        @param key: The key to remove.
+        @param default: The value to return if the key is not in the hash map.
+        @return: The value that was associated with key, or default.
+        """
+        if self.old_hash_map != None:
+            self.rehash_buckets(self.rehash_step)
+
+        previous = self.remove_entry(key, MISSING, self.hasher(key))
+        if previous is not MISSING:
+            self.shrink_if_sparse()
+            return previous
+        if default is MISSING:
+            raise KeyError(key)
+        return default
+
+    def items(self):
+        """
+        Iterates over the entries of the hash map, in no particular order.
+        @return: A generator of (key, value) pairs.
+        """
+        for buckets in (self.hash_map, self.old_hash_map):
+            if buckets == None:
+                continue
+            for bucket in buckets:
+                for kvp in bucket:
+                    yield kvp[0], kvp[1]
+
+    def keys(self):
+        """
+        Iterates over the keys of the hash map, in no particular order.
+        @return: A generator of keys.
+        """
+        for key, value in self.items():
+            yield key
+
+    def values(self):
+        """
+        Iterates over the values of the hash map, in no particular order.
+        @return: A generator of values.
+        """
+        for key, value in self.items():
+            yield value
+
+    def __getitem__(self, key):
+        """Returns hash_map[key], raising KeyError if key is missing."""
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        """Sets hash_map[key] = value."""
+        self.insert(key, value)
+
+    def __delitem__(self, key):
+        """Deletes hash_map[key], raising KeyError if key is missing."""
+        self.pop(key)
+
+    def __contains__(self, key):
+        """Checks key in hash_map."""
+        return self.find(key)
+
+    def __len__(self):
+        """Returns len(hash_map)."""
+        return self.num_entries
+
+    def __iter__(self):
+        """Iterates over the keys of the hash map."""
+        return self.keys()
         
     def hash_function(self, key):
         """
@@ -108,25 +451,93 @@ class HashMap():
         @param key: The key to hash.
         @return: The hashed value to use as the index of the given key.
         """
-        return key % self.num_slots
+        return self.hasher(key) % self.num_slots
 
     def resize(self, new_num_slots):
         """
-        Resizes the array. Called once is surpassed.
+        Resizes the array. Called once is surpassed. The cached hashes are
+        reused rather than recomputed. Any incremental rehash in progress is
+        finished first.
         @param new_num_slots: Size to resize the array to (ideally a prime 
         number).
         """
-        old_hash_map = self.hash_map[:]
+        self.finish_rehash()
+        start = perf_counter()
+        old_hash_map = self.hash_map
         self.hash_map = [[] for _ in range(new_num_slots)]
         self.num_slots = new_num_slots
         self.buckets_filled = 0
         
         for bucket in old_hash_map:
             for kvp in bucket:
-                index = self.hash_function(kvp[0])
+                index = kvp[2] % new_num_slots
                 if len(self.hash_map[index]) == 0:
                     self.buckets_filled += 1
-                self.hash_map[index].append((kvp[0], kvp[1]))
+                self.hash_map[index].append(kvp)
+        self.num_resizes += 1
+        self.resize_time += perf_counter() - start
+
+    def reserve(self, num_entries):
+        """
+        Resizes the array once, if needed, so that num_entries entries fit
+        without exceeding the load factor.
+        @param num_entries: The number of entries to make room for.
+        """
+        if num_entries / self.num_slots >= self.load_factor:
+            self.resize(next_prime(int(num_entries / self.load_factor) + 1))
+
+    def start_resize(self, new_num_slots):
+        """
+        Starts resizing the array. Unless the hash map is incremental, this
+        resizes the array all at once. Otherwise the current array is kept as
+        the old array and its buckets are migrated by later operations.
+        @param new_num_slots: Size to resize the array to (ideally a prime 
+        number).
+        """
+        if not self.incremental:
+            self.resize(new_num_slots)
+            return
+
+        # Only one rehash can be in progress at a time.
+        self.finish_rehash()
+        start = perf_counter()
+        self.old_hash_map = self.hash_map
+        # Empty buckets share one empty tuple and are replaced by a list on
+        # their first insert, so allocating the array stays cheap.
+        self.hash_map = new_num_slots * [()]
+        self.num_slots = new_num_slots
+        self.buckets_filled = 0
+        self.rehash_index = 0
+        self.num_resizes += 1
+        self.resize_time += perf_counter() - start
+
+    def rehash_buckets(self, num_buckets):
+        """
+        Migrates buckets from the old array into the current array during an
+        incremental rehash.
+        @param num_buckets: The maximum number of old buckets to migrate.
+        """
+        start = perf_counter()
+        end = min(self.rehash_index + num_buckets, len(self.old_hash_map))
+        while self.rehash_index < end:
+            for kvp in self.old_hash_map[self.rehash_index]:
+                index = kvp[2] % self.num_slots
+                bucket = self.hash_map[index]
+                if len(bucket) == 0:
+                    self.buckets_filled += 1
+                    bucket = self.hash_map[index] = []
+                bucket.append(kvp)
+            self.old_hash_map[self.rehash_index] = ()
+            self.rehash_index += 1
+        self.resize_time += perf_counter() - start
+
+        if self.rehash_index == len(self.old_hash_map):
+            self.old_hash_map = None
+
+    def finish_rehash(self):
+        """Migrates every remaining bucket of an incremental rehash."""
+        if self.old_hash_map != None:
+            self.rehash_buckets(len(self.old_hash_map))
 
     def load_factor_in_range(self):
         """
@@ -135,6 +546,72 @@ class HashMap():
         """
         return (self.num_entries / len(self.hash_map)) < self.load_factor
     
+    def shrink_if_sparse(self):
+        """
+        Shrinks the array once removals take the load factor below
+        min_load_factor. The smaller array is sized for half of load_factor,
+        the load right after growing, so the hash map must double or halve again
+        before the next resize and alternating inserts and removes around a
+        threshold cannot make it resize back and forth.
+        """
+        if (self.num_slots > self.min_num_slots and
+        self.num_entries / self.num_slots < self.min_load_factor):
+            new_num_slots = max(self.min_num_slots,
+            next_prime(int(2 * self.num_entries / self.load_factor) + 1))
+            if new_num_slots < self.num_slots:
+                self.start_resize(new_num_slots)
+
+    def shrink_to_fit(self):
+        """
+        Resizes the array to the smallest size (at least 11 slots) that holds
+        the current entries without exceeding the load factor, releasing the
+        memory left behind by a burst of inserts.
+        """
+        self.resize(max(11,
+        next_prime(int(self.num_entries / self.load_factor) + 1)))
+
+    def stats(self):
+        """
+        Reports how the entries are spread over the buckets. Takes O(m) time for
+        m buckets. While an incremental rehash is in progress, both arrays are
+        included.
+        @return: A dict holding the load factor, the number of non-empty
+        buckets (buckets_filled), the occupancy histogram (the number of
+        buckets holding 0, 1, 2, ... entries), the maximum and mean length of
+        the non-empty chains, the number of resizes, the total time spent
+        resizing in seconds and the operation counts (None unless they are
+        being counted).
+        """
+        occupancy = [len(bucket) for bucket in self.hash_map]
+        if self.old_hash_map != None:
+            occupancy.extend(len(bucket) for bucket in self.old_hash_map)
+        chain_lengths = [length for length in occupancy if length > 0]
+        return {
+            "num_entries": self.num_entries,
+            "num_slots": self.num_slots,
+            "load_factor": self.num_entries / self.num_slots,
+            "buckets_filled": len(chain_lengths),
+            "occupancy_histogram": histogram(occupancy),
+            "max_chain_length": max(chain_lengths, default=0),
+            "mean_chain_length": mean(chain_lengths),
+            "num_resizes": self.num_resizes,
+            "resize_time": self.resize_time,
+            "operation_counts": None if self.operation_counts == None else
+            dict(self.operation_counts),
+        }
+
+    def start_counting(self):
+        """
+        Starts counting calls to insert, find and remove and their batch
+        versions, and how many finds succeed. Hash maps that are not counted pay
+        nothing for it.
+        """
+        start_counting(self)
+
+    def stop_counting(self):
+        """Stops counting operations and discards the counts."""
+        stop_counting(self)
+
     def size(self):
         """
         Checks to see the number of entries in the hash map.
@@ -145,7 +622,10 @@ class HashMap():
     def print_hash_map(self):
         """Prints the hash map."""
         for index, item in enumerate(self.hash_map):
-            print(f"hash_map[{index}] = {item}")
+            print(f"hash_map[{index}] = {list(item)}")
+        if self.old_hash_map != None:
+            for index, item in enumerate(self.old_hash_map):
+                print(f"old_hash_map[{index}] = {list(item)}")
 
 """
 Notes:
@@ -185,7 +665,8 @@ Collision Resolution Strategy Used:
 - Closed Addressing with Separate Chaining
     - Each bucket of the hash table is a list and if a collision occurs the 
     item is simply appended to the end of the list (after traversing it to 
-    ensure it does not already exist in the list).
+    ensure the key does not already exist in the list, in which case its value
+    is overwritten instead).
     - Most common approach.
     - A drawback is that it uses more space than some other collision 
     resolution strategies.
@@ -196,4 +677,23 @@ Separate Chaining Worst Case Time-Complexity:
 3. remove(x): O(n)
 - If all the keys are mapped to the same index, we would need to probe over all
 n elements.
+
+Incremental Rehashing:
+- Resizing moves every entry at once, so the insert that triggers it takes O(n)
+and causes a latency spike on large hash maps.
+- In incremental mode (the approach Redis uses for its dictionaries), the old
+array is kept alongside the new one. Every insert, find and remove migrates a
+bounded number of old buckets (rehash_step), so the cost of the resize is
+spread over the following operations.
+- While the rehash is in progress, new entries only go into the new array and
+lookups check the key's bucket in both arrays.
+- Allocating the new array is still O(n), but filling it with a shared empty
+tuple is a single fast memory copy rather than one list per bucket.
+
+Statistics:
+- stats() reports the occupancy histogram of the buckets and the length of the
+chains. With a good hash function the chains stay short (mostly 1 or 2
+entries), a long chain points at many keys sharing a bucket.
+- Counting operations wraps the counted methods on the instance itself, so a
+hash map that is not counted runs the plain methods with no added work.
 """
\ No newline at end of file
@@ -0,0 +1,223 @@
+"""
+Binary snapshots of the slot arrays of hash_table.HashTable and
+hash_map.HashMap, readable in place through mmap.
+
+Snapshot Operations:
+1. write_snapshot(path, kind, container, slots): Writes a snapshot of a slot
+array to a file.
+2. open_snapshot(path, kind): Memory maps a snapshot and reads its header.
+3. read_slot(buffer, index): Reads one slot record of a mapped snapshot.
+4. decode(buffer, heap_offset, item_type, data, length): Rebuilds a key or value
+stored in a slot record.
+"""
+
+"""
+File Layout (little endian):
+1. Header: magic, format version, kind (1 for a hash table, 2 for a hash map),
+num_slots, num_entries, num_tombstones, load_factor, seed, and the names of the
+hash strategy and probing strategy.
+2. Slot array: num_slots fixed size records, in the same order as the slots of
+the saved array. Each record holds the slot's state (empty, entry or
+tombstone), the cached hash of the key, and the key and value.
+3. Heap: the bytes of every str and bytes key or value, referenced from the
+records by offset and length.
+"""
+
+import mmap
+import struct
+from hash_functions import MASK_64, get_hash_function
+
+MAGIC = b"HASHSNAP"
+VERSION = 1
+TABLE = 1
+MAP = 2
+
+# magic, version, kind, num_slots, num_entries, num_tombstones, load_factor,
+# seed, hash_strategy, probing
+HEADER = struct.Struct("<8sHH4xQQQdq16s16s")
+# state, key_type, value_type, key_hash, key, key_length, value, value_length
+SLOT = struct.Struct("<BBB5xQqQqQ")
+FLOAT = struct.Struct("<d")
+INT64 = struct.Struct("<q")
+
+# Slot states.
+EMPTY = 0
+ENTRY = 1
+DELETED = 2
+
+# Key and value types. Numbers are stored inline in the record, str and bytes
+# in the heap.
+NONE_TYPE = 0
+INT_TYPE = 1
+FLOAT_TYPE = 2
+STR_TYPE = 3
+BYTES_TYPE = 4
+BOOL_TYPE = 5
+
+def encode(item, heap):
+    """
+    Encodes a key or value for a slot record.
+    @param item: The key or value to encode. Must be None, a bool, an int that
+    fits in 64 bits, a float, a str or bytes.
+    @param heap: The bytearray str and bytes items are appended to.
+    @return: A tuple (item_type, data, length) for the slot record.
+    """
+    if item == None:
+        return NONE_TYPE, 0, 0
+    elif isinstance(item, bool):
+        return BOOL_TYPE, int(item), 0
+    elif isinstance(item, int):
+        if not -(1 << 63) <= item < (1 << 63):
+            raise Exception(f"Error: {item} does not fit in 64 bits.")
+        return INT_TYPE, item, 0
+    elif isinstance(item, float):
+        return FLOAT_TYPE, INT64.unpack(FLOAT.pack(item))[0], 0
+    elif isinstance(item, (str, bytes)):
+        item_type = STR_TYPE if isinstance(item, str) else BYTES_TYPE
+        data = item.encode("utf-8") if item_type == STR_TYPE else item
+        offset = len(heap)
+        heap += data
+        return item_type, offset, len(data)
+    raise Exception(f"Error: Cannot save items of type {type(item).__name__}.")
+
+def decode(buffer, heap_offset, item_type, data, length):
+    """
+    Rebuilds a key or value from a slot record.
+    @param buffer: The mapped snapshot.
+    @param heap_offset: The position of the heap in the snapshot.
+    @param item_type: The type stored in the record.
+    @param data: The inline value or heap offset stored in the record.
+    @param length: The heap length stored in the record.
+    @return: The key or value.
+    """
+    if item_type == INT_TYPE:
+        return data
+    elif item_type == NONE_TYPE:
+        return None
+    elif item_type == BOOL_TYPE:
+        return data != 0
+    elif item_type == FLOAT_TYPE:
+        return FLOAT.unpack(INT64.pack(data))[0]
+    start = heap_offset + data
+    raw = buffer[start:start + length]
+    return raw.decode("utf-8") if item_type == STR_TYPE else raw
+
+def write_snapshot(path, kind, container, slots):
+    """
+    Writes a snapshot of a slot array to a file.
+    @param path: The file to write.
+    @param kind: TABLE or MAP.
+    @param container: The hash table or hash map being saved. Its num_entries,
+    load_factor, hash_strategy and seed are stored in the header.
+    @param slots: The slot array. Each slot is None, a tombstone (any object
+    that is not a tuple), a (key, key_hash) entry for a hash table or a
+    (key, value, key_hash) entry for a hash map.
+    """
+    if callable(container.hash_strategy):
+        raise Exception("Error: Only containers using a named hash strategy "
+        "can be saved.")
+    probing = getattr(container, "probing", "none")
+
+    records = bytearray(len(slots) * SLOT.size)
+    heap = bytearray()
+    num_tombstones = 0
+    for index, slot in enumerate(slots):
+        if slot == None:
+            continue
+        if not isinstance(slot, tuple):
+            num_tombstones += 1
+            SLOT.pack_into(records, index * SLOT.size, DELETED, 0, 0, 0, 0, 0,
+            0, 0)
+            continue
+
+        key, key_hash = slot[0], slot[-1]
+        if container.hash_strategy == "python" and \
+        isinstance(key, (str, bytes)):
+            raise Exception("Error: hash() of str and bytes changes between "
+            "processes, save them with the keyed hash strategy instead.")
+        key_type, key_data, key_length = encode(key, heap)
+        if kind == MAP:
+            value_type, value_data, value_length = encode(slot[1], heap)
+        else:
+            value_type, value_data, value_length = NONE_TYPE, 0, 0
+        SLOT.pack_into(records, index * SLOT.size, ENTRY, key_type, value_type,
+        key_hash & MASK_64, key_data, key_length, value_data, value_length)
+
+    header = HEADER.pack(MAGIC, VERSION, kind, len(slots),
+    container.num_entries, num_tombstones, container.load_factor,
+    container.seed, container.hash_strategy.encode("ascii"),
+    probing.encode("ascii"))
+    with open(path, "wb") as file:
+        file.write(header)
+        file.write(records)
+        file.write(heap)
+
+def open_snapshot(path, kind):
+    """
+    Memory maps a snapshot read-only and reads its header. Nothing else is
+    read until it is looked up.
+    @param path: The snapshot file.
+    @param kind: The kind of snapshot expected, TABLE or MAP.
+    @return: A dict holding the open file, the mapped buffer and every header
+    field, plus the hasher rebuilt from the hash strategy and seed.
+    """
+    file = open(path, "rb")
+    buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    (magic, version, snapshot_kind, num_slots, num_entries, num_tombstones,
+    load_factor, seed, hash_strategy, probing) = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION or snapshot_kind != kind:
+        buffer.close()
+        file.close()
+        raise Exception(f"Error: {path} is not a snapshot of this kind.")
+
+    hash_strategy = hash_strategy.rstrip(b"\0").decode("ascii")
+    return {
+        "file": file,
+        "buffer": buffer,
+        "num_slots": num_slots,
+        "num_entries": num_entries,
+        "num_tombstones": num_tombstones,
+        "load_factor": load_factor,
+        "seed": seed,
+        "hash_strategy": hash_strategy,
+        "probing": probing.rstrip(b"\0").decode("ascii"),
+        "hasher": get_hash_function(hash_strategy, seed),
+        "heap_offset": HEADER.size + num_slots * SLOT.size,
+    }
+
+def read_slot(buffer, index):
+    """
+    Reads one slot record of a mapped snapshot.
+    @param buffer: The mapped snapshot.
+    @param index: The index of the slot.
+    @return: A tuple (state, key_type, value_type, key_hash, key, key_length,
+    value, value_length).
+    """
+    return SLOT.unpack_from(buffer, HEADER.size + index * SLOT.size)
+
+"""
+Notes:
+
+Zero Deserialisation:
+- Rebuilding a hash container by replaying insert() hashes every key again and
+allocates every entry. A snapshot instead stores the slot array exactly as it
+is laid out in memory, so reopening it only maps the file and reads the header.
+- Lookups decode just the records on the key's probe sequence, comparing the
+cached hash before decoding the key.
+- The file is mapped read-only, so every process opening the same snapshot
+shares the same physical pages through the operating system's page cache.
+
+Fixed Size Records:
+- Every slot takes SLOT.size (48) bytes, so slot i is found at a fixed offset
+without any index. Numbers are stored inline, str and bytes in a heap after the
+slot array.
+- Only None, bool, int (64 bit), float, str and bytes keys and values can be
+saved.
+
+Hash Functions:
+- The name of the hash strategy and the seed are stored in the header and the
+hash function is rebuilt when the snapshot is opened, so the same keys map to
+the same slots. Custom (callable) hash functions cannot be saved.
+- Python's hash() of str and bytes differs between processes, so those keys
+need the keyed hash strategy to be saved.
+"""
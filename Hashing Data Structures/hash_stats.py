@@ -0,0 +1,78 @@
+"""
+Helpers shared by the stats() of the hashing data structures.
+
+Stats Operations:
+1. start_counting(container): Starts counting the calls to the operations of a
+hash table or hash map.
+2. stop_counting(container): Stops counting and removes the counting wrappers.
+3. histogram(lengths): Counts how many times each length occurs.
+4. mean(lengths): Averages a list of lengths.
+"""
+
+COUNTED_OPERATIONS = ("insert", "find", "remove", "insert_many", "find_many",
+"remove_many")
+
+def start_counting(container):
+    """
+    Starts counting the calls to the operations of one container, and how many
+    of its finds succeed. The counting wrappers are stored on the instance,
+    shadowing the methods of its class, so containers that are not counted run
+    the plain methods without any overhead.
+    @param container: The hash table or hash map to count the operations of.
+    """
+    counts = {name: 0 for name in COUNTED_OPERATIONS}
+    counts["find_hits"] = 0
+    container.operation_counts = counts
+    for name in COUNTED_OPERATIONS:
+        # Bind the method of the class, not a wrapper already on the instance.
+        method = getattr(type(container), name).__get__(container)
+        setattr(container, name, count_calls(method, name, counts))
+
+def count_calls(method, name, counts):
+    """
+    Wraps a bound method so that every call is counted.
+    @param method: The bound method to wrap.
+    @param name: The name of the method, the key of its count.
+    @param counts: The dict of counts to update.
+    @return: The wrapper.
+    """
+    def counted(*args, **kwargs):
+        counts[name] += 1
+        result = method(*args, **kwargs)
+        if name == "find" and result:
+            counts["find_hits"] += 1
+        return result
+    return counted
+
+def stop_counting(container):
+    """
+    Stops counting the operations of a container.
+    @param container: The hash table or hash map to stop counting.
+    """
+    for name in COUNTED_OPERATIONS:
+        container.__dict__.pop(name, None)
+    container.operation_counts = None
+
+def histogram(lengths):
+    """
+    Counts how many times each length occurs.
+    @param lengths: An iterable of non-negative integers.
+    @return: A list where the value at index i is the number of lengths equal
+    to i.
+    """
+    counts = []
+    for length in lengths:
+        if length >= len(counts):
+            counts.extend((length + 1 - len(counts)) * [0])
+        counts[length] += 1
+    return counts
+
+def mean(lengths):
+    """
+    Averages a list of lengths.
+    @param lengths: A list of numbers.
+    @return: The mean of lengths, 0 if it is empty.
+    """
+    if len(lengths) == 0:
+        return 0
+    return sum(lengths) / len(lengths)
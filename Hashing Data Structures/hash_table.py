@@ -18,6 +18,14 @@ Hash Table Operations:
 4. size(): Returns the number of entries in the hash table.
 5. hash_function(key): Returns a hash value for a given key to use to map to a
 valid index.
+6. insert_many(keys), find_many(keys), remove_many(keys): Batch versions of
+insert, find and remove.
+7. from_iterable(keys): Builds a hash table sized once for all of the keys.
+8. shrink_to_fit(): Shrinks the array to the smallest size that holds the keys.
+9. save(path), open_mmap(path): Write a binary snapshot of the slot array and
+reopen it read-only through mmap as a MappedHashTable.
+10. stats(): Reports the load factor, slot occupancy and resizes.
+start_counting() and stop_counting() turn the operation counts on and off.
 """
 
 """
@@ -28,26 +36,87 @@ Hash Table Time-Complexity:
 4. resize(): 0(n)
 """
 
+from time import perf_counter
+from hash_functions import MASK_64, get_hash_function, hash_many, next_prime
+from hash_snapshot import TABLE, ENTRY, decode, open_snapshot, read_slot
+from hash_snapshot import write_snapshot
+from hash_stats import histogram, start_counting, stop_counting
+
 class HashTable():
     """
     Implementation of a hash table data structure ignoring the possibility of 
     collisions. 
-    Hash Function: Static hashing using the division method.
+    Hash Function: Static hashing, using the division method unless another
+    hash strategy is given.
     Collision Resolution Strategy: None
     """
 
-    def __init__(self, num_slots=11, load_factor=0.75):
+    def __init__(self, num_slots=11, load_factor=0.75,
+    hash_strategy="division", seed=0, incremental=False, rehash_step=4,
+    min_load_factor=None):
         """
         Creates an empty hash table.
         @param num_slots: Number of slots (ideally a prime number) to initialize
         the hash table with.
         @param load_factor: The maximum accepted ratio of entries to slots 
         acceptable until resizing and rehashing into a larger arrary occurs. 
+        @param hash_strategy: The name of a hash function from hash_functions,
+        or a callable taking a key and returning its full hash.
+        @param seed: The seed of the hash function.
+        @param incremental: If True, the keys are moved into a resized array a
+        few slots at a time by later operations instead of all at once.
+        @param rehash_step: The number of old slots each insert, find and remove
+        migrates while an incremental rehash is in progress.
+        @param min_load_factor: The ratio of entries to slots below which
+        removing keys shrinks the array. Must stay below half of load_factor.
+        Defaults to 0, which disables shrinking, since every resize may drop
+        keys that collide in the new array.
         """
         self.hash_table = num_slots * [None]
         self.num_entries = 0
         self.num_slots = num_slots
         self.load_factor = load_factor
+        if min_load_factor == None:
+            min_load_factor = 0
+        if not 0 <= min_load_factor < load_factor / 2:
+            raise Exception("Error: min_load_factor must be below half of "
+            "load_factor.")
+        self.min_load_factor = min_load_factor
+        # The array never shrinks below the size it was created with.
+        self.min_num_slots = num_slots
+        self.hash_strategy = hash_strategy
+        self.seed = seed
+        self.hasher = get_hash_function(hash_strategy, seed)
+        self.incremental = incremental
+        self.rehash_step = rehash_step
+        # Array being migrated from while an incremental rehash is in progress.
+        self.old_hash_table = None
+        self.rehash_index = 0
+        # Reported by stats(). Operations are only counted once start_counting
+        # is called.
+        self.num_resizes = 0
+        self.resize_time = 0.0
+        self.operation_counts = None
+        # Keys lost by resizes because their new slot was already taken.
+        self.num_dropped = 0
+
+    @classmethod
+    def from_iterable(cls, keys, load_factor=0.75, **kwargs):
+        """
+        Builds a hash table from an iterable of keys, sizing the array once for
+        all of them.
+        @param keys: The keys to insert. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        @param load_factor: The load factor of the new hash table.
+        @param kwargs: Any other argument accepted by the constructor.
+        @return: The new hash table.
+        """
+        if not hasattr(keys, "__len__"):
+            keys = list(keys)
+        num_slots = max(11, next_prime(int(len(keys) / load_factor) + 1))
+        hash_table = cls(num_slots, load_factor, **kwargs)
+        hash_table.insert_many(keys)
+        return hash_table
 
     def insert(self, key):
         """
@@ -56,14 +125,43 @@ class HashTable():
         inserts the key into the hash table. 
         @param key: Value used to hash an index to store this value at.
         """
-        index = self.hash_function(key)
-        if self.hash_table[index] == None:
-                self.hash_table[index] = key
-                self.num_entries += 1
+        if self.old_hash_table != None:
+            self.rehash_slots(self.rehash_step)
+
+        self.insert_entry(key, self.hasher(key))
 
         if not self.load_factor_in_range():
             # Often a prime number.
-            self.resize(2 * len(self.hash_table) - 1)
+            self.start_resize(2 * len(self.hash_table) - 1)
+
+    def insert_many(self, keys):
+        """
+        Inserts a batch of keys. The array is resized at most once up front
+        instead of checking the load factor after every key.
+        @param keys: The keys to insert. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        self.reserve(self.num_entries + len(keys))
+        if self.old_hash_table != None:
+            self.rehash_slots(self.rehash_step * len(keys))
+
+        for key, key_hash in zip(keys, key_hashes):
+            self.insert_entry(key, key_hash)
+
+    def insert_entry(self, key, key_hash):
+        """
+        Stores a key in its slot if the slot is free and the key is not already
+        in the hash table. Does not check the load factor.
+        @param key: The key to store.
+        @param key_hash: The full hash of key.
+        """
+        index = key_hash % self.num_slots
+        if (self.hash_table[index] == None and
+        self.find_entry(key, key_hash) == None):
+                # The full hash is cached next to the key.
+                self.hash_table[index] = (key, key_hash)
+                self.num_entries += 1
 
     def find(self, key):
         """
@@ -71,42 +169,177 @@ class HashTable():
         @param key: Key to search for within the hash table.
         @return: True if the key is in the hash table, false otherwise.
         """
-        index = self.hash_function(key)
-        return self.hash_table[index] == key
+        if self.old_hash_table != None:
+            self.rehash_slots(self.rehash_step)
+        return self.find_entry(key, self.hasher(key)) != None
+
+    def find_many(self, keys):
+        """
+        Searches for a batch of keys.
+        @param keys: The keys to search for. A NumPy array of integer keys is
+        hashed in one vectorised operation.
+        @return: A list holding True for every key in the hash table, false
+        otherwise.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        if self.old_hash_table != None:
+            self.rehash_slots(self.rehash_step * len(keys))
+        return [self.find_entry(key, key_hash) != None
+        for key, key_hash in zip(keys, key_hashes)]
 
     def remove(self, key):
         """
         Removes a key from the hash table.
         @param key: The key to remove.
         """
-        index = self.hash_function(key)
-        
-        if self.hash_table[index] == key:
-            self.hash_table[index] = None
+        if self.old_hash_table != None:
+            self.rehash_slots(self.rehash_step)
+        self.remove_entry(key, self.hasher(key))
+        self.shrink_if_sparse()
+
+    def remove_many(self, keys):
+        """
+        Removes a batch of keys from the hash table.
+        @param keys: The keys to remove. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        if self.old_hash_table != None:
+            self.rehash_slots(self.rehash_step * len(keys))
+        for key, key_hash in zip(keys, key_hashes):
+            self.remove_entry(key, key_hash)
+        self.shrink_if_sparse()
+
+    def remove_entry(self, key, key_hash):
+        """
+        Empties the slot holding a key.
+        @param key: The key to remove.
+        @param key_hash: The full hash of key.
+        """
+        location = self.find_entry(key, key_hash)
+        if location != None:
+            slots, index = location
+            slots[index] = None
             self.num_entries -= 1
 
+    def find_entry(self, key, key_hash):
+        """
+        Searches the slot of a key for the key. While an incremental rehash is
+        in progress, the key's slot in the old array is checked as well.
+        @param key: Key to search for.
+        @param key_hash: The full hash of key.
+        @return: A tuple (array, index) locating the key, None if the key is
+        not in the hash table.
+        """
+        index = key_hash % self.num_slots
+        entry = self.hash_table[index]
+        # Comparing the cached hashes first avoids most key comparisons.
+        if entry != None and entry[1] == key_hash and entry[0] == key:
+            return self.hash_table, index
+
+        if self.old_hash_table != None:
+            index = key_hash % len(self.old_hash_table)
+            entry = self.old_hash_table[index]
+            if entry != None and entry[1] == key_hash and entry[0] == key:
+                return self.old_hash_table, index
+        return None
+
     def hash_function(self, key):
         """
         Computes a hash value for a given give to use to map to a valid index.
         @param key: The key to hash.
         @return: The hashed value to use as the index of the given key.
         """
-        return key % self.num_slots
+        return self.hasher(key) % self.num_slots
     
     def resize(self, new_num_slots):
         """
-        Resizes the array. Called once is surpassed.
+        Resizes the array. Called once is surpassed. The cached hashes are
+        reused rather than recomputed. Any incremental rehash in progress is
+        finished first.
+        @param new_num_slots: Size to resize the array to (ideally a prime 
+        number).
+        """
+        self.finish_rehash()
+        start = perf_counter()
+        old_hash_table = self.hash_table
+        self.hash_table = new_num_slots * [None]
+        self.num_slots = new_num_slots
+
+        for entry in old_hash_table:
+            if entry != None:
+                self.rehash_entry(entry)
+        self.num_resizes += 1
+        self.resize_time += perf_counter() - start
+
+    def reserve(self, num_entries):
+        """
+        Resizes the array once, if needed, so that num_entries entries fit
+        without exceeding the load factor.
+        @param num_entries: The number of entries to make room for.
+        """
+        if num_entries / self.num_slots >= self.load_factor:
+            self.resize(next_prime(int(num_entries / self.load_factor) + 1))
+
+    def start_resize(self, new_num_slots):
+        """
+        Starts resizing the array. Unless the hash table is incremental, this
+        resizes the array all at once. Otherwise the current array is kept as
+        the old array and its slots are migrated by later operations.
         @param new_num_slots: Size to resize the array to (ideally a prime 
         number).
         """
-        old_hash_table = self.hash_table[:]
+        if not self.incremental:
+            self.resize(new_num_slots)
+            return
+
+        # Only one rehash can be in progress at a time.
+        self.finish_rehash()
+        start = perf_counter()
+        self.old_hash_table = self.hash_table
         self.hash_table = new_num_slots * [None]
         self.num_slots = new_num_slots
+        self.rehash_index = 0
+        self.num_resizes += 1
+        self.resize_time += perf_counter() - start
+
+    def rehash_slots(self, num_slots):
+        """
+        Migrates slots from the old array into the current array during an
+        incremental rehash.
+        @param num_slots: The maximum number of old slots to migrate.
+        """
+        start = perf_counter()
+        end = min(self.rehash_index + num_slots, len(self.old_hash_table))
+        while self.rehash_index < end:
+            entry = self.old_hash_table[self.rehash_index]
+            if entry != None:
+                self.rehash_entry(entry)
+                self.old_hash_table[self.rehash_index] = None
+            self.rehash_index += 1
+        self.resize_time += perf_counter() - start
 
-        for key in old_hash_table:
-            if key != None:
-                index = self.hash_function(key)
-                self.hash_table[index] = key
+        if self.rehash_index == len(self.old_hash_table):
+            self.old_hash_table = None
+
+    def rehash_entry(self, entry):
+        """
+        Moves an entry into its slot of the current array. With no collision
+        resolution, an entry whose slot is already taken is dropped and
+        counted.
+        @param entry: The (key, key_hash) entry to move.
+        """
+        index = entry[1] % self.num_slots
+        if self.hash_table[index] == None:
+            self.hash_table[index] = entry
+        else:
+            self.num_entries -= 1
+            self.num_dropped += 1
+
+    def finish_rehash(self):
+        """Migrates every remaining slot of an incremental rehash."""
+        if self.old_hash_table != None:
+            self.rehash_slots(len(self.old_hash_table))
     
     def load_factor_in_range(self):
         """
@@ -115,6 +348,30 @@ class HashTable():
         """
         return (self.num_entries / len(self.hash_table)) < self.load_factor
     
+    def shrink_if_sparse(self):
+        """
+        Shrinks the array once removals take the load factor below
+        min_load_factor. The smaller array is sized for half of load_factor,
+        the load right after growing, so the hash table must double or halve
+        again before the next resize and alternating inserts and removes around
+        a threshold cannot make it resize back and forth.
+        """
+        if (self.num_slots > self.min_num_slots and
+        self.num_entries / self.num_slots < self.min_load_factor):
+            new_num_slots = max(self.min_num_slots,
+            next_prime(int(2 * self.num_entries / self.load_factor) + 1))
+            if new_num_slots < self.num_slots:
+                self.start_resize(new_num_slots)
+
+    def shrink_to_fit(self):
+        """
+        Resizes the array to the smallest size (at least 11 slots) that holds
+        the current entries without exceeding the load factor, releasing the
+        memory left behind by a burst of inserts.
+        """
+        self.resize(max(11,
+        next_prime(int(self.num_entries / self.load_factor) + 1)))
+
     def size(self):
         """
         Checks to see the number of entries in the hash table.
@@ -122,10 +379,163 @@ class HashTable():
         """
         return self.num_entries
 
+    def stats(self):
+        """
+        Reports how full the array is. Takes O(m) time for m slots. While an
+        incremental rehash is in progress, both arrays are included.
+        @return: A dict holding the load factor, the number of filled slots
+        (buckets_filled), the occupancy histogram (slots holding 0 or 1 keys),
+        the maximum and mean probe length (always 1 once a key is stored, since
+        every key sits in its home slot), the number of resizes, the total time
+        spent resizing in seconds, the number of keys dropped by resizes and
+        the operation counts (None unless they
+        are being counted).
+        """
+        occupancy = [int(entry != None) for entry in self.hash_table]
+        if self.old_hash_table != None:
+            occupancy.extend(int(entry != None) for entry in
+            self.old_hash_table)
+        buckets_filled = sum(occupancy)
+        return {
+            "num_entries": self.num_entries,
+            "num_slots": self.num_slots,
+            "load_factor": self.num_entries / self.num_slots,
+            "buckets_filled": buckets_filled,
+            "occupancy_histogram": histogram(occupancy),
+            "max_probe_length": min(buckets_filled, 1),
+            "mean_probe_length": min(buckets_filled, 1),
+            "num_resizes": self.num_resizes,
+            "resize_time": self.resize_time,
+            "num_dropped": self.num_dropped,
+            "operation_counts": None if self.operation_counts == None else
+            dict(self.operation_counts),
+        }
+
+    def start_counting(self):
+        """
+        Starts counting calls to insert, find and remove and their batch
+        versions, and how many finds succeed. Hash tables that are not counted
+        pay nothing for it.
+        """
+        start_counting(self)
+
+    def stop_counting(self):
+        """Stops counting operations and discards the counts."""
+        stop_counting(self)
+
+    def save(self, path):
+        """
+        Writes a binary snapshot of the slot array to a file. Any incremental
+        rehash in progress is finished first.
+        @param path: The file to write.
+        """
+        self.finish_rehash()
+        write_snapshot(path, TABLE, self, self.hash_table)
+
+    @staticmethod
+    def open_mmap(path):
+        """
+        Reopens a snapshot written by save without reading it into memory.
+        @param path: The snapshot file.
+        @return: A read-only MappedHashTable over the file.
+        """
+        return MappedHashTable(path)
+
     def print_hash_table(self):
         """Prints the hash table."""
         for index, item in enumerate(self.hash_table):
             print(f"hash_table[{index}] = {item}")
+        if self.old_hash_table != None:
+            for index, item in enumerate(self.old_hash_table):
+                print(f"old_hash_table[{index}] = {item}")
+
+class MappedHashTable():
+    """
+    Read-only hash table over a memory-mapped snapshot written by
+    HashTable.save. Lookups read the key's slot record straight from the mapped
+    file.
+    """
+
+    def __init__(self, path):
+        """
+        Maps a snapshot file read-only.
+        @param path: The snapshot file.
+        """
+        snapshot = open_snapshot(path, TABLE)
+        self.file = snapshot["file"]
+        self.buffer = snapshot["buffer"]
+        self.heap_offset = snapshot["heap_offset"]
+        self.num_slots = snapshot["num_slots"]
+        self.num_entries = snapshot["num_entries"]
+        self.load_factor = snapshot["load_factor"]
+        self.hash_strategy = snapshot["hash_strategy"]
+        self.seed = snapshot["seed"]
+        self.hasher = snapshot["hasher"]
+
+    def find(self, key):
+        """
+        Searches for a key within the hash table.
+        @param key: Key to search for within the hash table.
+        @return: True if the key is in the hash table, false otherwise.
+        """
+        key_hash = self.hasher(key)
+        record = read_slot(self.buffer, key_hash % self.num_slots)
+        # Only decode the key if its cached hash matches.
+        return (record[0] == ENTRY and record[3] == key_hash & MASK_64 and
+        decode(self.buffer, self.heap_offset, record[1], record[4],
+        record[5]) == key)
+
+    def find_many(self, keys):
+        """
+        Searches for a batch of keys.
+        @param keys: The keys to search for.
+        @return: A list holding True for every key in the hash table, false
+        otherwise.
+        """
+        return [self.find(key) for key in keys]
+
+    def keys(self):
+        """
+        Iterates over the keys of the hash table, in slot order.
+        @return: A generator of keys.
+        """
+        for index in range(self.num_slots):
+            record = read_slot(self.buffer, index)
+            if record[0] == ENTRY:
+                yield decode(self.buffer, self.heap_offset, record[1],
+                record[4], record[5])
+
+    def size(self):
+        """
+        Checks to see the number of entries in the hash table.
+        @return: Number of entries within the hash table.
+        """
+        return self.num_entries
+
+    def close(self):
+        """Unmaps the snapshot and closes its file."""
+        self.buffer.close()
+        self.file.close()
+
+    def __contains__(self, key):
+        """Checks key in hash_table."""
+        return self.find(key)
+
+    def __len__(self):
+        """Returns len(hash_table)."""
+        return self.num_entries
+
+    def __iter__(self):
+        """Iterates over the keys of the hash table."""
+        return self.keys()
+
+    def __enter__(self):
+        """Allows using the mapped hash table in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the mapped hash table at the end of a with statement."""
+        self.close()
 
 """
 Notes:
@@ -160,4 +570,32 @@ Efficient Hash Tables Consider:
 2. Number of empty cells.
 3. Which hash function(s) to use.
 4. Which collision resolution strategy to use.
+
+Incremental Rehashing:
+- Resizing moves every key at once, so the insert that triggers it takes O(n)
+and causes a latency spike on large hash tables.
+- In incremental mode (the approach Redis uses for its dictionaries), the old
+array is kept alongside the new one. Every insert, find and remove migrates a
+bounded number of old slots (rehash_step), so the cost of the resize is spread
+over the following operations.
+- While the rehash is in progress, new keys only go into the new array and
+lookups check the key's slot in both arrays.
+
+Snapshots:
+- save writes the slot array to a file as fixed size records (see
+hash_snapshot.py) and open_mmap maps that file read-only. Nothing is decoded up
+front, so reopening a large hash table is instant and every process mapping the
+same file shares its pages.
+
+Resizing Without Collision Resolution:
+- Keys that sat in different slots of the old array may share a slot in the
+new one. The first key rehashed keeps the slot and the others are dropped,
+counted by num_dropped. Since removals would otherwise trigger such resizes on
+their own, shrinking is off unless a min_load_factor is given.
+
+Statistics:
+- stats() reports how full the array is and how often it has been resized. Many
+resizes point at a poorly chosen initial size, see from_iterable.
+- Counting operations wraps the counted methods on the instance itself, so a
+hash table that is not counted runs the plain methods with no added work.
 """
\ No newline at end of file
@@ -0,0 +1,473 @@
+"""
+A hash table is an implementation of the Set ADT.
+Set: unordered collection of elements that doesn't allow duplicates.
+    - i.e.: {2, 4, 6, 8} = {2, 6, 4, 8}
+
+Set ADT Operations:
+1. find(x): Return true if x exists in the set, false otherwise.
+2. insert(x): Adds x to the set.
+3. remove(x): Removes x from the set.
+4. size(): Returns the size of the set.
+"""
+
+"""
+Hash Table Operations:
+1. insert(key): Inserts a key into the hash table.
+2. find(key): Searches for a key within the hash table.
+3. remove(key): Removes a key from the hash table.
+4. size(): Returns the number of entries in the hash table.
+5. hash_function(key): Returns the index of every bucket the key may be stored
+in.
+6. insert_many(keys), find_many(keys), remove_many(keys): Batch versions of
+insert, find and remove.
+7. from_iterable(keys): Builds a hash table sized once for all of the keys.
+8. shrink_to_fit(): Shrinks the array to the smallest size that holds the keys.
+"""
+
+"""
+Hash Table Time-Complexity:
+1. find(x): O(1) worst case, at most num_hashes * bucket_size slots plus the
+stash are probed.
+2. insert(x): O(1) expected, amortized over the occasional rehash.
+3. remove(x): O(1) worst case.
+4. resize(): 0(n)
+"""
+
+import random
+from functools import partial
+from hash_functions import GOLDEN_RATIO_64, HASH_STRATEGIES, mix_64
+from hash_functions import next_prime
+
+class HashTable():
+    """
+    Implementation of a hash table data structure using cuckoo hashing.
+    Hash Function: num_hashes hash functions derived from one seeded hash,
+    each picking one bucket.
+    Collision Resolution Strategy: Cuckoo hashing. A key that finds all of its
+    buckets full kicks out an entry, which moves to one of its other buckets,
+    and so on. Keys that cannot be placed go into a small stash.
+    """
+
+    def __init__(self, num_buckets=11, num_hashes=2, bucket_size=1,
+    load_factor=None, hash_strategy="python", seed=0, max_kicks=100,
+    stash_size=4, min_load_factor=None):
+        """
+        Creates an empty hash table.
+        @param num_buckets: Number of buckets (ideally a prime number) to
+        initialize the hash table with.
+        @param num_hashes: The number of hash functions, and so of buckets,
+        each key may be stored in.
+        @param bucket_size: The number of slots in each bucket. 4 slots per
+        bucket lets the table fill up much further before inserts fail.
+        @param load_factor: The maximum accepted ratio of entries to slots
+        acceptable until resizing into a larger arrary occurs. Defaults to
+        0.45 with 2 hash functions and 1 slot per bucket, 0.85 otherwise.
+        @param hash_strategy: The name of a seeded hash function from
+        hash_functions, or a callable taking a key and a seed keyword and
+        returning the key's full hash.
+        @param seed: The seed the seeds of the hash functions are derived from.
+        @param max_kicks: The number of entries an insert may kick out before
+        giving up and stashing the last one.
+        @param stash_size: The number of keys the stash holds before the table
+        is rehashed with new hash functions.
+        @param min_load_factor: The ratio of entries to slots below which
+        removing keys shrinks the array. Defaults to a quarter of load_factor.
+        """
+        if hash_strategy == "division":
+            raise Exception("Error: Cuckoo hashing needs a seeded hash "
+            "function, not division.")
+        if not callable(hash_strategy) and hash_strategy not in HASH_STRATEGIES:
+            raise Exception(f"Error: Unknown hash strategy {hash_strategy}.")
+        if num_hashes < 2:
+            raise Exception("Error: Cuckoo hashing needs at least 2 hash "
+            "functions.")
+        if load_factor == None:
+            load_factor = 0.45 if num_hashes * bucket_size == 2 else 0.85
+        if min_load_factor == None:
+            min_load_factor = load_factor / 4
+        if not 0 <= min_load_factor < load_factor / 2:
+            raise Exception("Error: min_load_factor must be below half of "
+            "load_factor.")
+
+        self.hash_table = (num_buckets * bucket_size) * [None]
+        self.stash = []
+        self.num_entries = 0
+        self.num_buckets = num_buckets
+        self.num_hashes = num_hashes
+        self.bucket_size = bucket_size
+        self.load_factor = load_factor
+        self.min_load_factor = min_load_factor
+        # The array never shrinks below the size it was created with.
+        self.min_num_buckets = num_buckets
+        self.hash_strategy = hash_strategy
+        self.max_kicks = max_kicks
+        self.stash_size = stash_size
+        self.num_rehashes = 0
+        # Picks the entries to kick out.
+        self.rng = random.Random(seed)
+        self.set_seed(seed)
+
+    @classmethod
+    def from_iterable(cls, keys, load_factor=None, **kwargs):
+        """
+        Builds a hash table from an iterable of keys, sizing the array once for
+        all of them.
+        @param keys: The keys to insert.
+        @param load_factor: The load factor of the new hash table.
+        @param kwargs: Any other argument accepted by the constructor.
+        @return: The new hash table.
+        """
+        hash_table = cls(load_factor=load_factor, **kwargs)
+        hash_table.insert_many(keys)
+        return hash_table
+
+    def set_seed(self, seed):
+        """
+        Switches to a new set of hash functions.
+        @param seed: The seed of the base hash function.
+        """
+        self.seed = seed
+        hash_function = HASH_STRATEGIES.get(self.hash_strategy,
+        self.hash_strategy)
+        self.hasher = partial(hash_function, seed=seed)
+
+    def hash_key(self, key):
+        """
+        Computes every full hash of a key. The key is hashed once, and each
+        hash function mixes that base hash with its own offset.
+        @param key: The key to hash.
+        @return: A tuple holding the hash of key under each hash function.
+        """
+        base_hash = self.hasher(key)
+        return tuple(mix_64(base_hash + i * GOLDEN_RATIO_64)
+        for i in range(self.num_hashes))
+
+    def insert(self, key):
+        """
+        Inserts a key into the hash table, if it is not already in it. If the
+        load factor is too high, the array is resized first.
+        @param key: The key to insert.
+        """
+        if self.find_entry(key) != None:
+            return
+
+        self.num_entries += 1
+        if not self.load_factor_in_range():
+            # Often a prime number.
+            self.resize(next_prime(2 * self.num_buckets - 1))
+        self.insert_entry((key, self.hash_key(key)))
+
+    def insert_many(self, keys):
+        """
+        Inserts a batch of keys. The array is resized at most once up front
+        instead of checking the load factor after every key.
+        @param keys: The keys to insert.
+        """
+        keys = list(keys)
+        self.reserve(self.num_entries + len(keys))
+        for key in keys:
+            self.insert(key)
+
+    def insert_entry(self, entry):
+        """
+        Stores an entry whose key is not in the hash table yet. If no slot can
+        be found for it (or for the entry it ends up kicking out), that entry
+        goes into the stash, and once the stash is full the table is rehashed.
+        Does not check the load factor.
+        @param entry: The (key, key_hashes) entry to store.
+        """
+        leftover = self.place(entry)
+        if leftover == None:
+            return
+        if len(self.stash) < self.stash_size:
+            self.stash.append(leftover)
+        else:
+            self.rehash(self.entries() + [leftover], self.num_buckets)
+
+    def place(self, entry):
+        """
+        Stores an entry in a free slot of one of its buckets. If they are all
+        full, a random entry of one of them is kicked out and placed the same
+        way, up to max_kicks times.
+        @param entry: The (key, key_hashes) entry to store.
+        @return: None if every entry found a slot, otherwise the entry left
+        without one.
+        """
+        hash_table = self.hash_table
+        bucket_size = self.bucket_size
+        last_slot = None
+        for _ in range(self.max_kicks):
+            slot = self.free_slot(entry[1])
+            if slot != None:
+                hash_table[slot] = entry
+                return None
+
+            slots = [(key_hash % self.num_buckets) * bucket_size + i
+            for key_hash in entry[1] for i in range(bucket_size)]
+            # Kicking the entry just placed back out would undo the last move.
+            if last_slot in slots and len(slots) > 1:
+                slots.remove(last_slot)
+            slot = self.rng.choice(slots)
+            hash_table[slot], entry = entry, hash_table[slot]
+            last_slot = slot
+
+        slot = self.free_slot(entry[1])
+        if slot != None:
+            hash_table[slot] = entry
+            return None
+        return entry
+
+    def free_slot(self, key_hashes):
+        """
+        Finds an empty slot in the buckets of a key.
+        @param key_hashes: The full hashes of the key.
+        @return: The index of the first empty slot, None if all are full.
+        """
+        for key_hash in key_hashes:
+            start = (key_hash % self.num_buckets) * self.bucket_size
+            for slot in range(start, start + self.bucket_size):
+                if self.hash_table[slot] == None:
+                    return slot
+        return None
+
+    def find(self, key):
+        """
+        Searches for a key within the hash table. Probes at most num_hashes
+        buckets and the stash, however full the table is.
+        @param key: Key to search for within the hash table.
+        @return: True if the key is in the hash table, false otherwise.
+        """
+        return self.find_entry(key) != None
+
+    def find_many(self, keys):
+        """
+        Searches for a batch of keys.
+        @param keys: The keys to search for.
+        @return: A list holding True for every key in the hash table, false
+        otherwise.
+        """
+        return [self.find_entry(key) != None for key in keys]
+
+    def find_entry(self, key):
+        """
+        Searches the buckets of a key, then the stash. The hashes of the key
+        are only derived as the buckets are visited.
+        @param key: Key to search for.
+        @return: A tuple (container, index) locating the key, where container
+        is the array or the stash. None if the key is not in the hash table.
+        """
+        base_hash = self.hasher(key)
+        for i in range(self.num_hashes):
+            key_hash = mix_64(base_hash + i * GOLDEN_RATIO_64)
+            start = (key_hash % self.num_buckets) * self.bucket_size
+            for slot in range(start, start + self.bucket_size):
+                entry = self.hash_table[slot]
+                # Comparing the cached hashes first avoids most key comparisons.
+                if entry != None and entry[1][i] == key_hash and \
+                entry[0] == key:
+                    return self.hash_table, slot
+
+        for index, entry in enumerate(self.stash):
+            if entry[0] == key:
+                return self.stash, index
+        return None
+
+    def remove(self, key):
+        """
+        Removes a key from the hash table. If the key leaves a slot free, a key
+        waiting in the stash may move into it.
+        @param key: The key to remove.
+        """
+        location = self.find_entry(key)
+        if location == None:
+            return
+
+        container, index = location
+        if container is self.stash:
+            del self.stash[index]
+        else:
+            self.hash_table[index] = None
+            self.unstash()
+        self.num_entries -= 1
+        self.shrink_if_sparse()
+
+    def remove_many(self, keys):
+        """
+        Removes a batch of keys from the hash table.
+        @param keys: The keys to remove.
+        """
+        for key in keys:
+            self.remove(key)
+
+    def unstash(self):
+        """Moves the stashed keys that now have a free slot into the array."""
+        for entry in self.stash[:]:
+            slot = self.free_slot(entry[1])
+            if slot != None:
+                self.hash_table[slot] = entry
+                self.stash.remove(entry)
+
+    def entries(self):
+        """
+        Collects every entry of the hash table.
+        @return: A list of the (key, key_hashes) entries in the array and in the
+        stash.
+        """
+        return [entry for entry in self.hash_table if entry != None] + \
+        self.stash
+
+    def hash_function(self, key):
+        """
+        Computes the buckets a key may be stored in.
+        @param key: The key to hash.
+        @return: A list holding the index of the key's bucket under each hash
+        function.
+        """
+        return [key_hash % self.num_buckets for key_hash in self.hash_key(key)]
+
+    def resize(self, new_num_buckets):
+        """
+        Resizes the array, reusing the cached hashes. If the entries do not all
+        fit with the current hash functions, the table is rehashed.
+        @param new_num_buckets: Number of buckets to resize the array to
+        (ideally a prime number).
+        """
+        entries = self.entries()
+        if not self.rebuild(entries, new_num_buckets):
+            self.rehash(entries, new_num_buckets)
+
+    def rehash(self, entries, num_buckets):
+        """
+        Rebuilds the table with new hash functions until every entry fits. A
+        few failures in a row mean the table is too full rather than unlucky,
+        so the array grows after every third attempt.
+        @param entries: The (key, key_hashes) entries to store.
+        @param num_buckets: The number of buckets to rebuild the array with.
+        """
+        keys = [entry[0] for entry in entries]
+        attempts = 0
+        while True:
+            attempts += 1
+            if attempts % 3 == 0:
+                num_buckets = next_prime(2 * num_buckets - 1)
+            self.set_seed(self.seed + 1)
+            self.num_rehashes += 1
+            entries = [(key, self.hash_key(key)) for key in keys]
+            if self.rebuild(entries, num_buckets):
+                return
+
+    def rebuild(self, entries, num_buckets):
+        """
+        Empties the array and the stash, then stores the entries again.
+        @param entries: The (key, key_hashes) entries to store.
+        @param num_buckets: The number of buckets to rebuild the array with.
+        @return: True if every entry was stored, false if the stash overflowed.
+        """
+        self.hash_table = (num_buckets * self.bucket_size) * [None]
+        self.num_buckets = num_buckets
+        self.stash = []
+
+        for entry in entries:
+            leftover = self.place(entry)
+            if leftover != None:
+                if len(self.stash) == self.stash_size:
+                    return False
+                self.stash.append(leftover)
+        return True
+
+    def reserve(self, num_entries):
+        """
+        Resizes the array once, if needed, so that num_entries entries fit
+        without exceeding the load factor.
+        @param num_entries: The number of entries to make room for.
+        """
+        if num_entries / len(self.hash_table) >= self.load_factor:
+            self.resize(next_prime(int(num_entries / self.load_factor /
+            self.bucket_size) + 1))
+
+    def load_factor_in_range(self):
+        """
+        Checks to see if the load factor is within range.
+        @return: True is the load factor is within range, false otherwise.
+        """
+        return (self.num_entries / len(self.hash_table)) < self.load_factor
+
+    def shrink_if_sparse(self):
+        """
+        Shrinks the array once removals take the load factor below
+        min_load_factor. The smaller array is sized for half of load_factor,
+        like after growing, so that it does not resize back and forth.
+        """
+        if (self.num_buckets > self.min_num_buckets and
+        self.num_entries / len(self.hash_table) < self.min_load_factor):
+            new_num_buckets = max(self.min_num_buckets, next_prime(int(2 *
+            self.num_entries / self.load_factor / self.bucket_size) + 1))
+            if new_num_buckets < self.num_buckets:
+                self.resize(new_num_buckets)
+
+    def shrink_to_fit(self):
+        """
+        Resizes the array to the smallest size (at least 11 buckets) that holds
+        the current entries without exceeding the load factor.
+        """
+        self.resize(max(11, next_prime(int(self.num_entries /
+        self.load_factor / self.bucket_size) + 1)))
+
+    def size(self):
+        """
+        Checks to see the number of entries in the hash table.
+        @return: Number of entries within the hash table.
+        """
+        return self.num_entries
+
+    def print_hash_table(self):
+        """Prints the hash table."""
+        for bucket in range(self.num_buckets):
+            start = bucket * self.bucket_size
+            items = [entry if entry == None else entry[0]
+            for entry in self.hash_table[start:start + self.bucket_size]]
+            print(f"hash_table[{bucket}] = {items}")
+        print(f"stash = {[entry[0] for entry in self.stash]}")
+
+"""
+Notes:
+
+Cuckoo Hashing:
+- Every key has num_hashes candidate buckets, one per hash function, and is
+always stored in one of them (or in the stash). A lookup only ever probes those
+buckets, so find and remove take O(1) time in the worst case, not just on
+average like chaining or linear probing.
+- Inserting into a full set of buckets kicks out one of the entries there, like
+a cuckoo chick pushing eggs out of a nest. The kicked out entry moves to one of
+its other buckets, possibly kicking out another entry, and so on. The entry to
+kick out is picked at random (a random walk), which works for any number of
+hash functions.
+
+Load Factor:
+- With 2 hash functions and 1 slot per bucket, inserts start failing just below
+a load factor of 0.5.
+- Every extra hash function or bucket slot raises that limit sharply: with 2
+hash functions and 4 slot buckets, or 3 hash functions and 1 slot buckets, the
+table can be filled to around 0.9. A 4 slot bucket also tends to sit in one or
+two cache lines, so probing it costs little more than probing a single slot.
+
+Stash:
+- Sometimes a few keys cannot be placed even at low load (their buckets form a
+cycle). Instead of rehashing the whole table for each of them, up to stash_size
+such keys are kept in a small list that every lookup also checks.
+- Removing a key may free a slot for a stashed key, which then moves back.
+
+Rehashing:
+- Once the stash is full, the table is rebuilt with new hash functions (derived
+from a new seed), which recomputes every hash. Growing instead reuses the
+cached hashes.
+- If rebuilding keeps failing, the table is too full for its hash functions
+and the array grows.
+- The key is hashed once with the seeded hash strategy and every hash function
+mixes that base hash (with the SplitMix64 finalizer) together with its own
+offset. Seeding each hash function separately with the XOR based strategies
+would pair keys up: k ^ s1 and k ^ s2 are the same two values for the key
+k ^ s1 ^ s2, so both keys would share both buckets.
+- The hash functions must be seeded to be replaced, so the division method
+(which ignores the seed) is not allowed.
+"""
@@ -18,6 +18,14 @@ Hash Table Operations:
 4. size(): Returns the number of entries in the hash table.
 5. hash_function(key): Returns a hash value for a given key to use to map to a
 valid index.
+6. insert_many(keys), find_many(keys), remove_many(keys): Batch versions of
+insert, find and remove.
+7. keys(): Iterates over the keys of the hash table.
+8. from_iterable(keys): Builds a hash table sized once for all of the keys.
+9. shrink_to_fit(): Shrinks the array to the smallest size that holds the keys.
+10. stats(): Reports the load factor, bucket occupancy, chain lengths and
+resizes. start_counting() and stop_counting() turn the operation counts on and
+off.
 """
 
 """
@@ -28,26 +36,82 @@ Hash Table Time-Complexity:
 4. resize(): 0(n)
 """
 
+from time import perf_counter
+from hash_functions import get_hash_function, hash_many, next_prime
+from hash_stats import histogram, mean, start_counting, stop_counting
+
 class HashTable():
     """
     Implementation of a hash table data structure. 
-    Hash Function: Static hashing using the division method.
+    Hash Function: Static hashing, using the division method unless another
+    hash strategy is given.
     Collision Resolution Strategy: Closed Addressing with Separate Chaining.
     """
 
-    def __init__(self, num_slots=11, load_factor=0.75):
+    def __init__(self, num_slots=11, load_factor=0.75,
+    hash_strategy="division", seed=0, incremental=False, rehash_step=4,
+    min_load_factor=None):
         """
         Creates an empty hash table.
         @param num_slots: Number of slots (ideally a prime number) to initialize
         the hash table with.
         @param load_factor: The maximum accepted ratio of entries to slots 
         acceptable until resizing and rehashing into a larger arrary occurs. 
+        @param hash_strategy: The name of a hash function from hash_functions,
+        or a callable taking a key and returning its full hash.
+        @param seed: The seed of the hash function.
+        @param incremental: If True, the keys are moved into a resized array a
+        few buckets at a time by later operations instead of all at once.
+        @param rehash_step: The number of old buckets each insert, find and
+        remove migrates while an incremental rehash is in progress.
+        @param min_load_factor: The ratio of entries to slots below which
+        removing keys shrinks the array. Defaults to a quarter of
+        load_factor and must stay below half of it. 0 disables shrinking.
         """
         self.hash_table = [[] for _ in range(num_slots)]
         self.num_entries = 0
         self.buckets_filled = 0
         self.num_slots = num_slots
         self.load_factor = load_factor
+        if min_load_factor == None:
+            min_load_factor = load_factor / 4
+        if not 0 <= min_load_factor < load_factor / 2:
+            raise Exception("Error: min_load_factor must be below half of "
+            "load_factor.")
+        self.min_load_factor = min_load_factor
+        # The array never shrinks below the size it was created with.
+        self.min_num_slots = num_slots
+        self.hash_strategy = hash_strategy
+        self.seed = seed
+        self.hasher = get_hash_function(hash_strategy, seed)
+        self.incremental = incremental
+        self.rehash_step = rehash_step
+        # Array being migrated from while an incremental rehash is in progress.
+        self.old_hash_table = None
+        self.rehash_index = 0
+        # Reported by stats(). Operations are only counted once start_counting
+        # is called.
+        self.num_resizes = 0
+        self.resize_time = 0.0
+        self.operation_counts = None
+
+    @classmethod
+    def from_iterable(cls, keys, load_factor=0.75, **kwargs):
+        """
+        Builds a hash table from an iterable of keys, sizing the array once for
+        all of them.
+        @param keys: The keys to insert. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        @param load_factor: The load factor of the new hash table.
+        @param kwargs: Any other argument accepted by the constructor.
+        @return: The new hash table.
+        """
+        if not hasattr(keys, "__len__"):
+            keys = list(keys)
+        num_slots = max(11, next_prime(int(len(keys) / load_factor) + 1))
+        hash_table = cls(num_slots, load_factor, **kwargs)
+        hash_table.insert_many(keys)
+        return hash_table
 
     def insert(self, key):
         """
@@ -56,21 +120,50 @@ class HashTable():
         inserts the key into the hash table. 
         @param key: Value used to hash an index to store this value at.
         """
-        index = self.hash_function(key)
-        for elm in self.hash_table[index]:
-            # Already exists in hash table.
-            if elm == key:
-                return
-        
-        if len(self.hash_table[index]) == 0:
-            self.buckets_filled += 1
-            
-        self.hash_table[index].append(key)
-        self.num_entries += 1
+        if self.old_hash_table != None:
+            self.rehash_buckets(self.rehash_step)
+
+        self.insert_entry(key, self.hasher(key))
 
         if not self.load_factor_in_range():
             # Often a prime number.
-            self.resize(2 * len(self.hash_table) - 1)
+            self.start_resize(2 * len(self.hash_table) - 1)
+
+    def insert_many(self, keys):
+        """
+        Inserts a batch of keys. The array is resized at most once up front
+        instead of checking the load factor after every key.
+        @param keys: The keys to insert. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        self.reserve(self.num_entries + len(keys))
+        if self.old_hash_table != None:
+            self.rehash_buckets(self.rehash_step * len(keys))
+
+        for key, key_hash in zip(keys, key_hashes):
+            self.insert_entry(key, key_hash)
+
+    def insert_entry(self, key, key_hash):
+        """
+        Appends a key to its bucket unless it is already in the hash table.
+        Does not check the load factor.
+        @param key: The key to store.
+        @param key_hash: The full hash of key.
+        """
+        # Already exists in hash table.
+        if self.find_entry(key, key_hash) != None:
+            return
+
+        index = key_hash % self.num_slots
+        bucket = self.hash_table[index]
+        if len(bucket) == 0:
+            self.buckets_filled += 1
+            bucket = self.hash_table[index] = []
+            
+        # The full hash is cached next to the key.
+        bucket.append((key, key_hash))
+        self.num_entries += 1
 
     def find(self, key):
         """
@@ -78,51 +171,192 @@ class HashTable():
         @param key: Key to search for within the hash table.
         @return: True if the key is in the hash table, false otherwise.
         """
-        index = self.hash_function(key)
-        for elm in self.hash_table[index]:
-            if elm == key:
-                return True
-        return False
+        if self.old_hash_table != None:
+            self.rehash_buckets(self.rehash_step)
+        return self.find_entry(key, self.hasher(key)) != None
+
+    def find_many(self, keys):
+        """
+        Searches for a batch of keys.
+        @param keys: The keys to search for. A NumPy array of integer keys is
+        hashed in one vectorised operation.
+        @return: A list holding True for every key in the hash table, false
+        otherwise.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        if self.old_hash_table != None:
+            self.rehash_buckets(self.rehash_step * len(keys))
+        return [self.find_entry(key, key_hash) != None
+        for key, key_hash in zip(keys, key_hashes)]
                 
     def remove(self, key):
         """
         Removes a key from the hash table.
         @param key: The key to remove.
         """
-        index = self.hash_function(key)
-        for elm in self.hash_table[index]:
-            if elm == key:
-                self.hash_table[index].remove(key)
-                self.num_entries -= 1
+        if self.old_hash_table != None:
+            self.rehash_buckets(self.rehash_step)
+        self.remove_entry(key, self.hasher(key))
+        self.shrink_if_sparse()
 
-        if len(self.hash_table[index]) == 0:
+    def remove_many(self, keys):
+        """
+        Removes a batch of keys from the hash table.
+        @param keys: The keys to remove. A NumPy array of integer keys is hashed
+        in one vectorised operation.
+        """
+        keys, key_hashes = hash_many(self.hasher, keys)
+        if self.old_hash_table != None:
+            self.rehash_buckets(self.rehash_step * len(keys))
+        for key, key_hash in zip(keys, key_hashes):
+            self.remove_entry(key, key_hash)
+        self.shrink_if_sparse()
+
+    def remove_entry(self, key, key_hash):
+        """
+        Deletes a key from its bucket.
+        @param key: The key to remove.
+        @param key_hash: The full hash of key.
+        """
+        location = self.find_entry(key, key_hash)
+        if location == None:
+            return
+
+        bucket, position = location
+        del bucket[position]
+        self.num_entries -= 1
+        # Only buckets of the current array are counted as filled.
+        if (len(bucket) == 0 and
+        bucket is self.hash_table[key_hash % self.num_slots]):
             self.buckets_filled -= 1
+
+    def find_entry(self, key, key_hash):
+        """
+        Searches the bucket of a key for the key. While an incremental rehash
+        is in progress, the key's bucket in the old array is searched as well.
+        @param key: Key to search for.
+        @param key_hash: The full hash of key.
+        @return: A tuple (bucket, position) locating the key, None if the key
+        is not in the hash table.
+        """
+        bucket = self.hash_table[key_hash % self.num_slots]
+        for position, elm in enumerate(bucket):
+            # Comparing the cached hashes first avoids most key comparisons.
+            if elm[1] == key_hash and elm[0] == key:
+                return bucket, position
+
+        if self.old_hash_table != None:
+            bucket = self.old_hash_table[key_hash % len(self.old_hash_table)]
+            for position, elm in enumerate(bucket):
+                if elm[1] == key_hash and elm[0] == key:
+                    return bucket, position
+        return None
             
+    def keys(self):
+        """
+        Iterates over the keys of the hash table, including the ones still in
+        the old array during an incremental rehash. The keys are collected
+        before the first one is returned, so buckets migrated by operations
+        made while iterating do not return a key twice.
+        @return: An iterator of keys.
+        """
+        keys = [elm[0] for hash_table in (self.old_hash_table, self.hash_table)
+        if hash_table != None for bucket in hash_table for elm in bucket]
+        return iter(keys)
+
     def hash_function(self, key):
         """
         Computes a hash value for a given give to use to map to a valid index.
         @param key: The key to hash.
         @return: The hashed value to use as the index of the given key.
         """
-        return key % self.num_slots
+        return self.hasher(key) % self.num_slots
     
     def resize(self, new_num_slots):
         """
-        Resizes the array. Called once is surpassed.
+        Resizes the array. Called once is surpassed. The cached hashes are
+        reused rather than recomputed. Any incremental rehash in progress is
+        finished first.
         @param new_num_slots: Size to resize the array to (ideally a prime 
         number).
         """
-        old_hash_table = self.hash_table[:]
+        self.finish_rehash()
+        start = perf_counter()
+        old_hash_table = self.hash_table
         self.hash_table = [[] for _ in range(new_num_slots)]
         self.num_slots = new_num_slots
         self.buckets_filled = 0
 
         for bucket in old_hash_table:
-            for key in bucket:        
-                index = self.hash_function(key)
+            for elm in bucket:
+                index = elm[1] % new_num_slots
                 if len(self.hash_table[index]) == 0:
                     self.buckets_filled += 1
-                self.hash_table[index].append(key)
+                self.hash_table[index].append(elm)
+        self.num_resizes += 1
+        self.resize_time += perf_counter() - start
+
+    def reserve(self, num_entries):
+        """
+        Resizes the array once, if needed, so that num_entries entries fit
+        without exceeding the load factor.
+        @param num_entries: The number of entries to make room for.
+        """
+        if num_entries / self.num_slots >= self.load_factor:
+            self.resize(next_prime(int(num_entries / self.load_factor) + 1))
+
+    def start_resize(self, new_num_slots):
+        """
+        Starts resizing the array. Unless the hash table is incremental, this
+        resizes the array all at once. Otherwise the current array is kept as
+        the old array and its buckets are migrated by later operations.
+        @param new_num_slots: Size to resize the array to (ideally a prime 
+        number).
+        """
+        if not self.incremental:
+            self.resize(new_num_slots)
+            return
+
+        # Only one rehash can be in progress at a time.
+        self.finish_rehash()
+        start = perf_counter()
+        self.old_hash_table = self.hash_table
+        # Empty buckets share one empty tuple and are replaced by a list on
+        # their first insert, so allocating the array stays cheap.
+        self.hash_table = new_num_slots * [()]
+        self.num_slots = new_num_slots
+        self.buckets_filled = 0
+        self.rehash_index = 0
+        self.num_resizes += 1
+        self.resize_time += perf_counter() - start
+
+    def rehash_buckets(self, num_buckets):
+        """
+        Migrates buckets from the old array into the current array during an
+        incremental rehash.
+        @param num_buckets: The maximum number of old buckets to migrate.
+        """
+        start = perf_counter()
+        end = min(self.rehash_index + num_buckets, len(self.old_hash_table))
+        while self.rehash_index < end:
+            for elm in self.old_hash_table[self.rehash_index]:
+                index = elm[1] % self.num_slots
+                bucket = self.hash_table[index]
+                if len(bucket) == 0:
+                    self.buckets_filled += 1
+                    bucket = self.hash_table[index] = []
+                bucket.append(elm)
+            self.old_hash_table[self.rehash_index] = ()
+            self.rehash_index += 1
+        self.resize_time += perf_counter() - start
+
+        if self.rehash_index == len(self.old_hash_table):
+            self.old_hash_table = None
+
+    def finish_rehash(self):
+        """Migrates every remaining bucket of an incremental rehash."""
+        if self.old_hash_table != None:
+            self.rehash_buckets(len(self.old_hash_table))
 
     def load_factor_in_range(self):
         """
@@ -131,6 +365,72 @@ class HashTable():
         """
         return (self.buckets_filled / len(self.hash_table)) < self.load_factor
     
+    def shrink_if_sparse(self):
+        """
+        Shrinks the array once removals take the load factor below
+        min_load_factor. The smaller array is sized for half of load_factor,
+        the load right after growing, so the hash table must double or halve
+        again before the next resize and alternating inserts and removes around
+        a threshold cannot make it resize back and forth.
+        """
+        if (self.num_slots > self.min_num_slots and
+        self.num_entries / self.num_slots < self.min_load_factor):
+            new_num_slots = max(self.min_num_slots,
+            next_prime(int(2 * self.num_entries / self.load_factor) + 1))
+            if new_num_slots < self.num_slots:
+                self.start_resize(new_num_slots)
+
+    def shrink_to_fit(self):
+        """
+        Resizes the array to the smallest size (at least 11 slots) that holds
+        the current entries without exceeding the load factor, releasing the
+        memory left behind by a burst of inserts.
+        """
+        self.resize(max(11,
+        next_prime(int(self.num_entries / self.load_factor) + 1)))
+
+    def stats(self):
+        """
+        Reports how the keys are spread over the buckets. Takes O(m) time for
+        m buckets. While an incremental rehash is in progress, both arrays are
+        included.
+        @return: A dict holding the load factor, the number of non-empty
+        buckets (buckets_filled), the occupancy histogram (the number of
+        buckets holding 0, 1, 2, ... keys), the maximum and mean length of
+        the non-empty chains, the number of resizes, the total time spent
+        resizing in seconds and the operation counts (None unless they are
+        being counted).
+        """
+        occupancy = [len(bucket) for bucket in self.hash_table]
+        if self.old_hash_table != None:
+            occupancy.extend(len(bucket) for bucket in self.old_hash_table)
+        chain_lengths = [length for length in occupancy if length > 0]
+        return {
+            "num_entries": self.num_entries,
+            "num_slots": self.num_slots,
+            "load_factor": self.num_entries / self.num_slots,
+            "buckets_filled": len(chain_lengths),
+            "occupancy_histogram": histogram(occupancy),
+            "max_chain_length": max(chain_lengths, default=0),
+            "mean_chain_length": mean(chain_lengths),
+            "num_resizes": self.num_resizes,
+            "resize_time": self.resize_time,
+            "operation_counts": None if self.operation_counts == None else
+            dict(self.operation_counts),
+        }
+
+    def start_counting(self):
+        """
+        Starts counting calls to insert, find and remove and their batch
+        versions, and how many finds succeed. Hash tables that are not counted
+        pay nothing for it.
+        """
+        start_counting(self)
+
+    def stop_counting(self):
+        """Stops counting operations and discards the counts."""
+        stop_counting(self)
+
     def size(self):
         """
         Checks to see the number of entries in the hash table.
@@ -141,7 +441,10 @@ class HashTable():
     def print_hash_table(self):
         """Prints the hash table."""
         for index, item in enumerate(self.hash_table):
-            print(f"hash_table[{index}] = {item}")
+            print(f"hash_table[{index}] = {list(item)}")
+        if self.old_hash_table != None:
+            for index, item in enumerate(self.old_hash_table):
+                print(f"old_hash_table[{index}] = {list(item)}")
 
 """
 Notes:
@@ -192,4 +495,21 @@ Separate Chaining Worst Case Time-Complexity:
 3. remove(x): O(n)
 - If all the keys are mapped to the same index, we would need to probe over all
 n elements.
+
+Incremental Rehashing:
+- Resizing moves every key at once, so the insert that triggers it takes O(n)
+and causes a latency spike on large hash tables.
+- In incremental mode (the approach Redis uses for its dictionaries), the old
+array is kept alongside the new one. Every insert, find and remove migrates a
+bounded number of old buckets (rehash_step), so the cost of the resize is
+spread over the following operations.
+- While the rehash is in progress, new keys only go into the new array and
+lookups check the key's bucket in both arrays.
+
+Statistics:
+- stats() reports the occupancy histogram of the buckets and the length of the
+chains. With a good hash function the chains stay short (mostly 1 or 2
+keys), a long chain points at many keys sharing a bucket.
+- Counting operations wraps the counted methods on the instance itself, so a
+hash table that is not counted runs the plain methods with no added work.
 """
\ No newline at end of file
@@ -0,0 +1,52 @@
+from concurrent_hash_map import ConcurrentHashMap
+from threading import Thread
+import unittest
+
+class TestConcurrentHashMap(unittest.TestCase):
+    """Tests for the ConcurrentHashMap class."""
+
+    def test_mapping_protocol(self):
+        """Does the concurrent hash map behave like a HashMap?"""
+        test_hash_map = ConcurrentHashMap(num_stripes=4)
+        for key in range(100):
+            test_hash_map[key] = str(key)
+        self.assertEqual(len(test_hash_map), 100)
+        self.assertEqual(test_hash_map[42], "42")
+        self.assertTrue(test_hash_map.find(42, "42"))
+        self.assertEqual(test_hash_map.setdefault(42, "x"), "42")
+        self.assertEqual(test_hash_map.pop(42), "42")
+        self.assertFalse(42 in test_hash_map)
+        self.assertEqual(sum(test_hash_map.stripe_entries), 99)
+        self.assertEqual(sorted(test_hash_map)[:3], [0, 1, 2])
+
+    def test_threads(self):
+        """Do concurrent writers lose no updates across resizes?"""
+        test_hash_map = ConcurrentHashMap(num_stripes=8)
+
+        def worker(thread_id):
+            base = thread_id * 10000
+            for key in range(base, base + 2000):
+                test_hash_map.insert(key, key)
+            for key in range(base, base + 2000, 2):
+                test_hash_map.remove(key)
+            for key in range(base, base + 2000):
+                test_hash_map.setdefault(key, -key)
+
+        threads = [Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(test_hash_map.size(), 16000)
+        self.assertEqual(len(list(test_hash_map.items())), 16000)
+        self.assertEqual(test_hash_map.buckets_filled,
+        sum(1 for bucket in test_hash_map.hash_map if len(bucket) > 0))
+        for thread_id in range(8):
+            base = thread_id * 10000
+            self.assertEqual(test_hash_map[base], -base)
+            self.assertEqual(test_hash_map[base + 1], base + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+from filters import BloomFilter, CountingBloomFilter, CuckooFilter
+from filters import FilteredHashTable
+import unittest
+
+class TestFilters(unittest.TestCase):
+    """Tests for the membership filters."""
+
+    def test_false_positive_rate(self):
+        """Are inserted keys always found, and others rarely?"""
+        for filter_class in (BloomFilter, CountingBloomFilter, CuckooFilter):
+            test_filter = filter_class(5000, 0.01)
+            test_filter.insert_many(range(5000))
+            self.assertEqual(len(test_filter), 5000)
+            self.assertTrue(all(test_filter.find_many(range(5000))))
+            false_positives = sum(test_filter.find_many(range(5000, 25000)))
+            self.assertLess(false_positives / 20000, 0.02)
+
+    def test_remove(self):
+        """Do removed keys stop passing the filters that support removal?"""
+        for filter_class in (CountingBloomFilter, CuckooFilter):
+            test_filter = filter_class(1000, 0.001)
+            for key in ("a", "b", "c"):
+                test_filter.insert(key)
+            test_filter.remove("b")
+            self.assertTrue("a" in test_filter)
+            self.assertFalse("b" in test_filter)
+            self.assertEqual(test_filter.size(), 2)
+
+    def test_cuckoo_filter_full(self):
+        """Does a full cuckoo filter keep every key it accepted?"""
+        test_filter = CuckooFilter(100)
+        with self.assertRaises(Exception):
+            for key in range(1000):
+                test_filter.insert(key)
+        self.assertIsNotNone(test_filter.victim)
+        self.assertTrue(all(test_filter.find_many(range(len(test_filter)))))
+
+    def test_cuckoo_filter_slot_size(self):
+        """Are the slots only as wide as the fingerprints?"""
+        for false_positive_rate, itemsize in ((0.05, 1), (0.001, 2),
+        (0.00001, 4)):
+            test_filter = CuckooFilter(100, false_positive_rate)
+            self.assertEqual(test_filter.slots.itemsize, itemsize)
+            self.assertLessEqual(test_filter.fingerprint_bits, 8 * itemsize)
+            test_filter.insert_many(range(90))
+            self.assertTrue(all(test_filter.find_many(range(90))))
+
+    def test_filtered_hash_table(self):
+        """Are negative lookups answered by the filter alone?"""
+        test_hash_table = FilteredHashTable(1000)
+        test_hash_table.insert_many(range(0, 2000, 2))
+        test_hash_table.insert(0)
+        self.assertEqual(len(test_hash_table), 1000)
+        self.assertEqual(test_hash_table.find_many([0, 1, 2]),
+        [True, False, True])
+        self.assertGreater(test_hash_table.num_filtered, 0)
+
+        test_hash_table.remove(2)
+        self.assertFalse(2 in test_hash_table)
+        self.assertEqual(len(test_hash_table), 999)
+
+    def test_filtered_hash_table_grows(self):
+        """Does the filter grow with the hash table instead of filling up?"""
+        test_hash_table = FilteredHashTable(100)
+        test_hash_table.insert_many(range(1000))
+        self.assertEqual(len(test_hash_table), 1000)
+        self.assertTrue(all(test_hash_table.find_many(range(1000))))
+        self.assertTrue(129 in test_hash_table)
+        self.assertGreaterEqual(test_hash_table.filter.capacity, 1000)
+        self.assertFalse(any(test_hash_table.find_many(range(-100, 0))))
+        self.assertGreater(test_hash_table.num_filtered, 0)
+
+    def test_grown_filter_keeps_settings(self):
+        """Does a grown filter keep the hash strategy, seed and buckets?"""
+        test_hash_table = FilteredHashTable(100, membership_filter=CuckooFilter(
+        100, bucket_size=2, max_kicks=50, hash_strategy="tabulation", seed=5))
+        test_hash_table.insert_many(range(1000))
+        membership_filter = test_hash_table.filter
+        self.assertGreaterEqual(membership_filter.capacity, 1000)
+        self.assertEqual(membership_filter.bucket_size, 2)
+        self.assertEqual(membership_filter.max_kicks, 50)
+        self.assertEqual(membership_filter.hash_strategy, "tabulation")
+        self.assertEqual(membership_filter.seed, 5)
+        self.assertTrue(all(test_hash_table.find_many(range(1000))))
+
+        test_hash_table = FilteredHashTable(100, membership_filter=BloomFilter(
+        100, hash_strategy="keyed", seed=5))
+        test_hash_table.insert_many(range(1000))
+        self.assertIsInstance(test_hash_table.filter, BloomFilter)
+        self.assertEqual(test_hash_table.filter.hash_strategy, "keyed")
+        self.assertEqual(test_hash_table.filter.seed, 5)
+        self.assertTrue(all(test_hash_table.find_many(range(1000))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,285 @@
+from hash_map import HashMap, TOMBSTONE
+import os
+import tempfile
+import unittest
+
+class TestHashMap(unittest.TestCase):
+    """Tests for the open addressing HashMap class."""
+
+    def test_init(self):
+        """Does the hash map properly initialize?"""
+        test_hash_map = HashMap()
+        self.assertEqual(test_hash_map.size(), 0)
+        self.assertEqual(test_hash_map.num_slots, 11)
+
+        with self.assertRaises(Exception):
+            HashMap(probing="cubic")
+
+    def test_collisions(self):
+        """Are colliding keys kept instead of dropped?"""
+        for probing in ("linear", "quadratic", "double"):
+            test_hash_map = HashMap(probing=probing)
+            test_hash_map.insert(1, "a")
+            test_hash_map.insert(12, "b")
+            test_hash_map.insert(23, "c")
+            self.assertEqual(test_hash_map.size(), 3)
+            self.assertTrue(test_hash_map.find(1, "a"))
+            self.assertTrue(test_hash_map.find(12, "b"))
+            self.assertTrue(test_hash_map.find(23, "c"))
+            self.assertFalse(test_hash_map.find(34, "c"))
+
+    def test_insert_existing_key(self):
+        """Does inserting an existing key overwrite its value?"""
+        test_hash_map = HashMap()
+        test_hash_map.insert(5, "a")
+        test_hash_map.insert(5, "b")
+        self.assertEqual(test_hash_map.size(), 1)
+        self.assertFalse(test_hash_map.find(5, "a"))
+        self.assertTrue(test_hash_map.find(5, "b"))
+
+    def test_remove_leaves_tombstone(self):
+        """Are keys after a removed key in the probe sequence still found?"""
+        test_hash_map = HashMap()
+        test_hash_map.insert(1, "a")
+        test_hash_map.insert(12, "b")
+        test_hash_map.remove(1, "a")
+        self.assertEqual(test_hash_map.size(), 1)
+        self.assertIs(test_hash_map.hash_map[1], TOMBSTONE)
+        self.assertTrue(test_hash_map.find(12, "b"))
+
+        # The tombstone is reused by the next insert on the same sequence.
+        test_hash_map.insert(23, "c")
+        self.assertEqual(test_hash_map.num_tombstones, 0)
+        self.assertEqual(test_hash_map.hash_map[1][:2], (23, "c"))
+
+    def test_remove_wrong_value(self):
+        """Is a key left alone when removed with a different value?"""
+        test_hash_map = HashMap()
+        test_hash_map.insert(1, "a")
+        test_hash_map.remove(1, "b")
+        self.assertEqual(test_hash_map.size(), 1)
+        self.assertTrue(test_hash_map.find(1, "a"))
+
+    def test_resize(self):
+        """Does the hash map grow and keep every entry?"""
+        for probing in ("linear", "quadratic", "double"):
+            test_hash_map = HashMap(probing=probing, load_factor=0.85)
+            for key in range(0, 1000, 7):
+                test_hash_map.insert(key, key * 2)
+            self.assertEqual(test_hash_map.size(), 143)
+            self.assertLess(test_hash_map.size() / test_hash_map.num_slots,
+            0.85)
+            for key in range(0, 1000, 7):
+                self.assertTrue(test_hash_map.find(key, key * 2))
+
+    def test_tombstones_are_purged(self):
+        """Does churn rebuild the array rather than fill it with tombstones?"""
+        test_hash_map = HashMap()
+        for key in range(1000):
+            test_hash_map.insert(key, key)
+            test_hash_map.remove(key, key)
+        self.assertEqual(test_hash_map.size(), 0)
+        self.assertEqual(test_hash_map.num_slots, 11)
+        self.assertLess(test_hash_map.num_tombstones, 11)
+
+    def test_hash_strategies(self):
+        """Do non-integer keys work with the hash strategies that allow them?"""
+        for hash_strategy in ("keyed", "python"):
+            test_hash_map = HashMap(hash_strategy=hash_strategy, seed=7)
+            for i in range(100):
+                test_hash_map.insert(f"key{i}", i)
+            self.assertEqual(test_hash_map.size(), 100)
+            for i in range(100):
+                self.assertTrue(test_hash_map.find(f"key{i}", i))
+            self.assertFalse(test_hash_map.find("key100", 100))
+
+        with self.assertRaises(Exception):
+            HashMap(hash_strategy="md5")
+
+    def test_hashes_are_cached(self):
+        """Does resizing reuse the cached hashes instead of rehashing keys?"""
+        calls = []
+        def counting_hash(key):
+            calls.append(key)
+            return key
+        test_hash_map = HashMap(hash_strategy=counting_hash)
+        for key in range(100):
+            test_hash_map.insert(key, key)
+        self.assertEqual(len(calls), 100)
+
+    def test_incremental_rehash(self):
+        """Are entries found while an incremental rehash is in progress?"""
+        test_hash_map = HashMap(incremental=True, rehash_step=1)
+        for key in range(9):
+            test_hash_map.insert(key, key)
+        # The ninth insert crossed the load factor and started a rehash.
+        self.assertIsNotNone(test_hash_map.old_hash_map)
+        self.assertEqual(test_hash_map.num_slots, 23)
+
+        test_hash_map.insert(3, "three")
+        test_hash_map.remove(4, 4)
+        self.assertEqual(test_hash_map.size(), 8)
+        self.assertTrue(test_hash_map.find(3, "three"))
+        self.assertFalse(test_hash_map.find(4, 4))
+        for key in (0, 1, 2, 5, 6, 7, 8):
+            self.assertTrue(test_hash_map.find(key, key))
+
+        test_hash_map.finish_rehash()
+        self.assertIsNone(test_hash_map.old_hash_map)
+        self.assertTrue(test_hash_map.find(3, "three"))
+        self.assertEqual(test_hash_map.size(), 8)
+
+    def test_incremental_rehash_reuses_tombstones(self):
+        """Does migrating an entry onto a tombstone keep the count right?"""
+        test_hash_map = HashMap(incremental=True, rehash_step=0)
+        for key in range(9):
+            test_hash_map.insert(key, key)
+        # 31 shares the home slot of 8 in the new array of 23 slots.
+        test_hash_map.insert(31, 31)
+        test_hash_map.remove(31, 31)
+        self.assertEqual(test_hash_map.num_tombstones, 1)
+        test_hash_map.finish_rehash()
+        self.assertEqual(test_hash_map.num_tombstones, 0)
+        self.assertEqual(test_hash_map.stats()["num_tombstones"], 0)
+        self.assertTrue(all(test_hash_map.find(key, key) for key in range(9)))
+
+    def test_bulk_operations(self):
+        """Do the batch operations size the array once and keep every pair?"""
+        items = {key: str(key) for key in range(500)}
+        test_hash_map = HashMap.from_items(items)
+        self.assertEqual(test_hash_map.size(), 500)
+        self.assertEqual(test_hash_map.num_slots, 673)
+        self.assertTrue(all(test_hash_map.find_many(range(500),
+        [str(key) for key in range(500)])))
+
+        test_hash_map.insert_many(range(500, 1000), 500 * ["x"])
+        self.assertEqual(test_hash_map.size(), 1000)
+        self.assertEqual(test_hash_map.find_many([499, 500, 1000],
+        ["499", "x", "x"]), [True, True, False])
+
+        test_hash_map.remove_many(range(0, 1000, 2), 500 * [None])
+        self.assertEqual(test_hash_map.size(), 1000)
+        test_hash_map.remove_many(range(500, 1000, 2), 250 * ["x"])
+        self.assertEqual(test_hash_map.size(), 750)
+        self.assertFalse(test_hash_map.find(500, "x"))
+
+    def test_mapping_protocol(self):
+        """Does the hash map behave like a dict?"""
+        test_hash_map = HashMap()
+        test_hash_map[1] = "a"
+        test_hash_map.put(12, "b")
+        self.assertEqual(test_hash_map[1], "a")
+        self.assertEqual(test_hash_map.get(12), "b")
+        self.assertIsNone(test_hash_map.get(23))
+        self.assertTrue(12 in test_hash_map)
+        self.assertTrue(test_hash_map.find(12))
+        self.assertFalse(23 in test_hash_map)
+        with self.assertRaises(KeyError):
+            test_hash_map[23]
+
+        self.assertEqual(test_hash_map.setdefault(1, "x"), "a")
+        self.assertEqual(test_hash_map.setdefault(23, "c"), "c")
+        test_hash_map.update({12: "b", 23: "c"})
+        self.assertEqual(len(test_hash_map), 3)
+        self.assertEqual(sorted(test_hash_map), [1, 12, 23])
+        self.assertEqual(dict(test_hash_map.items()),
+        {1: "a", 12: "b", 23: "c"})
+
+        self.assertEqual(test_hash_map.pop(12), "b")
+        self.assertEqual(test_hash_map.pop(12, None), None)
+        with self.assertRaises(KeyError):
+            test_hash_map.pop(12)
+        del test_hash_map[1]
+        with self.assertRaises(KeyError):
+            del test_hash_map[1]
+        self.assertEqual(list(test_hash_map.keys()), [23])
+        self.assertEqual(list(test_hash_map.values()), ["c"])
+
+    def test_shrink_on_remove(self):
+        """Does the array shrink after mass removals, without thrashing?"""
+        test_hash_map = HashMap()
+        for key in range(1000):
+            test_hash_map[key] = key
+        peak_num_slots = test_hash_map.num_slots
+        for key in range(990):
+            del test_hash_map[key]
+        self.assertLess(test_hash_map.num_slots, peak_num_slots)
+        self.assertEqual(test_hash_map.num_slots, 31)
+        self.assertEqual(sorted(test_hash_map), list(range(990, 1000)))
+
+        # Hovering around the shrink threshold does not resize every time.
+        test_hash_map = HashMap(num_slots=11)
+        for key in range(9):
+            test_hash_map[key] = key
+        num_slots = test_hash_map.num_slots
+        for _ in range(10):
+            del test_hash_map[0]
+            test_hash_map[0] = 0
+        self.assertEqual(test_hash_map.num_slots, num_slots)
+
+        test_hash_map.shrink_to_fit()
+        self.assertEqual(test_hash_map.num_slots, 13)
+        self.assertEqual(test_hash_map.num_tombstones, 0)
+        self.assertEqual(len(test_hash_map), 9)
+
+        with self.assertRaises(Exception):
+            HashMap(min_load_factor=0.5)
+
+    def test_stats(self):
+        """Do the stats report probe lengths, resizes and operation counts?"""
+        test_hash_map = HashMap()
+        for key in (0, 11, 22, 5):
+            test_hash_map.insert(key, key)
+        test_hash_map.remove(0, 0)
+        stats = test_hash_map.stats()
+        self.assertEqual(stats["buckets_filled"], 3)
+        self.assertEqual(stats["num_tombstones"], 1)
+        self.assertEqual(stats["occupancy_histogram"], [8, 3])
+        self.assertEqual(stats["probe_length_histogram"], [0, 1, 1, 1])
+        self.assertEqual(stats["max_probe_length"], 3)
+        self.assertEqual(stats["mean_probe_length"], 2)
+        self.assertEqual(stats["num_resizes"], 0)
+        self.assertIsNone(stats["operation_counts"])
+
+        test_hash_map.start_counting()
+        for key in range(20):
+            test_hash_map[key] = key
+        self.assertTrue(5 in test_hash_map)
+        self.assertFalse(100 in test_hash_map)
+        stats = test_hash_map.stats()
+        self.assertGreater(stats["num_resizes"], 0)
+        self.assertGreater(stats["resize_time"], 0)
+        self.assertEqual(stats["operation_counts"]["insert"], 20)
+        self.assertEqual(stats["operation_counts"]["find"], 2)
+        self.assertEqual(stats["operation_counts"]["find_hits"], 1)
+
+        test_hash_map.stop_counting()
+        self.assertNotIn("find", vars(test_hash_map))
+        self.assertIsNone(test_hash_map.stats()["operation_counts"])
+
+    def test_snapshot(self):
+        """Is a saved hash map found again through the mapped snapshot?"""
+        test_hash_map = HashMap(probing="double", hash_strategy="keyed")
+        test_hash_map.update({1: "a", "b": 2.5, b"c": None, 4: True})
+        test_hash_map.remove(4)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "hash_map.snap")
+            test_hash_map.save(path)
+            with HashMap.open_mmap(path) as mapped_hash_map:
+                self.assertEqual(len(mapped_hash_map), 3)
+                self.assertEqual(mapped_hash_map.num_slots, 11)
+                self.assertEqual(mapped_hash_map.num_tombstones, 1)
+                self.assertEqual(mapped_hash_map[1], "a")
+                self.assertEqual(mapped_hash_map.get("b"), 2.5)
+                self.assertTrue(mapped_hash_map.find(b"c", None))
+                self.assertFalse(4 in mapped_hash_map)
+                self.assertEqual(dict(mapped_hash_map.items()),
+                dict(test_hash_map.items()))
+
+        test_hash_map["d"] = [1, 2]
+        with self.assertRaises(Exception):
+            test_hash_map.save(os.devnull)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+from hash_map_compact import HashMap, DELETED, DUMMY, EMPTY
+import unittest
+
+class CountedKey():
+    """Integer key counting how often it is hashed."""
+
+    num_hashes = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        CountedKey.num_hashes += 1
+        return self.value
+
+    def __eq__(self, other):
+        return isinstance(other, CountedKey) and self.value == other.value
+
+class TestCompactHashMap(unittest.TestCase):
+    """Tests for the compact HashMap class."""
+
+    def test_insertion_order(self):
+        """Do items keep insertion order through overwrites and removals?"""
+        test_hash_map = HashMap()
+        for key in ("c", "a", "d", "b"):
+            test_hash_map.insert(key, key.upper())
+        test_hash_map.insert("a", "A2")
+        test_hash_map.remove("d", "D")
+        test_hash_map.insert("d", "D2")
+        self.assertEqual(list(test_hash_map.items()),
+        [("c", "C"), ("a", "A2"), ("b", "B"), ("d", "D2")])
+        self.assertEqual(test_hash_map.size(), 4)
+        self.assertTrue(test_hash_map.find("a", "A2"))
+        self.assertFalse(test_hash_map.find("a", "A"))
+        self.assertFalse(test_hash_map.find("e", None))
+
+    def test_dummy_slots(self):
+        """Do removed slots keep probe sequences intact and get reused?"""
+        test_hash_map = HashMap(min_load_factor=0)
+        test_hash_map.insert(1, "a")
+        test_hash_map.insert(12, "b")
+        self.assertEqual(list(test_hash_map.indices[1:4]), [0, 1, EMPTY])
+        test_hash_map.remove(1, "a")
+        self.assertEqual(test_hash_map.indices[1], DUMMY)
+        self.assertIs(test_hash_map.keys[0], DELETED)
+        # 12 sits past the dummy and is still found.
+        self.assertTrue(test_hash_map.find(12, "b"))
+
+        test_hash_map.insert(23, "c")
+        self.assertEqual(test_hash_map.indices[1], 2)
+        self.assertEqual(list(test_hash_map.items()), [(12, "b"), (23, "c")])
+
+    def test_resize_rebuilds_indices_only(self):
+        """Does growing reuse the cached hashes and keep the entries?"""
+        test_hash_map = HashMap()
+        keys = [CountedKey(value) for value in range(0, 300, 3)]
+        for key in keys:
+            test_hash_map.insert(key, key.value)
+        self.assertGreater(test_hash_map.num_slots, 100)
+
+        entry_keys = test_hash_map.keys
+        num_hashes = CountedKey.num_hashes
+        test_hash_map.resize(1009)
+        self.assertEqual(CountedKey.num_hashes, num_hashes)
+        self.assertIs(test_hash_map.keys, entry_keys)
+        self.assertEqual(entry_keys, keys)
+        self.assertTrue(all(test_hash_map.find(key, key.value)
+        for key in keys))
+
+    def test_shrink(self):
+        """Do removals shrink the index array and drop removed entries?"""
+        test_hash_map = HashMap()
+        for key in range(1000):
+            test_hash_map.insert(key, -key)
+        grown_num_slots = test_hash_map.num_slots
+        for key in range(990):
+            test_hash_map.remove(key, -key)
+        self.assertLess(test_hash_map.num_slots, grown_num_slots)
+        self.assertEqual(list(test_hash_map.items()),
+        [(key, -key) for key in range(990, 1000)])
+
+        test_hash_map.shrink_to_fit()
+        self.assertEqual(test_hash_map.keys, list(range(990, 1000)))
+        self.assertEqual(len(test_hash_map.hashes), 10)
+        self.assertEqual(test_hash_map.num_slots, 17)
+        self.assertTrue(all(test_hash_map.find(key, -key)
+        for key in range(990, 1000)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+from hash_map_robin_hood import HashMap
+import random
+import unittest
+
+class TestRobinHoodHashMap(unittest.TestCase):
+    """Tests for the Robin Hood HashMap class."""
+
+    def assert_layout(self, hash_map):
+        """Checks the probe distance of every slot and that no slot is stale."""
+        num_entries = 0
+        for index, entry in enumerate(hash_map.hash_map):
+            distance = hash_map.probe_distances[index]
+            if entry == None:
+                self.assertEqual(distance, -1)
+                continue
+            num_entries += 1
+            self.assertEqual(distance,
+            (index - hash_map.hash_function(entry[0])) % hash_map.num_slots)
+            # Distances never jump by more than one from slot to slot.
+            next_distance = hash_map.probe_distances[(index + 1) %
+            hash_map.num_slots]
+            self.assertLessEqual(next_distance, distance + 1)
+        self.assertEqual(hash_map.size(), num_entries)
+
+    def test_insert_and_overwrite(self):
+        """Are colliding keys kept and existing keys overwritten?"""
+        test_hash_map = HashMap()
+        for key in (1, 12, 23, 2):
+            test_hash_map.insert(key, str(key))
+        self.assertEqual(test_hash_map.size(), 4)
+        self.assertTrue(test_hash_map.find(23, "23"))
+        self.assertTrue(test_hash_map.find(2, "2"))
+        self.assertFalse(test_hash_map.find(34, "34"))
+        # 2 was displaced by the keys hashing to slot 1.
+        self.assertEqual(test_hash_map.probe_distances[4], 2)
+
+        test_hash_map.insert(12, "b")
+        self.assertEqual(test_hash_map.size(), 4)
+        self.assertFalse(test_hash_map.find(12, "12"))
+        self.assertTrue(test_hash_map.find(12, "b"))
+        self.assert_layout(test_hash_map)
+
+    def test_backward_shift(self):
+        """Does remove shift the following entries back instead of leaving a
+        tombstone?"""
+        test_hash_map = HashMap(min_load_factor=0)
+        for key in (1, 12, 23, 2):
+            test_hash_map.insert(key, str(key))
+        test_hash_map.remove(1, "wrong value")
+        self.assertEqual(test_hash_map.size(), 4)
+        test_hash_map.remove(1, "1")
+        self.assertEqual(test_hash_map.hash_map[1:4],
+        [(12, "12"), (23, "23"), (2, "2")])
+        self.assertEqual(test_hash_map.probe_distances[1:5], [0, 1, 1, -1])
+        self.assert_layout(test_hash_map)
+        for key in (12, 23, 2):
+            test_hash_map.remove(key, str(key))
+        self.assertEqual(test_hash_map.hash_map, 11 * [None])
+
+    def test_resize(self):
+        """Do resizes keep every entry, and shrink after many removals?"""
+        randomizer = random.Random(2)
+        keys = randomizer.sample(range(100000), 2000)
+        test_hash_map = HashMap()
+        for key in keys:
+            test_hash_map.insert(key, -key)
+        self.assertGreater(test_hash_map.num_slots, 2000 / 0.9)
+        self.assertTrue(all(test_hash_map.find(key, -key) for key in keys))
+        self.assert_layout(test_hash_map)
+
+        grown_num_slots = test_hash_map.num_slots
+        for key in keys[:1900]:
+            test_hash_map.remove(key, -key)
+        self.assertLess(test_hash_map.num_slots, grown_num_slots)
+        self.assertTrue(all(test_hash_map.find(key, -key)
+        for key in keys[1900:]))
+        self.assert_layout(test_hash_map)
+
+        test_hash_map.shrink_to_fit()
+        self.assertLess(100 / test_hash_map.num_slots, 0.9)
+        self.assert_layout(test_hash_map)
+
+    def test_init(self):
+        """Are load factors that leave no empty slot rejected?"""
+        for load_factor in (0, 1, 1.5):
+            with self.assertRaises(Exception):
+                HashMap(num_slots=4, load_factor=load_factor)
+        with self.assertRaises(Exception):
+            HashMap(hash_strategy="md5")
+
+    def test_hash_strategies(self):
+        """Do non-integer keys work with the hash strategies that allow them?"""
+        for hash_strategy in ("keyed", "python"):
+            test_hash_map = HashMap(hash_strategy=hash_strategy, seed=7)
+            for i in range(100):
+                test_hash_map.insert(f"key{i}", i)
+            self.assertEqual(test_hash_map.size(), 100)
+            self.assertTrue(all(test_hash_map.find(f"key{i}", i)
+            for i in range(100)))
+            self.assertFalse(test_hash_map.find("key100", 100))
+            self.assert_layout(test_hash_map)
+
+    def test_probe_distance_stats(self):
+        """Do the probe distance stats describe the entries?"""
+        test_hash_map = HashMap(num_slots=101)
+        self.assertEqual(test_hash_map.max_probe_length(), -1)
+        self.assertEqual(test_hash_map.probe_distance_histogram(), [])
+        for key in (5, 106, 207, 6):
+            test_hash_map.insert(key, None)
+        # 6 probes past 106 and 207, which are further from home.
+        self.assertEqual(test_hash_map.max_probe_length(), 2)
+        self.assertEqual(test_hash_map.probe_distance_histogram(), [1, 1, 2])
+        self.assertEqual(sum(test_hash_map.probe_distance_histogram()),
+        test_hash_map.size())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+from hash_map_separate_chaining import HashMap
+import unittest
+
+class TestSeparateChainingHashMap(unittest.TestCase):
+    """Tests for the separate chaining HashMap class."""
+
+    def test_collisions(self):
+        """Are colliding keys chained in one bucket and overwritten in place?"""
+        test_hash_map = HashMap()
+        for key in (1, 12, 23):
+            test_hash_map.insert(key, str(key))
+        self.assertEqual(len(test_hash_map.hash_map[1]), 3)
+        self.assertEqual(test_hash_map.buckets_filled, 1)
+        test_hash_map.insert(12, "b")
+        self.assertEqual(test_hash_map.size(), 3)
+        self.assertTrue(test_hash_map.find(12, "b"))
+        self.assertFalse(test_hash_map.find(12, "12"))
+
+        test_hash_map.remove(12, "wrong value")
+        self.assertTrue(test_hash_map.find(12))
+        test_hash_map.remove(12)
+        self.assertFalse(test_hash_map.find(12))
+        self.assertEqual(test_hash_map.size(), 2)
+
+    def test_incremental_rehash(self):
+        """Are entries found and updated while buckets are migrated?"""
+        test_hash_map = HashMap(incremental=True, rehash_step=1)
+        for key in range(9):
+            test_hash_map.insert(key, key)
+        # The ninth insert crossed the load factor and started a rehash.
+        self.assertIsNotNone(test_hash_map.old_hash_map)
+        self.assertEqual(test_hash_map.num_slots, 21)
+
+        test_hash_map.insert(3, "three")
+        test_hash_map.remove(4)
+        self.assertEqual(test_hash_map.size(), 8)
+        self.assertEqual(test_hash_map.get(3), "three")
+        self.assertFalse(test_hash_map.find(4))
+        self.assertEqual(sorted(test_hash_map.keys()), [0, 1, 2, 3, 5, 6, 7, 8])
+        # The old array is included until every bucket has been migrated.
+        self.assertEqual(test_hash_map.stats()["num_entries"], 8)
+        self.assertEqual(sum(test_hash_map.stats()["occupancy_histogram"][1:]),
+        test_hash_map.stats()["buckets_filled"])
+
+        test_hash_map.finish_rehash()
+        self.assertIsNone(test_hash_map.old_hash_map)
+        self.assertEqual(test_hash_map.buckets_filled, 8)
+        self.assertEqual(dict(test_hash_map.items()),
+        {0: 0, 1: 1, 2: 2, 3: "three", 5: 5, 6: 6, 7: 7, 8: 8})
+
+    def test_bulk_operations(self):
+        """Do the batch operations size the array once and keep every pair?"""
+        items = {key: str(key) for key in range(500)}
+        test_hash_map = HashMap.from_items(items)
+        self.assertEqual(test_hash_map.size(), 500)
+        self.assertEqual(test_hash_map.num_resizes, 0)
+        self.assertLess(test_hash_map.size() / test_hash_map.num_slots, 0.75)
+        self.assertEqual(dict(test_hash_map.items()), items)
+
+        test_hash_map.insert_many(range(500, 1000), range(500, 1000))
+        self.assertEqual(test_hash_map.num_resizes, 1)
+        self.assertEqual(test_hash_map.find_many([0, 999, 1000]),
+        [True, True, False])
+        self.assertEqual(test_hash_map.find_many([0, 999], ["0", 0]),
+        [True, False])
+
+        # Only the pairs with matching values are removed.
+        values = [str(key) if key < 500 else key for key in range(0, 1000, 2)]
+        values[0] = "wrong"
+        test_hash_map.remove_many(range(0, 1000, 2), values)
+        self.assertEqual(test_hash_map.size(), 501)
+        self.assertTrue(test_hash_map.find(0, "0"))
+        test_hash_map.remove_many(range(0, 1000, 2))
+        self.assertEqual(test_hash_map.size(), 500)
+        self.assertTrue(all(test_hash_map.find_many(range(1, 1000, 2))))
+
+    def test_mapping_protocol(self):
+        """Do get, setdefault, pop and the dict syntax behave like a dict?"""
+        test_hash_map = HashMap(hash_strategy="python")
+        test_hash_map["a"] = 1
+        test_hash_map.put("b", 2)
+        test_hash_map.update({"c": 3, "a": 4})
+        self.assertEqual(len(test_hash_map), 3)
+        self.assertEqual(test_hash_map["a"], 4)
+        self.assertIn("b", test_hash_map)
+        self.assertNotIn("d", test_hash_map)
+        self.assertIsNone(test_hash_map.get("d"))
+        self.assertEqual(test_hash_map.get("d", 0), 0)
+        with self.assertRaises(KeyError):
+            test_hash_map["d"]
+
+        self.assertEqual(test_hash_map.setdefault("b", 5), 2)
+        self.assertEqual(test_hash_map.setdefault("d", 5), 5)
+        self.assertEqual(test_hash_map.pop("d"), 5)
+        self.assertEqual(test_hash_map.pop("d", None), None)
+        with self.assertRaises(KeyError):
+            test_hash_map.pop("d")
+        del test_hash_map["c"]
+        with self.assertRaises(KeyError):
+            del test_hash_map["c"]
+
+        self.assertEqual(sorted(test_hash_map), ["a", "b"])
+        self.assertEqual(sorted(test_hash_map.values()), [2, 4])
+        self.assertEqual(dict(test_hash_map.items()), {"a": 4, "b": 2})
+
+    def test_shrink_hysteresis(self):
+        """Does the array shrink once sparse, without resizing back and forth
+        around the threshold?"""
+        with self.assertRaises(Exception):
+            HashMap(min_load_factor=0.5)
+
+        test_hash_map = HashMap()
+        for key in range(1000):
+            test_hash_map.insert(key, key)
+        grown_num_slots = test_hash_map.num_slots
+        for key in range(1000):
+            test_hash_map.remove(key)
+            if test_hash_map.num_slots < grown_num_slots:
+                break
+        shrunk_num_slots = test_hash_map.num_slots
+        self.assertLess(shrunk_num_slots, grown_num_slots)
+        # The smaller array is sized for half of load_factor.
+        self.assertLess(test_hash_map.size() / shrunk_num_slots, 0.75 / 2)
+
+        num_resizes = test_hash_map.num_resizes
+        key = 1000
+        for _ in range(100):
+            test_hash_map.insert(key, key)
+            test_hash_map.remove(key)
+        self.assertEqual(test_hash_map.num_resizes, num_resizes)
+        self.assertEqual(test_hash_map.num_slots, shrunk_num_slots)
+
+        # The array never shrinks below its initial size.
+        for key in list(test_hash_map):
+            test_hash_map.remove(key)
+        self.assertEqual(test_hash_map.num_slots, 11)
+
+        test_hash_map = HashMap(min_load_factor=0)
+        for key in range(100):
+            test_hash_map.insert(key, key)
+        test_hash_map.remove_many(range(100))
+        self.assertGreater(test_hash_map.num_slots, 100)
+        test_hash_map.shrink_to_fit()
+        self.assertEqual(test_hash_map.num_slots, 11)
+
+    def test_stats(self):
+        """Do the stats describe the buckets and count the operations?"""
+        test_hash_map = HashMap()
+        for key in (1, 12, 23, 2):
+            test_hash_map.insert(key, key)
+        stats = test_hash_map.stats()
+        self.assertEqual(stats["num_entries"], 4)
+        self.assertEqual(stats["num_slots"], 11)
+        self.assertEqual(stats["buckets_filled"], 2)
+        self.assertEqual(stats["occupancy_histogram"], [9, 1, 0, 1])
+        self.assertEqual(stats["max_chain_length"], 3)
+        self.assertEqual(stats["mean_chain_length"], 2)
+        self.assertEqual(stats["num_resizes"], 0)
+        self.assertIsNone(stats["operation_counts"])
+
+        test_hash_map.start_counting()
+        test_hash_map.insert(3, 3)
+        test_hash_map.find(3)
+        test_hash_map.find(4)
+        test_hash_map.find_many([1, 2])
+        test_hash_map.remove(3)
+        self.assertEqual(test_hash_map.operation_counts, {"insert": 1,
+        "find": 2, "remove": 1, "insert_many": 0, "find_many": 1,
+        "remove_many": 0, "find_hits": 1})
+        self.assertEqual(test_hash_map.stats()["operation_counts"],
+        test_hash_map.operation_counts)
+
+        test_hash_map.stop_counting()
+        test_hash_map.find(1)
+        self.assertIsNone(test_hash_map.operation_counts)
+        self.assertNotIn("find", vars(test_hash_map))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+from hash_table import HashTable
+import os
+import tempfile
+import unittest
+
+class TestHashTable(unittest.TestCase):
+    """Tests for the HashTable class without collision resolution."""
+
+    def test_resize_keeps_count(self):
+        """Are keys dropped by a resize counted, and removals never resize?"""
+        test_hash_table = HashTable(num_slots=23)
+        # 3 and 14 sit in different slots of 23 but share a slot of 11.
+        test_hash_table.insert_many([3, 14, 5])
+        self.assertEqual(test_hash_table.size(), 3)
+        test_hash_table.resize(11)
+        self.assertEqual(test_hash_table.size(), 2)
+        self.assertEqual(test_hash_table.stats()["num_dropped"], 1)
+        self.assertEqual(test_hash_table.find_many([3, 14, 5]),
+        [True, False, True])
+
+        test_hash_table = HashTable()
+        test_hash_table.insert_many(range(100))
+        num_slots = test_hash_table.num_slots
+        test_hash_table.remove_many(range(95))
+        self.assertEqual(test_hash_table.num_slots, num_slots)
+        self.assertEqual(test_hash_table.size(), 5)
+        self.assertTrue(all(test_hash_table.find_many(range(95, 100))))
+
+    def test_incremental_rehash(self):
+        """Are keys found and removed while slots are migrated?"""
+        test_hash_table = HashTable(incremental=True, rehash_step=1)
+        for key in range(9):
+            test_hash_table.insert(key)
+        # The ninth insert crossed the load factor and started a rehash.
+        self.assertIsNotNone(test_hash_table.old_hash_table)
+        self.assertEqual(test_hash_table.num_slots, 21)
+
+        test_hash_table.insert(3)
+        test_hash_table.remove(4)
+        self.assertEqual(test_hash_table.size(), 8)
+        self.assertFalse(test_hash_table.find(4))
+        for key in (0, 1, 2, 3, 5, 6, 7, 8):
+            self.assertTrue(test_hash_table.find(key))
+        # The old array is included until every slot has been migrated.
+        self.assertEqual(test_hash_table.stats()["buckets_filled"], 8)
+
+        test_hash_table.finish_rehash()
+        self.assertIsNone(test_hash_table.old_hash_table)
+        self.assertEqual(test_hash_table.size(), 8)
+        self.assertEqual(sum(entry != None
+        for entry in test_hash_table.hash_table), 8)
+
+        # A key migrated into a taken slot is dropped and counted.
+        test_hash_table = HashTable(num_slots=23, incremental=True,
+        rehash_step=0)
+        test_hash_table.insert_many([3, 14])
+        test_hash_table.start_resize(11)
+        self.assertTrue(all(test_hash_table.find_many([3, 14])))
+        test_hash_table.finish_rehash()
+        self.assertEqual(test_hash_table.size(), 1)
+        self.assertEqual(test_hash_table.num_dropped, 1)
+
+    def test_bulk_operations(self):
+        """Do the batch operations size the array once and keep every key?"""
+        test_hash_table = HashTable.from_iterable(key for key in range(500))
+        self.assertEqual(test_hash_table.size(), 500)
+        self.assertEqual(test_hash_table.num_resizes, 0)
+        self.assertLess(test_hash_table.size() / test_hash_table.num_slots,
+        0.75)
+
+        test_hash_table.insert_many(range(250, 1000))
+        self.assertEqual(test_hash_table.size(), 1000)
+        self.assertEqual(test_hash_table.num_resizes, 1)
+        self.assertEqual(test_hash_table.find_many([0, 999, 1000]),
+        [True, True, False])
+
+        test_hash_table.remove_many(range(0, 1000, 2))
+        self.assertEqual(test_hash_table.size(), 500)
+        self.assertEqual(test_hash_table.find_many(range(4)),
+        [False, True, False, True])
+
+    def test_stats(self):
+        """Do the stats describe the slots and count the operations?"""
+        test_hash_table = HashTable()
+        for key in (1, 12, 2):
+            test_hash_table.insert(key)
+        stats = test_hash_table.stats()
+        # 12 collides with 1 and is not stored.
+        self.assertEqual(stats["num_entries"], 2)
+        self.assertEqual(stats["buckets_filled"], 2)
+        self.assertEqual(stats["occupancy_histogram"], [9, 2])
+        self.assertEqual(stats["max_probe_length"], 1)
+        self.assertEqual(stats["num_resizes"], 0)
+        self.assertEqual(stats["num_dropped"], 0)
+        self.assertIsNone(stats["operation_counts"])
+
+        test_hash_table.start_counting()
+        test_hash_table.insert(3)
+        test_hash_table.find(3)
+        test_hash_table.find(4)
+        test_hash_table.find_many([1, 2])
+        test_hash_table.remove(3)
+        self.assertEqual(test_hash_table.stats()["operation_counts"],
+        {"insert": 1, "find": 2, "remove": 1, "insert_many": 0,
+        "find_many": 1, "remove_many": 0, "find_hits": 1})
+
+        test_hash_table.stop_counting()
+        self.assertNotIn("find", vars(test_hash_table))
+        self.assertIsNone(test_hash_table.stats()["operation_counts"])
+
+    def test_snapshot(self):
+        """Is a saved hash table found again through the mapped snapshot?"""
+        test_hash_table = HashTable(num_slots=101, hash_strategy="keyed",
+        seed=3, incremental=True)
+        for key in (1, "b", b"c", -7):
+            test_hash_table.insert(key)
+        keys = [entry[0] for entry in test_hash_table.hash_table
+        if entry != None]
+        self.assertEqual(len(keys), 4)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "hash_table.snap")
+            test_hash_table.save(path)
+            with HashTable.open_mmap(path) as mapped_hash_table:
+                self.assertEqual(len(mapped_hash_table), 4)
+                self.assertEqual(mapped_hash_table.num_slots, 101)
+                self.assertEqual(mapped_hash_table.load_factor, 0.75)
+                self.assertEqual(mapped_hash_table.hash_strategy, "keyed")
+                self.assertEqual(mapped_hash_table.seed, 3)
+                self.assertEqual(mapped_hash_table.find_many(keys),
+                4 * [True])
+                self.assertFalse(mapped_hash_table.find("c"))
+                self.assertFalse(b"b" in mapped_hash_table)
+                self.assertFalse(7 in mapped_hash_table)
+                # keys() decodes the keys from the heap in slot order.
+                self.assertEqual(list(mapped_hash_table.keys()), keys)
+                self.assertEqual(list(mapped_hash_table), keys)
+
+            # The kind in the header, after the magic and the version, marks
+            # a hash map snapshot instead.
+            with open(path, "r+b") as file:
+                file.seek(10)
+                file.write(b"\2")
+            with self.assertRaises(Exception):
+                HashTable.open_mmap(path)
+
+        test_hash_table = HashTable(hash_strategy=lambda key: key)
+        test_hash_table.insert(1)
+        with self.assertRaises(Exception):
+            test_hash_table.save(os.devnull)
+
+
+if __name__ == '__main__':
+    unittest.main()
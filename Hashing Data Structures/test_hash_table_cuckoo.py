@@ -0,0 +1,52 @@
+from hash_table_cuckoo import HashTable
+import unittest
+
+class TestCuckooHashTable(unittest.TestCase):
+    """Tests for the cuckoo hashing HashTable class."""
+
+    def test_insert_find_remove(self):
+        """Are keys found in one of their buckets after many kicks?"""
+        for bucket_size in (1, 4):
+            test_hash_table = HashTable(bucket_size=bucket_size)
+            for key in range(2000):
+                test_hash_table.insert(key)
+            test_hash_table.insert(5)
+            self.assertEqual(test_hash_table.size(), 2000)
+            self.assertTrue(all(test_hash_table.find_many(range(2000))))
+            self.assertFalse(test_hash_table.find(2000))
+
+            for key in range(0, 2000, 2):
+                test_hash_table.remove(key)
+            self.assertEqual(test_hash_table.size(), 1000)
+            self.assertFalse(test_hash_table.find(0))
+            self.assertTrue(test_hash_table.find(1))
+
+    def test_bounded_probes(self):
+        """Is every key stored in one of its buckets or in the stash?"""
+        test_hash_table = HashTable.from_iterable(range(5000), bucket_size=4)
+        self.assertGreater(test_hash_table.size() /
+        len(test_hash_table.hash_table), 0.4)
+        for key in range(5000):
+            slots = []
+            for bucket in test_hash_table.hash_function(key):
+                start = bucket * test_hash_table.bucket_size
+                slots.extend(test_hash_table.hash_table[start:start + 4])
+            stashed = [entry[0] for entry in test_hash_table.stash]
+            self.assertIn(key, [entry[0] for entry in slots if entry != None] +
+            stashed)
+
+    def test_rehash_with_new_seed(self):
+        """Does a full stash trigger a rehash with new hash functions?"""
+        test_hash_table = HashTable(stash_size=0, max_kicks=1)
+        for key in range(200):
+            test_hash_table.insert(key)
+        self.assertGreater(test_hash_table.num_rehashes, 0)
+        self.assertGreater(test_hash_table.seed, 0)
+        self.assertTrue(all(test_hash_table.find_many(range(200))))
+
+        with self.assertRaises(Exception):
+            HashTable(hash_strategy="division")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+from hash_table_separate_chaining import HashTable
+import unittest
+
+class TestSeparateChainingHashTable(unittest.TestCase):
+    """Tests for the separate chaining HashTable class."""
+
+    def test_collisions(self):
+        """Are colliding keys chained in one bucket and inserted once?"""
+        test_hash_table = HashTable()
+        for key in (1, 12, 23, 12):
+            test_hash_table.insert(key)
+        self.assertEqual(test_hash_table.size(), 3)
+        self.assertEqual(len(test_hash_table.hash_table[1]), 3)
+        self.assertEqual(test_hash_table.buckets_filled, 1)
+        test_hash_table.remove(12)
+        test_hash_table.remove(34)
+        self.assertFalse(test_hash_table.find(12))
+        self.assertTrue(test_hash_table.find(23))
+        self.assertEqual(test_hash_table.size(), 2)
+
+    def test_incremental_rehash(self):
+        """Are keys found and removed while buckets are migrated?"""
+        test_hash_table = HashTable(incremental=True, rehash_step=1)
+        for key in range(9):
+            test_hash_table.insert(key)
+        # The ninth insert crossed the load factor and started a rehash.
+        self.assertIsNotNone(test_hash_table.old_hash_table)
+        self.assertEqual(test_hash_table.num_slots, 21)
+
+        test_hash_table.insert(3)
+        test_hash_table.remove(4)
+        self.assertEqual(test_hash_table.size(), 8)
+        self.assertFalse(test_hash_table.find(4))
+        for key in (0, 1, 2, 3, 5, 6, 7, 8):
+            self.assertTrue(test_hash_table.find(key))
+        # The old array is included until every bucket has been migrated.
+        self.assertEqual(test_hash_table.stats()["num_entries"], 8)
+
+        test_hash_table.finish_rehash()
+        self.assertIsNone(test_hash_table.old_hash_table)
+        self.assertEqual(test_hash_table.buckets_filled, 8)
+        self.assertEqual(sorted(test_hash_table.keys()),
+        [0, 1, 2, 3, 5, 6, 7, 8])
+
+    def test_bulk_operations(self):
+        """Do the batch operations size the array once and keep every key?"""
+        test_hash_table = HashTable.from_iterable(key for key in range(500))
+        self.assertEqual(test_hash_table.size(), 500)
+        self.assertEqual(test_hash_table.num_resizes, 0)
+        self.assertLess(test_hash_table.size() / test_hash_table.num_slots,
+        0.75)
+
+        test_hash_table.insert_many(range(250, 1000))
+        self.assertEqual(test_hash_table.size(), 1000)
+        self.assertEqual(test_hash_table.num_resizes, 1)
+        self.assertEqual(test_hash_table.find_many([0, 999, 1000]),
+        [True, True, False])
+
+        test_hash_table.remove_many(range(0, 1000, 2))
+        self.assertEqual(test_hash_table.size(), 500)
+        self.assertEqual(test_hash_table.find_many(range(4)),
+        [False, True, False, True])
+
+        test_hash_table = HashTable.from_iterable(["a", "b", "a"],
+        hash_strategy="python")
+        self.assertEqual(sorted(test_hash_table.keys()), ["a", "b"])
+
+    def test_shrink_hysteresis(self):
+        """Does the array shrink once sparse, without resizing back and forth
+        around the threshold?"""
+        with self.assertRaises(Exception):
+            HashTable(min_load_factor=0.5)
+
+        test_hash_table = HashTable()
+        test_hash_table.insert_many(range(1000))
+        grown_num_slots = test_hash_table.num_slots
+        for key in range(1000):
+            test_hash_table.remove(key)
+            if test_hash_table.num_slots < grown_num_slots:
+                break
+        shrunk_num_slots = test_hash_table.num_slots
+        self.assertLess(shrunk_num_slots, grown_num_slots)
+        # The smaller array is sized for half of load_factor.
+        self.assertLess(test_hash_table.size() / shrunk_num_slots, 0.75 / 2)
+
+        num_resizes = test_hash_table.num_resizes
+        for _ in range(100):
+            test_hash_table.insert(1000)
+            test_hash_table.remove(1000)
+        self.assertEqual(test_hash_table.num_resizes, num_resizes)
+
+        # The array never shrinks below its initial size.
+        test_hash_table.remove_many(list(test_hash_table.keys()))
+        self.assertEqual(test_hash_table.num_slots, 11)
+
+        test_hash_table = HashTable(min_load_factor=0)
+        test_hash_table.insert_many(range(100))
+        test_hash_table.remove_many(range(100))
+        self.assertGreater(test_hash_table.num_slots, 100)
+        test_hash_table.shrink_to_fit()
+        self.assertEqual(test_hash_table.num_slots, 11)
+
+    def test_stats(self):
+        """Do the stats describe the buckets and count the operations?"""
+        test_hash_table = HashTable()
+        for key in (1, 12, 23, 2):
+            test_hash_table.insert(key)
+        stats = test_hash_table.stats()
+        self.assertEqual(stats["num_entries"], 4)
+        self.assertEqual(stats["buckets_filled"], 2)
+        self.assertEqual(stats["occupancy_histogram"], [9, 1, 0, 1])
+        self.assertEqual(stats["max_chain_length"], 3)
+        self.assertEqual(stats["mean_chain_length"], 2)
+        self.assertIsNone(stats["operation_counts"])
+
+        test_hash_table.start_counting()
+        test_hash_table.insert(3)
+        test_hash_table.find(3)
+        test_hash_table.find(4)
+        test_hash_table.insert_many([5, 6])
+        test_hash_table.remove_many([5, 6])
+        self.assertEqual(test_hash_table.stats()["operation_counts"],
+        {"insert": 1, "find": 2, "remove": 0, "insert_many": 1,
+        "find_many": 0, "remove_many": 1, "find_hits": 1})
+
+        test_hash_table.stop_counting()
+        test_hash_table.find(3)
+        self.assertIsNone(test_hash_table.stats()["operation_counts"])
+        self.assertNotIn("find", vars(test_hash_table))
+
+    def test_keys_during_rehash(self):
+        """Does keys() list every key once while buckets are migrated?"""
+        test_hash_table = HashTable(incremental=True, rehash_step=1)
+        for key in range(20):
+            test_hash_table.insert(key)
+        self.assertIsNotNone(test_hash_table.old_hash_table)
+        # Every find migrates a bucket between two keys.
+        keys = [key for key in test_hash_table.keys()
+        if test_hash_table.find(key)]
+        self.assertEqual(sorted(keys), list(range(20)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Benchmarks the memory of node classes with and without __slots__, and the
+time saved by reusing removed nodes.
+
+Creates n nodes of each shape (the fields of the linked list, tree and graph
+nodes) as a plain class and as a class with __slots__, and reports the memory
+used per node. Then inserts and removes at the head of a SinglyLinkedList with
+and without a node pool, and reports the time per insert and remove.
+
+Usage: python benchmark_nodes.py [number of nodes]
+"""
+
+import sys
+import time
+import tracemalloc
+from singly_linked_list import SinglyLinkedList
+
+# The fields of each node class. The last field links the nodes into a chain.
+NODE_FIELDS = (
+    ("singly_linked_list.Node", ("data", "next")),
+    ("doubly_linked_list.Node", ("data", "prev", "next")),
+    ("binary_search_tree.Node", ("data", "left", "right", "parent")),
+    ("Vertex", ("data", "adj_vertices")),
+)
+
+def make_node_class(fields, slotted):
+    """
+    Creates a node class with the given fields, all set to None.
+    @param fields: The names of the fields.
+    @param slotted: True to declare the fields as __slots__.
+    @return: The class.
+    """
+    def __init__(self):
+        for field in fields:
+            setattr(self, field, None)
+    namespace = {"__init__": __init__}
+    if slotted:
+        namespace["__slots__"] = fields
+    return type("Node", (), namespace)
+
+def node_memory(node_class, link, num_nodes):
+    """
+    Creates a chain of num_nodes nodes and measures the memory it uses.
+    @param node_class: The class of the nodes.
+    @param link: The field pointing to the previous node of the chain.
+    @param num_nodes: The number of nodes.
+    @return: The number of bytes per node.
+    """
+    tracemalloc.start()
+    head = None
+    for _ in range(num_nodes):
+        node = node_class()
+        setattr(node, link, head)
+        head = node
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return memory / num_nodes
+
+def churn_time(pool_size, num_nodes):
+    """
+    Inserts and removes a node at the head of a list num_nodes times.
+    @param pool_size: The pool size of the list.
+    @param num_nodes: The number of inserts and removes.
+    @return: The number of microseconds per insert and remove.
+    """
+    linked_list = SinglyLinkedList(pool_size)
+    for item in range(100):
+        linked_list.insert(item, linked_list.size())
+    start = time.perf_counter()
+    for item in range(num_nodes):
+        linked_list.insert(-1, 0)
+        linked_list.remove(-1)
+    elapsed = time.perf_counter() - start
+    return elapsed / num_nodes * 1000000
+
+def main():
+    """Prints the memory per node of each class and the churn times."""
+    num_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print(f"{'node':>24} {'__dict__':>14} {'__slots__':>14}")
+    for name, fields in NODE_FIELDS:
+        plain = node_memory(make_node_class(fields, False), fields[-1],
+        num_nodes)
+        slotted = node_memory(make_node_class(fields, True), fields[-1],
+        num_nodes)
+        print(f"{name:>24} {plain:>7.1f} B/node {slotted:>7.1f} B/node")
+
+    print()
+    print(f"{'pool size':>24} {'time':>14}")
+    for pool_size in (0, 16):
+        elapsed = churn_time(pool_size, num_nodes)
+        print(f"{pool_size:>24} {elapsed:>10.3f} us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmarks search in the unrolled linked list against the singly and doubly
+linked lists.
+
+Appends n ints to each list, then searches for an item that is not in the
+list, so every item is compared. Reports the number of nodes and the time per
+item scanned.
+
+Usage: python benchmark_search.py [number of items]
+"""
+
+import sys
+import time
+from doubly_linked_list import DoublyLinkedList
+from singly_linked_list import SinglyLinkedList
+from unrolled_linked_list import UnrolledLinkedList
+
+def benchmark(linked_list, num_items):
+    """
+    Appends num_items ints to a list and times a search through all of them.
+    @param linked_list: The empty list.
+    @param num_items: The number of items to append.
+    @return: A tuple (number of nodes, nanoseconds per item).
+    """
+    for item in range(num_items):
+        linked_list.insert(item, num_items)
+    start = time.perf_counter()
+    linked_list.search(-1)
+    elapsed = time.perf_counter() - start
+    return linked_list.num_nodes, elapsed / num_items * 1000000000
+
+def main():
+    """Prints the node counts and search times of every list."""
+    num_items = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print(f"{'list':>12} {'nodes':>10} {'search':>14}")
+    for name, linked_list in (("singly", SinglyLinkedList()),
+    ("doubly", DoublyLinkedList()), ("unrolled 16", UnrolledLinkedList(16)),
+    ("unrolled 64", UnrolledLinkedList(64))):
+        num_nodes, elapsed = benchmark(linked_list, num_items)
+        print(f"{name:>12} {num_nodes:>10} {elapsed:>7.1f} ns/item")
+
+if __name__ == "__main__":
+    main()
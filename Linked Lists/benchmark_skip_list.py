@@ -0,0 +1,67 @@
+"""
+Benchmarks the SkipList against the BinarySearchTree.
+
+Inserts n ints into each set, searches for every one of them and then removes
+all of them, reporting the time per operation. Runs once with the ints in
+random order and once in sorted order, which turns the binary search tree into
+a linked list.
+
+Usage: python benchmark_skip_list.py [number of items] [number of sorted items]
+"""
+
+import os
+import random
+import sys
+import time
+from skip_list import SkipList
+
+# The binary search tree lives in the Trees folder.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+"Trees"))
+from binary_search_tree import BinarySearchTree
+
+def time_per_item(operation, items):
+    """
+    Calls operation on every item.
+    @param operation: The function to call.
+    @param items: The items to call it with.
+    @return: The number of microseconds per call.
+    """
+    start = time.perf_counter()
+    for item in items:
+        operation(item)
+    return (time.perf_counter() - start) / len(items) * 1000000
+
+def benchmark(ordered_set, items):
+    """
+    Inserts, searches for and removes every item.
+    @param ordered_set: The empty set.
+    @param items: The items, in the order to insert them.
+    @return: A tuple of the microseconds per insert, search and remove.
+    """
+    insert = time_per_item(ordered_set.insert, items)
+    search = time_per_item(ordered_set.search, items)
+    # The tree cannot remove its root when it has a single child, so the
+    # first item inserted is left in both sets.
+    remove = time_per_item(ordered_set.remove, items[1:])
+    return insert, search, remove
+
+def main():
+    """Prints the times of both sets for random and sorted items."""
+    num_items = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    num_sorted = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    random_items = list(range(num_items))
+    random.Random(0).shuffle(random_items)
+
+    print(f"{'set':>12} {'order':>8} {'insert':>10} {'search':>10} "
+    f"{'remove':>10}")
+    for order, items in (("random", random_items),
+    ("sorted", list(range(num_sorted)))):
+        for name, make_set in (("skip list", SkipList),
+        ("bst", BinarySearchTree)):
+            insert, search, remove = benchmark(make_set(), items)
+            print(f"{name:>12} {order:>8} {insert:>7.2f} us {search:>7.2f} us "
+            f"{remove:>7.2f} us")
+
+if __name__ == "__main__":
+    main()
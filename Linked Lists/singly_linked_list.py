@@ -13,7 +13,8 @@ Some List ADT Operations:
 """
 Time Complexity:
 1. search(x): O(N)
-2. insert(x): O(N)
+2. insert(x): O(N), O(1) at the end or front of the list, or right after the
+last inserted node
 3. remove(x): O(N)
 
 Space Complexity: O(N)
@@ -22,6 +23,9 @@ Space Complexity: O(N)
 class Node:
     """Implementation of a class to create nodes."""
 
+    # No per-node __dict__, see the notes below.
+    __slots__ = ("data", "next")
+
     def __init__(self, data=None, next=None):
         """Create a node."""
         self.data = data
@@ -30,10 +34,43 @@ class Node:
 class SinglyLinkedList:
     """Implementation of a singly linked list."""
 
-    def __init__(self):
-        """Create an empty singly linked list."""
+    def __init__(self, pool_size=0):
+        """
+        Create an empty singly linked list.
+        @param pool_size: The most removed nodes kept for reuse by later
+        inserts. 0 keeps none.
+        """
         self.head = None
+        self.tail = None
         self.num_nodes = 0
+        # The last node accessed by index and its index, so that inserting at
+        # increasing indices resumes from it instead of restarting at head.
+        self.cursor = None
+        self.cursor_index = 0
+        self.pool_size = pool_size
+        self.free_nodes = []
+
+    def new_node(self, query):
+        """
+        Gets a node holding query, from the pool if one is free.
+        @param query: The data the node holds.
+        @return: The node.
+        """
+        if (len(self.free_nodes) > 0):
+            node = self.free_nodes.pop()
+            node.data = query
+            return node
+        return Node(query)
+
+    def free_node(self, node):
+        """
+        Returns a node that was removed from the list to the pool.
+        @param node: The node.
+        """
+        if (len(self.free_nodes) < self.pool_size):
+            node.data = None
+            node.next = None
+            self.free_nodes.append(node)
 
     def search(self, query):
         """
@@ -52,31 +89,57 @@ class SinglyLinkedList:
         """
         Add a new node with the query as the data to the index within the list.
         @param query: The value insert a new node with.
-        @param index: The index to insert the newly created node.
+        @param index: The index to insert the newly created node. Indices past
+        the end append to the list and negative indices insert at the front.
         """
-        new_node = Node(query)
+        new_node = self.new_node(query)
         # Add to front.
-        if (index == 0 or self.num_nodes == 0):
+        if (index <= 0 or self.num_nodes == 0):
             new_node.next = self.head
             self.head = new_node
+            if (self.tail == None):
+                self.tail = new_node
+            # Every node after the new one moves one position back.
+            if (self.cursor != None):
+                self.cursor_index += 1
         # Add to end.
         elif (index >= self.num_nodes):
-            curr = self.head
-            while (curr.next != None):
-                curr = curr.next
-            curr.next = new_node
+            self.tail.next = new_node
+            self.tail = new_node
+            self.cursor = new_node
+            self.cursor_index = self.num_nodes
         # Add to somewhere in the middle.
         else:
-            curr = self.head
-            curr_index = 0
-            # Break when we access the node before where the new node will go.
-            while (curr_index < (index - 1)):
-                curr = curr.next
-                curr_index += 1
+            # Access the node before where the new node will go.
+            curr = self.node_at(index - 1)
             new_node.next = curr.next
             curr.next = new_node
+            self.cursor = new_node
+            self.cursor_index = index
             
         self.num_nodes += 1
+
+    def node_at(self, index):
+        """
+        Finds the node at an index, walking from the cursor when it is at or
+        before index and from head otherwise.
+        @param index: The index of the node, less than the number of nodes.
+        @return: The node at index.
+        """
+        if (index < 0 or index >= self.num_nodes):
+            raise Exception(f"Error: Index {index} is out of range.")
+        if (self.cursor != None and self.cursor_index <= index):
+            curr = self.cursor
+            curr_index = self.cursor_index
+        else:
+            curr = self.head
+            curr_index = 0
+        while (curr_index < index):
+            curr = curr.next
+            curr_index += 1
+        self.cursor = curr
+        self.cursor_index = index
+        return curr
     
     def remove(self, query):
         """
@@ -84,21 +147,47 @@ class SinglyLinkedList:
         @param query: Delete the node that contains the given quer as its data.
         """
         curr = self.head
+        if (curr == None):
+            return
 
         # Removing the first node.
         if (self.head.data == query):
             self.head = curr.next
+            if (self.head == None):
+                self.tail = None
             self.num_nodes -= 1
+            self.removed_at(0)
+            self.free_node(curr)
         # Removing any node after the first node.
         else:
+            curr_index = 0
             while (curr.next != None):
                 # If node exists in the list, this statement will be executed.
                 if (curr.next.data == query): 
-                    curr.next = curr.next.next
+                    removed = curr.next
+                    if (removed == self.tail):
+                        self.tail = curr
+                    curr.next = removed.next
                     self.num_nodes -= 1
+                    self.removed_at(curr_index + 1)
+                    self.free_node(removed)
                     break
                 curr = curr.next
+                curr_index += 1
         return
+
+    def removed_at(self, index):
+        """
+        Keeps the cursor in step after the node at index was removed.
+        @param index: The index the removed node was at.
+        """
+        if (self.cursor == None or index > self.cursor_index):
+            return
+        if (index == self.cursor_index):
+            self.cursor = None
+            self.cursor_index = 0
+        else:
+            self.cursor_index -= 1
     
     def size(self):
         """Returns the number of nodes within the list."""
@@ -133,4 +222,17 @@ Singly Linked List:
 - In a singly linked list, a node is a container that holds some data as well as
 information that connects a node to the next node in the list.
 - Constant time insertion/deletion at the beginning of a list.
+- The list also keeps a pointer to its tail, so appending (inserting at an index
+past the end) takes O(1) instead of walking the whole list. Building a list of
+n nodes by appending is then O(N) rather than O(N^2).
+- It also remembers the last node it reached by index (the cursor). Inserting
+at an index at or after the cursor walks from the cursor rather than from the
+head, so inserting at increasing indices (0, 1, 2, ... or every other node)
+takes O(1) per insert after the first.
+
+- Node defines __slots__, so a node stores its two fields in fixed slots
+instead of a per-node __dict__, and takes 48 bytes instead of 88 on Python 3.11
+and more on older versions (see benchmark_nodes.py).
+- With a pool_size, removed nodes are kept and reused by later inserts instead
+of being freed and allocated again.
 """
\ No newline at end of file
@@ -0,0 +1,288 @@
+"""
+An implementation of the ordered Set ADT using a Skip List.
+Set: collection of unique elements, here kept in sorted order.
+
+Some Set ADT Operations:
+1. search(x): Return true if x exists in the set, false otherwise.
+2. insert(x): Adds x to the set.
+3. remove(x): Removes x from the set.
+4. size(): Returns the size of the set.
+"""
+
+"""
+Ordered Operations:
+1. range(lo, hi): Iterates over the items x with lo <= x < hi, in order.
+2. rank(x): Returns the number of items less than x.
+3. kth(k): Returns the item at index k in sorted order.
+4. iter(skip_list), reversed(skip_list): The items in increasing or decreasing
+order.
+"""
+
+"""
+Expected Time Complexity:
+1. search(x): O(logN)
+2. insert(x): O(logN)
+3. remove(x): O(logN)
+4. range(lo, hi): O(logN + k) for k items in the range
+5. rank(x), kth(k): O(logN)
+
+Worst Case Time Complexity: O(N) for all of the above, with vanishing
+probability.
+
+Space Complexity: O(N) expected
+"""
+
+import random
+
+# The most levels a node can have, enough for 2^32 items.
+MAX_LEVEL = 32
+# The probability that a node on a level is also on the next level up.
+PROMOTE_PROBABILITY = 0.5
+
+class Node:
+    """Implementation of a class to create nodes with several levels."""
+
+    __slots__ = ("data", "prev", "next", "widths")
+
+    def __init__(self, data=None, level=1):
+        """
+        Create a node.
+        @param data: The data the node holds.
+        @param level: The number of levels the node is linked on.
+        """
+        self.data = data
+        # The previous node on the bottom level, None for the first node.
+        self.prev = None
+        # next[i] is the following node on level i, and widths[i] is the
+        # number of bottom level steps to it.
+        self.next = level * [None]
+        self.widths = level * [1]
+
+class SkipList:
+    """Implementation of a skip list."""
+
+    def __init__(self, seed=None):
+        """
+        Create an empty skip list.
+        @param seed: Seed for the random levels of the nodes, for a
+        reproducible structure. None seeds from the system.
+        """
+        # The head holds no data and is linked on every level.
+        self.head = Node(None, MAX_LEVEL)
+        self.tail = None
+        self.level = 1
+        self.num_items = 0
+        self.random = random.Random(seed)
+
+    def random_level(self):
+        """
+        Picks the number of levels of a new node. Each level is used by about
+        half the nodes of the level below it.
+        @return: The number of levels.
+        """
+        level = 1
+        while (level < MAX_LEVEL and
+        self.random.random() < PROMOTE_PROBABILITY):
+            level += 1
+        return level
+
+    def find_path(self, query):
+        """
+        Finds, on every level, the last node holding data less than query.
+        @param query: The value to search for.
+        @return: A tuple (nodes, positions). nodes[i] is the last node before
+        query on level i, and positions[i] its position: the head is at 0 and
+        the items at 1 to N.
+        """
+        nodes = self.level * [None]
+        positions = self.level * [0]
+        curr = self.head
+        position = 0
+        for i in range(self.level - 1, -1, -1):
+            next_node = curr.next[i]
+            while (next_node != None and next_node.data < query):
+                position += curr.widths[i]
+                curr = next_node
+                next_node = curr.next[i]
+            nodes[i] = curr
+            positions[i] = position
+        return nodes, positions
+
+    def search(self, query):
+        """
+        Search for query in the set.
+        @param query: The value to search for.
+        @return: True if found, False otherwise.
+        """
+        # The same walk as find_path, without recording the path.
+        curr = self.head
+        for i in range(self.level - 1, -1, -1):
+            next_node = curr.next[i]
+            while (next_node != None and next_node.data < query):
+                curr = next_node
+                next_node = curr.next[i]
+        return next_node != None and next_node.data == query
+
+    def insert(self, query):
+        """
+        Add query to the set, if it is not already in it.
+        @param query: The value to insert. Must be comparable with the other
+        items.
+        """
+        nodes, positions = self.find_path(query)
+        candidate = nodes[0].next[0]
+        if (candidate != None and candidate.data == query):
+            return
+
+        level = self.random_level()
+        # New levels start at the head, with a link past the last item.
+        for i in range(self.level, level):
+            self.head.next[i] = None
+            self.head.widths[i] = self.num_items + 1
+            nodes.append(self.head)
+            positions.append(0)
+        self.level = max(self.level, level)
+
+        new_node = Node(query, level)
+        new_position = positions[0] + 1
+        for i in range(self.level):
+            if (i < level):
+                # Split the link of nodes[i] around the new node.
+                new_node.next[i] = nodes[i].next[i]
+                new_node.widths[i] = positions[i] + nodes[i].widths[i] - \
+                new_position + 1
+                nodes[i].next[i] = new_node
+                nodes[i].widths[i] = new_position - positions[i]
+            else:
+                # The link passes over the new node.
+                nodes[i].widths[i] += 1
+
+        if (nodes[0] != self.head):
+            new_node.prev = nodes[0]
+        if (new_node.next[0] == None):
+            self.tail = new_node
+        else:
+            new_node.next[0].prev = new_node
+        self.num_items += 1
+
+    def remove(self, query):
+        """
+        Deletes query from the set, if it is in it.
+        @param query: The value to delete.
+        """
+        nodes, positions = self.find_path(query)
+        curr = nodes[0].next[0]
+        if (curr == None or curr.data != query):
+            return
+
+        for i in range(self.level):
+            if (nodes[i].next[i] == curr):
+                nodes[i].next[i] = curr.next[i]
+                nodes[i].widths[i] += curr.widths[i] - 1
+            else:
+                nodes[i].widths[i] -= 1
+
+        if (curr.next[0] == None):
+            self.tail = curr.prev
+        else:
+            curr.next[0].prev = curr.prev
+        # Drop the levels that no longer hold any node.
+        while (self.level > 1 and self.head.next[self.level - 1] == None):
+            self.level -= 1
+        self.num_items -= 1
+
+    def range(self, lo, hi):
+        """
+        Iterates over the items from lo (inclusive) to hi (exclusive).
+        @param lo: The smallest item to include.
+        @param hi: The item to stop before.
+        """
+        nodes, positions = self.find_path(lo)
+        curr = nodes[0].next[0]
+        while (curr != None and curr.data < hi):
+            yield curr.data
+            curr = curr.next[0]
+
+    def rank(self, query):
+        """
+        Counts the items less than query.
+        @param query: The value to rank.
+        @return: The number of items less than query, which is the index of
+        query if it is in the set.
+        """
+        nodes, positions = self.find_path(query)
+        return positions[0]
+
+    def kth(self, k):
+        """
+        Finds the item at an index in sorted order.
+        @param k: The index, 0 for the smallest item. Negative to count from
+        the largest.
+        @return: The item.
+        """
+        if (k < 0):
+            k += self.num_items
+        if (k < 0 or k >= self.num_items):
+            raise Exception(f"Error: Index {k} is out of range.")
+
+        curr = self.head
+        position = 0
+        for i in range(self.level - 1, -1, -1):
+            while (curr.next[i] != None and
+            position + curr.widths[i] <= k + 1):
+                position += curr.widths[i]
+                curr = curr.next[i]
+        return curr.data
+
+    def __iter__(self):
+        """Iterates over the items in increasing order."""
+        curr = self.head.next[0]
+        while (curr != None):
+            yield curr.data
+            curr = curr.next[0]
+
+    def __reversed__(self):
+        """Iterates over the items in decreasing order."""
+        curr = self.tail
+        while (curr != None):
+            yield curr.data
+            curr = curr.prev
+
+    def size(self):
+        """Returns the number of items within the set."""
+        return self.num_items
+
+"""
+Notes:
+
+Skip List:
+- A sorted linked list takes O(N) to search since it can only step one node at
+a time. A skip list adds express lanes: every node is on the bottom level, and
+each node on a level is also on the level above with probability 1/2. Level i
+then links about N / 2^i nodes.
+- Searching starts on the top level and moves right while the next node is
+still less than the query, then drops down a level. About two nodes are
+visited per level and there are about logN levels, so search, insert and
+remove take O(logN) expected.
+- Unlike a binary search tree, the shape does not depend on the order of the
+inserts, only on the random levels. Inserting sorted data, which makes a plain
+binary search tree a list, is as fast as inserting random data.
+- No rebalancing: inserting or removing a node only changes the links of the
+nodes right before it on each of its levels. This locality is why skip lists
+are used for concurrent ordered sets (Java's ConcurrentSkipListMap), since
+threads touching different parts of the list do not contend. This version is
+not thread safe.
+- The nodes follow the doubly linked list's design, with a list of forward
+links (one per level) and a backward link on the bottom level, so the items
+can be walked in either direction.
+- Each link also records its width, the number of bottom level nodes it skips.
+Adding up the widths along a search path gives the index of a node, so rank
+and kth (an indexable skip list) take O(logN) as well.
+- A node has 2 levels on average, so a skip list uses about 2N forward links
+and 2N widths.
+- See benchmark_skip_list.py for times against the binary search tree. On
+random items the tree is faster by a constant factor (a search visits about
+1.4logN tree nodes but 2logN skip list nodes, and each skip list step indexes a
+list of links). On sorted items the tree degenerates to a list and takes O(N)
+per operation, while the skip list does not change.
+"""
@@ -0,0 +1,97 @@
+from doubly_linked_list import DoublyLinkedList
+import unittest
+
+class TestDoublyLinkedList(unittest.TestCase):
+    """Tests for the DoublyLinkedList and Cursor classes."""
+
+    def assert_links(self, linked_list, items):
+        """Checks the data and both pointers of every node."""
+        self.assertEqual(list(linked_list), items)
+        self.assertEqual(linked_list.size(), len(items))
+        backwards = []
+        curr = linked_list.tail
+        while (curr != None):
+            backwards.append(curr.data)
+            curr = curr.prev
+        self.assertEqual(backwards, items[::-1])
+
+    def test_indexed_operations(self):
+        """Do get, insert and remove_at reach nodes from either end?"""
+        test_list = DoublyLinkedList()
+        for item in range(10):
+            test_list.insert(item, item)
+        self.assertEqual(test_list.get(2), 2)
+        self.assertEqual(test_list.get(8), 8)
+        self.assertEqual(test_list.get(-1), 9)
+        test_list.insert(7.5, 8)
+        self.assertEqual(test_list.remove_at(1), 1)
+        test_list.remove(5)
+        self.assert_links(test_list, [0, 2, 3, 4, 6, 7, 7.5, 8, 9])
+        with self.assertRaises(Exception):
+            test_list.get(9)
+
+        # Removing the only node empties the list.
+        test_list = DoublyLinkedList()
+        test_list.insert(1, 0)
+        test_list.remove(1)
+        self.assert_links(test_list, [])
+        self.assertIsNone(test_list.head)
+
+    def test_negative_index(self):
+        """Does a negative index insert at the front, as in the singly linked
+        list?"""
+        test_list = DoublyLinkedList()
+        for item in range(5):
+            test_list.insert(item, item)
+        test_list.insert(9, -1)
+        test_list.insert(8, -100)
+        self.assert_links(test_list, [8, 9, 0, 1, 2, 3, 4])
+
+    def test_cursor(self):
+        """Can a cursor filter and grow the list while iterating?"""
+        test_list = DoublyLinkedList()
+        for item in range(6):
+            test_list.insert(item, item)
+        cursor = test_list.cursor()
+        while (cursor.is_valid()):
+            if (cursor.get() % 2 == 0):
+                cursor.remove()
+            else:
+                cursor.insert_after(cursor.get() * 10)
+                cursor.move_next()
+                cursor.move_next()
+        self.assert_links(test_list, [1, 10, 3, 30, 5, 50])
+
+        cursor = test_list.cursor(-1)
+        cursor.insert_before(40)
+        cursor.move_prev()
+        self.assertEqual(cursor.get(), 40)
+        cursor.set(45)
+        self.assert_links(test_list, [1, 10, 3, 30, 5, 45, 50])
+
+    def test_pool(self):
+        """Are nodes removed by remove_at and a cursor reused by inserts?"""
+        test_list = DoublyLinkedList(pool_size=2)
+        for item in range(5):
+            test_list.insert(item, item)
+        first = test_list.node_at(1)
+        second = test_list.node_at(3)
+        self.assertEqual(test_list.remove_at(1), 1)
+        cursor = test_list.cursor(2)
+        self.assertEqual(cursor.remove(), 3)
+        self.assertEqual(cursor.get(), 4)
+        # The pool is full, this node is left to the garbage collector.
+        test_list.remove(0)
+        self.assertEqual(test_list.free_nodes, [first, second])
+        self.assertIsNone(second.data)
+
+        cursor.insert_before(5)
+        test_list.insert(6, 0)
+        self.assertIs(test_list.node_at(2), second)
+        self.assertIs(test_list.node_at(0), first)
+        self.assertEqual(test_list.free_nodes, [])
+        self.assert_links(test_list, [6, 2, 5, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
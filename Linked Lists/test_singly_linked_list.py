@@ -0,0 +1,83 @@
+from singly_linked_list import SinglyLinkedList
+import unittest
+
+def to_list(linked_list):
+    """Returns the data of every node, head first."""
+    items = []
+    curr = linked_list.head
+    while (curr != None):
+        items.append(curr.data)
+        curr = curr.next
+    return items
+
+class TestSinglyLinkedList(unittest.TestCase):
+    """Tests for the SinglyLinkedList class."""
+
+    def test_tail(self):
+        """Is the tail kept up to date by appends and removals?"""
+        test_list = SinglyLinkedList()
+        for item in range(5):
+            test_list.insert(item, test_list.size())
+        self.assertEqual(to_list(test_list), [0, 1, 2, 3, 4])
+        test_list.remove(4)
+        self.assertEqual(test_list.tail.data, 3)
+        test_list.insert(5, 100)
+        self.assertEqual(to_list(test_list), [0, 1, 2, 3, 5])
+        for item in (0, 1, 2, 3, 5):
+            test_list.remove(item)
+        self.assertIsNone(test_list.tail)
+        test_list.remove(0)
+        test_list.insert(6, 3)
+        self.assertIs(test_list.head, test_list.tail)
+
+    def test_cursor(self):
+        """Do inserts at increasing indices resume from the last node?"""
+        test_list = SinglyLinkedList()
+        for item in range(0, 10, 2):
+            test_list.insert(item, test_list.size())
+        for index in range(1, 10, 2):
+            test_list.insert(index, index)
+            self.assertEqual(test_list.cursor_index, index)
+            self.assertEqual(test_list.cursor.data, index)
+        self.assertEqual(to_list(test_list), list(range(10)))
+
+        # Changes before the cursor move it along with its node.
+        test_list.insert(-1, 0)
+        test_list.remove(0)
+        self.assertEqual(test_list.cursor.data, 9)
+        test_list.insert(8.5, 9)
+        self.assertEqual(to_list(test_list), [-1] + list(range(1, 9)) +
+        [8.5, 9])
+
+    def test_negative_index(self):
+        """Does a negative index insert at the front without moving the
+        cursor off its node?"""
+        test_list = SinglyLinkedList()
+        for item in range(5):
+            test_list.insert(item, test_list.size())
+        test_list.insert("x", -1)
+        self.assertEqual(test_list.cursor.data, 4)
+        self.assertEqual(test_list.cursor_index, 5)
+        test_list.insert("y", 3)
+        self.assertEqual(to_list(test_list), ["x", 0, 1, "y", 2, 3, 4])
+        with self.assertRaises(Exception):
+            test_list.node_at(-1)
+
+    def test_pool(self):
+        """Are removed nodes reused by later inserts, up to pool_size?"""
+        test_list = SinglyLinkedList(pool_size=2)
+        for item in range(4):
+            test_list.insert(item, test_list.size())
+        # The pool hands out the last node it was given first.
+        removed = test_list.head
+        for item in (3, 0, 1):
+            test_list.remove(item)
+        self.assertEqual(len(test_list.free_nodes), 2)
+        self.assertIsNone(removed.data)
+        test_list.insert(4, 0)
+        self.assertIs(test_list.head, removed)
+        self.assertEqual(to_list(test_list), [4, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+from skip_list import SkipList
+import bisect
+import random
+import unittest
+
+class TestSkipList(unittest.TestCase):
+    """Tests for the SkipList class."""
+
+    def assert_items(self, skip_list, items):
+        """Checks the items in both directions and every rank and kth."""
+        self.assertEqual(list(skip_list), items)
+        self.assertEqual(list(reversed(skip_list)), items[::-1])
+        self.assertEqual(skip_list.size(), len(items))
+        for index, item in enumerate(items):
+            self.assertEqual(skip_list.kth(index), item)
+            self.assertEqual(skip_list.rank(item), index)
+            self.assertTrue(skip_list.search(item))
+
+    def test_insert_remove(self):
+        """Do random inserts and removes keep the items sorted and indexed?"""
+        randomizer = random.Random(7)
+        test_list = SkipList(seed=3)
+        items = []
+        for _ in range(300):
+            item = randomizer.randrange(500)
+            test_list.insert(item)
+            if item not in items:
+                bisect.insort(items, item)
+        self.assert_items(test_list, items)
+        for _ in range(300):
+            item = randomizer.randrange(500)
+            test_list.remove(item)
+            if item in items:
+                items.remove(item)
+            self.assertFalse(test_list.search(item))
+        self.assert_items(test_list, items)
+        for item in list(items):
+            test_list.remove(item)
+        self.assert_items(test_list, [])
+        self.assertEqual(test_list.level, 1)
+        self.assertIsNone(test_list.tail)
+
+    def test_ranges(self):
+        """Do range, rank and kth handle bounds between and beyond items?"""
+        test_list = SkipList(seed=1)
+        for item in range(0, 100, 5):
+            test_list.insert(item)
+        self.assertEqual(list(test_list.range(12, 31)), [15, 20, 25, 30])
+        self.assertEqual(list(test_list.range(-10, 6)), [0, 5])
+        self.assertEqual(list(test_list.range(96, 200)), [])
+        self.assertEqual(test_list.rank(12), 3)
+        self.assertEqual(test_list.rank(1000), 20)
+        self.assertEqual(test_list.kth(-1), 95)
+        with self.assertRaises(Exception):
+            test_list.kth(20)
+
+
+if __name__ == '__main__':
+    unittest.main()
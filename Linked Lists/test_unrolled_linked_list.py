@@ -0,0 +1,73 @@
+from unrolled_linked_list import UnrolledLinkedList
+import random
+import unittest
+
+class TestUnrolledLinkedList(unittest.TestCase):
+    """Tests for the UnrolledLinkedList class."""
+
+    def assert_nodes(self, linked_list, items):
+        """Checks the items, the counts and the fill of every node."""
+        self.assertEqual(list(linked_list), items)
+        self.assertEqual(linked_list.size(), len(items))
+        num_nodes = 0
+        curr = linked_list.head
+        while (curr != None):
+            self.assertLessEqual(len(curr.items), linked_list.node_capacity)
+            if (curr.next != None):
+                self.assertGreaterEqual(len(curr.items),
+                linked_list.node_capacity // 2)
+            else:
+                self.assertIs(linked_list.tail, curr)
+                self.assertGreater(len(curr.items), 0)
+            num_nodes += 1
+            curr = curr.next
+        self.assertEqual(linked_list.num_nodes, num_nodes)
+
+    def test_split_and_merge(self):
+        """Do inserts and removes at random indices keep the nodes filled?"""
+        randomizer = random.Random(5)
+        test_list = UnrolledLinkedList(node_capacity=4)
+        items = []
+        for item in range(200):
+            index = randomizer.randrange(len(items) + 2)
+            test_list.insert(item, index)
+            items.insert(index, item)
+        self.assert_nodes(test_list, items)
+        for _ in range(100):
+            index = randomizer.randrange(len(items))
+            self.assertEqual(test_list.get(index), items[index])
+            self.assertEqual(test_list.remove_at(index), items.pop(index))
+        self.assert_nodes(test_list, items)
+        for item in list(items):
+            test_list.remove(item)
+            items.remove(item)
+            self.assert_nodes(test_list, items)
+        self.assertIsNone(test_list.head)
+        self.assertIsNone(test_list.tail)
+
+    def test_negative_index(self):
+        """Does a negative index insert at the front?"""
+        test_list = UnrolledLinkedList(node_capacity=4)
+        for item in range(6):
+            test_list.insert(item, test_list.size())
+        test_list.insert("x", -1)
+        test_list.insert("y", -100)
+        self.assert_nodes(test_list, ["y", "x", 0, 1, 2, 3, 4, 5])
+
+    def test_search(self):
+        """Does search find every item and nothing else?"""
+        test_list = UnrolledLinkedList(node_capacity=8)
+        for item in range(0, 100, 2):
+            test_list.insert(item, test_list.size())
+        self.assertEqual(test_list.num_nodes, 7)
+        self.assertTrue(test_list.search(0))
+        self.assertTrue(test_list.search(98))
+        self.assertFalse(test_list.search(51))
+        test_list.remove(98)
+        self.assertFalse(test_list.search(98))
+        test_list.remove(51)
+        self.assertEqual(test_list.size(), 49)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,254 @@
+"""
+An implementation of the List ADT using an Unrolled Linked List.
+List: ordered collection of elements that allows duplicates.
+    - i.e.: (2, 4, 6, 8) != (2, 6, 4, 8)
+
+Some List ADT Operations:
+1. search(x): Return true if x exists in the set, false otherwise.
+2. insert(x): Adds x to the set.
+3. remove(x): Removes x from the set.
+4. size(): Returns the size of the set.
+"""
+
+"""
+Indexed Operations:
+1. get(i): Returns the item at index i.
+2. insert(x, i): Adds x at index i.
+3. remove_at(i): Removes the item at index i and returns it.
+"""
+
+"""
+Time Complexity (B is the node capacity):
+1. search(x): O(N), with N / B pointer hops
+2. insert(x, i): O(i / B + B), O(1) amortized at the end of the list
+3. remove(x): O(N)
+4. get(i), remove_at(i): O(i / B + B)
+
+Space Complexity: O(N)
+"""
+
+class Node:
+    """Implementation of a class to create nodes holding several items."""
+
+    __slots__ = ("items", "next")
+
+    def __init__(self, items=None, next=None):
+        """Create a node."""
+        self.items = [] if items == None else items
+        self.next = next
+
+class UnrolledLinkedList:
+    """Implementation of an unrolled linked list."""
+
+    def __init__(self, node_capacity=64):
+        """
+        Create an empty unrolled linked list.
+        @param node_capacity: The most items a node holds, at least 2.
+        """
+        if (node_capacity < 2):
+            raise Exception("Error: node_capacity must be at least 2.")
+        self.node_capacity = node_capacity
+        self.head = None
+        self.tail = None
+        self.num_items = 0
+        self.num_nodes = 0
+
+    def search(self, query):
+        """
+        Search for an item equal to query.
+        @param query: The value to search for.
+        @return: True if found, False otherwise.
+        """
+        curr = self.head
+        while (curr != None):
+            # Scans the whole node without leaving C.
+            if (query in curr.items):
+                return True
+            curr = curr.next
+        return False
+
+    def locate(self, index):
+        """
+        Finds the node holding the item at an index.
+        @param index: The index of the item, less than the number of items.
+        @return: A tuple (previous node, node, index within the node). The
+        previous node is None for the head.
+        """
+        prev = None
+        curr = self.head
+        while (index >= len(curr.items)):
+            index -= len(curr.items)
+            prev = curr
+            curr = curr.next
+        return prev, curr, index
+
+    def insert(self, query, index):
+        """
+        Add query to the index within the list.
+        @param query: The value to insert.
+        @param index: The index to insert the value at. Indices past the end
+        append to the list and negative indices insert at the front.
+        """
+        if (index < 0):
+            index = 0
+        # Add to end. A full tail starts a new node rather than splitting, so
+        # appending leaves every node full.
+        if (index >= self.num_items):
+            if (self.tail == None or
+            len(self.tail.items) == self.node_capacity):
+                self.link_after(self.tail, Node())
+            self.tail.items.append(query)
+        # Add to somewhere before the end.
+        else:
+            prev, curr, index = self.locate(index)
+            if (len(curr.items) == self.node_capacity):
+                self.split(curr)
+                if (index > len(curr.items)):
+                    index -= len(curr.items)
+                    curr = curr.next
+            curr.items.insert(index, query)
+        self.num_items += 1
+
+    def split(self, curr):
+        """
+        Moves the second half of a node's items to a new node after it.
+        @param curr: The node to split.
+        """
+        half = len(curr.items) // 2
+        self.link_after(curr, Node(curr.items[half:]))
+        del curr.items[half:]
+
+    def link_after(self, curr, new_node):
+        """
+        Links a new node into the list right after a node.
+        @param curr: The node to insert after, None for the front of the list.
+        @param new_node: The node to insert.
+        """
+        if (curr == None):
+            new_node.next = self.head
+            self.head = new_node
+        else:
+            new_node.next = curr.next
+            curr.next = new_node
+        if (new_node.next == None):
+            self.tail = new_node
+        self.num_nodes += 1
+
+    def remove(self, query):
+        """
+        Deletes the first item equal to query.
+        @param query: The value to delete.
+        """
+        prev = None
+        curr = self.head
+        while (curr != None):
+            if (query in curr.items):
+                curr.items.remove(query)
+                self.removed_from(prev, curr)
+                return
+            prev = curr
+            curr = curr.next
+
+    def remove_at(self, index):
+        """
+        Deletes the item at an index.
+        @param index: The index of the item.
+        @return: The removed item.
+        """
+        if (index < 0 or index >= self.num_items):
+            raise Exception(f"Error: Index {index} is out of range.")
+        prev, curr, index = self.locate(index)
+        query = curr.items.pop(index)
+        self.removed_from(prev, curr)
+        return query
+
+    def removed_from(self, prev, curr):
+        """
+        Keeps the nodes at least half full after an item was removed from a
+        node, by taking items from the next node or merging with it.
+        @param prev: The node before curr, None if curr is the head.
+        @param curr: The node an item was removed from.
+        """
+        self.num_items -= 1
+        half = self.node_capacity // 2
+        if (len(curr.items) >= half):
+            return
+        next_node = curr.next
+        if (next_node == None):
+            if (len(curr.items) == 0):
+                self.unlink(prev, curr)
+        elif (len(curr.items) + len(next_node.items) <= self.node_capacity):
+            curr.items.extend(next_node.items)
+            self.unlink(curr, next_node)
+        else:
+            # The next node has more than half, it can spare some items.
+            moved = half - len(curr.items)
+            curr.items.extend(next_node.items[:moved])
+            del next_node.items[:moved]
+
+    def unlink(self, prev, curr):
+        """
+        Removes a node from the list.
+        @param prev: The node before curr, None if curr is the head.
+        @param curr: The node to remove.
+        """
+        if (prev == None):
+            self.head = curr.next
+        else:
+            prev.next = curr.next
+        if (self.tail == curr):
+            self.tail = prev
+        curr.next = None
+        self.num_nodes -= 1
+
+    def get(self, index):
+        """
+        Gets the item at an index.
+        @param index: The index of the item.
+        @return: The item.
+        """
+        if (index < 0 or index >= self.num_items):
+            raise Exception(f"Error: Index {index} is out of range.")
+        prev, curr, index = self.locate(index)
+        return curr.items[index]
+
+    def __iter__(self):
+        """Iterates over the items, head first."""
+        curr = self.head
+        while (curr != None):
+            yield from curr.items
+            curr = curr.next
+
+    def size(self):
+        """Returns the number of items within the list."""
+        return self.num_items
+
+    def print_list(self):
+        """Print the linked list."""
+        if (self.num_items == 0):
+            print("List is empty.")
+        else:
+            for index, item in enumerate(self):
+                print(f"{index}: Data: {item}")
+
+"""
+Notes:
+
+Unrolled Linked List:
+- Each node holds up to node_capacity items in an array instead of a single
+item. A list of N items has about N / node_capacity nodes, so walking it
+follows that many pointers instead of N, and the items of a node are read from
+one contiguous array (a Python list here).
+- Scanning a node is a single `in` test, which CPython runs in C, so search()
+spends its time comparing items rather than stepping through nodes.
+- Inserting into a full node splits it into two half full nodes. Removing from
+a node that falls below half full takes items from the next node, or merges
+the two when they fit in one node. Every node but the last is then at least
+half full, so the list never has more than about 2N / node_capacity nodes.
+- Inserting or removing in the middle of a node shifts up to node_capacity
+items, which is fast for small capacities since it is one memmove.
+- Appending fills the tail node before starting a new one, so a list built by
+appending has full nodes.
+- See benchmark_search.py for search times against the singly and doubly
+linked lists.
+"""
@@ -25,6 +25,9 @@ Space Complexity: O(N)
 class Node:
     """Implementation of a class to create nodes."""
 
+    # Fixed attributes instead of a per-node __dict__, see the notes below.
+    __slots__ = ("data", "parent", "left", "right")
+
     def __init__(self, data=None, parent=None, left=None, right=None):
         """Create a node."""
         self.data = data
@@ -36,10 +39,37 @@ class Node:
 class BinarySearchTree:
     """Implementation of a binary search tree."""
 
-    def __init__(self):
-        """Create an empty binary search tree."""
+    def __init__(self, pool_size=0):
+        """
+        Create an empty binary search tree.
+        @param pool_size: The most removed nodes kept for reuse by later
+        inserts. 0 keeps none.
+        """
         self.root = None
         self.num_nodes = 0
+        self.pool_size = pool_size
+        self.free_nodes = []
+
+    def new_node(self, query):
+        """
+        Gets a node holding query, from the pool if one is free.
+        @param query: The data the node holds.
+        @return: The node.
+        """
+        if len(self.free_nodes) > 0:
+            node = self.free_nodes.pop()
+            node.data = query
+            return node
+        return Node(query)
+
+    def free_node(self, node):
+        """
+        Returns a node that was removed from the tree to the pool.
+        @param node: The node.
+        """
+        if len(self.free_nodes) < self.pool_size:
+            node.data = node.parent = node.left = node.right = None
+            self.free_nodes.append(node)
     
     def search(self, query):
         """
@@ -66,25 +96,24 @@ class BinarySearchTree:
         Add a new node with the query as the data to the binary search tree.
         @param query: The value insert a new node with.
         """
-        new_node = Node(query)
         curr = self.root
         if self.size() == 0:
-            self.root = new_node
+            self.root = self.new_node(query)
             self.num_nodes += 1
         else:
             # Condition met if the query is already in the tree.
             while query != curr.data:
                 if query < curr.data:
                     if curr.left == None:
-                        curr.left = new_node
-                        new_node.parent = curr
+                        curr.left = self.new_node(query)
+                        curr.left.parent = curr
                         self.num_nodes += 1
                     else:
                         curr = curr.left
                 elif query > curr.data:
                     if curr.right == None:
-                        curr.right = new_node
-                        new_node.parent = curr
+                        curr.right = self.new_node(query)
+                        curr.right.parent = curr
                         self.num_nodes += 1
                     else:
                         curr = curr.right
@@ -115,6 +144,7 @@ class BinarySearchTree:
                 curr.parent.right = None
             elif curr.parent.data > curr.data:
                 curr.parent.left = None
+            self.free_node(curr)
         # Case 2: Node has one child. 
         elif curr.left == None or curr.right == None: 
             if curr.left != None:
@@ -128,6 +158,7 @@ class BinarySearchTree:
             elif curr.parent.data > curr.data:
                 curr.parent.left = child_node    
             child_node.parent = curr.parent
+            self.free_node(curr)
         # Case 3: Node has 2 children. 
         # Replace curr with successor. 
         # Remove original successor.
@@ -139,7 +170,10 @@ class BinarySearchTree:
                 successor.parent.left = successor.right
             else:
                 successor.parent.right = successor.right
+            if successor.right != None:
+                successor.right.parent = successor.parent
             curr.data = successor.data
+            self.free_node(successor)
         
         self.num_nodes -= 1
     
@@ -348,4 +382,13 @@ Tree Traversals:
 - In-order: LVR
 - Post-order: LRV
 - Level-order: Top to bottom, level by level, left to right
+
+Node Memory:
+- Node declares __slots__, so each node keeps its four fields in fixed slots
+rather than in its own __dict__. A node then takes 64 bytes instead of 104 on
+Python 3.11, which matters once a tree holds millions of nodes (see
+Linked Lists/benchmark_nodes.py).
+- With a pool_size, the tree keeps the nodes that remove() detaches and reuses
+them for later inserts. A node returned by search() must not be kept across a
+remove(), since it may be reused for another value.
 """
\ No newline at end of file
